@@ -6,6 +6,7 @@ import sqlite3
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from uuid import uuid4
 
 
@@ -292,11 +293,17 @@ class Config:
     WORKER_MESSAGE_PUT_TIMEOUT = 1.0
     PREVIEW_DRAIN_MAX_ITEMS = 2000
     STATS_UPDATE_INTERVAL = 1000       # 통계 업데이트 간격 (ms)
-    SUBTITLE_CHECK_INTERVAL = 0.2      # 자막 확인 간격 (초)
+    SUBTITLE_CHECK_INTERVAL = 0.2      # 자막 확인 간격 (초, 적응형 간격의 초기값)
+    SUBTITLE_CHECK_INTERVAL_MIN = 0.08 # 발화가 잦을 때 적응형 확인 간격 하한 (초)
+    SUBTITLE_CHECK_INTERVAL_MAX = 0.5  # 무음 구간 적응형 확인 간격 상한 (초)
+    OBSERVER_IDLE_PROBE_INTERVAL = 1.0 # Observer 변화가 없을 때 구조화 probe 최소 간격 (초)
+    PREVIEW_EMIT_MIN_INTERVAL = 0.1    # 워커 preview 전송 최소 간격 (초, 초과분은 최신값만 보류)
     THREAD_STOP_TIMEOUT = 3            # 스레드 종료 대기 시간 (초)
     PAGE_LOAD_WAIT = 3                 # 페이지 로딩 대기 시간 (초)
     WEBDRIVER_WAIT_TIMEOUT = 20        # WebDriver 대기 타임아웃 (초)
     SCRIPT_DELAY = 0.5                 # 스크립트 실행 후 대기 (초)
+    PAGE_READY_POLL_INTERVAL = 0.1     # 페이지/자막 레이어 준비 상태 확인 간격 (초)
+    SUBTITLE_LAYER_READY_TIMEOUT = 2.0 # 자막 활성화 후 레이어 준비 대기 상한 (초)
     WEBDRIVER_SCRIPT_TIMEOUT = 20      # execute_script 타임아웃 (초)
     WEBDRIVER_IMPLICIT_WAIT = 0        # implicit wait 비활성화 (명시적 wait 사용)
     
@@ -317,11 +324,16 @@ class Config:
     RUNTIME_SEGMENT_FLUSH_THRESHOLD = 2000
     RUNTIME_ACTIVE_TAIL_ENTRIES = 1000
     RUNTIME_SEARCH_MATCH_LIMIT = 5000
+    RUNTIME_SEGMENT_SEARCH_CACHE_LIMIT = 32  # 검색용 텍스트를 보관할 runtime segment 최대 개수
+    SEARCH_TEXT_CACHE_LIMIT = 20000    # 검색용 소문자 정규화 텍스트 캐시 최대 항목 수
     EXIT_ESCALATION_AFTER_SECONDS = 30.0
     EXIT_ESCALATION_REPEAT_SECONDS = 30.0
 
     # 성능 최적화 상수 (#4, #1)
     MAX_RENDER_ENTRIES = 500           # 한 번에 렌더링할 최대 자막 수
+    UI_RENDER_MIN_INTERVAL_MS = 120    # 연속 자막 렌더링 최소 간격 (ms, 초과 요청은 한 번으로 병합)
+    REALTIME_FLUSH_MIN_INTERVAL = 0.25 # 실시간 저장 flush 최소 간격 (초, 사이 tick의 줄은 버퍼에 모은다)
+    SETTINGS_SAVE_DEBOUNCE_MS = 200    # 연속 옵션 변경 시 QSettings 저장을 한 번으로 병합하는 대기 시간 (ms)
     MAX_WORD_DIFF_OVERLAP = 200        # get_word_diff 최대 겹침 탐색 길이
     DB_HISTORY_PAGE_SIZE = 50
     DB_SEARCH_PAGE_SIZE = 100
@@ -352,7 +364,7 @@ class Config:
     # 상임위원회 기본 프리셋 (v16.0 기준 동작하는 xcode 값)
     # xcode: 위원회(채널) 구분 고정 값
     # xcgcd: 해당 회의의 고유 방송 ID (매 회의마다 변경)
-    DEFAULT_COMMITTEE_PRESETS = {
+    DEFAULT_COMMITTEE_PRESETS = MappingProxyType({
         "본회의": "https://assembly.webcast.go.kr/main/player.asp?xcode=10",
         "국회운영위원회": "https://assembly.webcast.go.kr/main/player.asp?xcode=24",
         "법제사법위원회": "https://assembly.webcast.go.kr/main/player.asp?xcode=25",
@@ -374,10 +386,10 @@ class Config:
         "특별위원회": "https://assembly.webcast.go.kr/main/player.asp?xcode=91",
         "청문회/공청회": "https://assembly.webcast.go.kr/main/player.asp?xcode=99",
         "기자회견": "https://assembly.webcast.go.kr/main/pressplayer.asp",
-    }
+    })
     
     # 상임위원회 xcode 값 매핑 (v16.0 기준 동작하는 값)
-    COMMITTEE_XCODE_MAP = {
+    COMMITTEE_XCODE_MAP = MappingProxyType({
         "본회의": 10,
         "국회운영위원회": 24,
         "법제사법위원회": 25,
@@ -398,7 +410,7 @@ class Config:
         "예산결산특별위원회": 21,
         "특별위원회": 91,
         "청문회/공청회": 99,
-    }
+    })
     
     # 특별위원회 문자열 xcode 목록 (숫자가 아닌 코드들)
     # 현재 기본값에는 검증된 문자열 xcode가 없다. 사용자가 직접 저장한
@@ -409,7 +421,7 @@ class Config:
     # 사용자가 직접 확인한 URL은 사용자 프리셋/직접 입력으로 사용할 수 있다.
     
     # 상임위원회 약칭 매핑 (사이트 내 표기 포함)
-    COMMITTEE_ABBREVIATIONS = {
+    COMMITTEE_ABBREVIATIONS = MappingProxyType({
         # 기본 약칭
         "운영위": "국회운영위원회",
         "법사위": "법제사법위원회",
@@ -435,7 +447,7 @@ class Config:
         "특별위": "특별위원회",
         "청문회": "청문회/공청회",
         "공청회": "청문회/공청회",
-    }
+    })
     
     # 폰트 설정
     DEFAULT_FONT_SIZE = 14
@@ -475,6 +487,23 @@ class Config:
         "--no-default-browser-check",
     )
 
+    # CDP Network.setBlockedURLs 차단 목록: 자막 DOM과 무관한 리소스로 인한 렌더러 메모리/트래픽 절감
+    # 광고/분석 스크립트는 항상, 이미지/폰트는 화면을 보지 않는 헤드리스 모드에서만 차단
+    CHROME_BLOCKED_URL_PATTERNS = (
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+    )
+    CHROME_HEADLESS_BLOCKED_URL_PATTERNS = (
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.webp",
+        "*.woff",
+        "*.woff2",
+    )
+
     # 중지 시 브라우저 창 유지 기본값 (QSettings keep_browser_on_stop으로 덮어씀)
     KEEP_BROWSER_ON_STOP = False
 
@@ -512,7 +541,9 @@ class Config:
     # 성능 최적화: 사전 컴파일된 정규식 패턴
     RE_YEAR = re.compile(r'\b\d{4}년\b')              # 년도 제거용
     RE_ZERO_WIDTH = re.compile(r'[\u200b\u200c\u200d\ufeff]')  # Zero-width 문자
+    ZERO_WIDTH_TRANSLATION = str.maketrans('', '', '\u200b\u200c\u200d\ufeff')  # str.translate용 Zero-width 제거 테이블
     RE_MULTI_SPACE = re.compile(r'\s+')              # 연속 공백 정규화
+    RE_MEANINGFUL_CHAR = re.compile(r'[가-힣A-Za-z]')  # 유의미 자막 판별용 한글/영문
 
 
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 import json
 import logging
 import re
@@ -23,9 +24,13 @@ class DatabaseCoreMixin(DatabaseMixinHost):
     DEFAULT_DB_PATH = "subtitle_history.db"
     MAX_QUERY_LIMIT = 500
     INSERT_BATCH_SIZE = 500
+    DELETE_LOG_ID_PREVIEW = 5  # 삭제 로그에 남길 세션 ID 수
     ALLOWED_CHECKPOINT_MODES = frozenset({"PASSIVE", "FULL", "RESTART", "TRUNCATE"})
-    STALE_CONNECTION_CLEANUP_INTERVAL = 2.0
-    STALE_CONNECTION_CLEANUP_EVERY = 32
+    CONNECTION_POOL_MAX = 8  # 반납 후 재사용을 위해 보관할 유휴 연결 수 상한
+    CONNECTION_CACHE_SIZE_KIB = 65536  # 연결당 페이지 캐시 상한 (64MB, 필요할 때만 채워짐)
+    CONNECTION_MMAP_SIZE_BYTES = 256 * 1024 * 1024  # 읽기 경로 memory-mapped I/O 상한
+    OPTIMIZE_INTERVAL_SECONDS = 3600.0
+    OPTIMIZE_ANALYSIS_LIMIT = 400  # PRAGMA optimize가 테이블당 살펴볼 행 수 상한
 
     def __init__(self, db_path: str | None = None):
         """데이터베이스 매니저 초기화
@@ -39,10 +44,17 @@ class DatabaseCoreMixin(DatabaseMixinHost):
         db_parent = Path(self.db_path).resolve().parent
         db_parent.mkdir(parents=True, exist_ok=True)
 
+        # lock은 연결 풀 보호용, write_lock은 쓰기 트랜잭션 직렬화용이다.
+        # 읽기 메서드는 작업마다 풀에서 빌린 연결과 WAL 스냅샷에 기대어 잠금 없이
+        # 실행되므로 UI 스레드의 조회가 캡처 스레드의 세션 저장을 기다리지 않는다.
         self.lock = threading.RLock()
-        self._thread_connections: dict[int, sqlite3.Connection] = {}
-        self._stale_cleanup_calls = 0
-        self._last_stale_cleanup_at = 0.0
+        self.write_lock = threading.RLock()
+        # 유휴 연결 스택 (LIFO). 스레드 수와 무관하게 CONNECTION_POOL_MAX개까지만 보관한다.
+        self._pool: list[sqlite3.Connection] = []
+        self._pool_max = self.CONNECTION_POOL_MAX
+        # close_all 이후 반납되는 연결(잠금 없이 진행 중이던 읽기 등)은 풀에 되돌리지 않고 닫는다.
+        self._closed = False
+        self._last_optimize_at: float | None = None
         self.db_available = False
         self.fts_available = False
         self.degraded_reason = ""
@@ -50,13 +62,14 @@ class DatabaseCoreMixin(DatabaseMixinHost):
 
     def close_all(self) -> None:
         """모든 데이터베이스 연결 종료"""
-        with self.lock:
-            for thread_id, conn in self._thread_connections.items():
+        with self.write_lock, self.lock:
+            self._closed = True
+            for conn in self._pool:
                 try:
                     conn.close()
                 except Exception as e:
-                    logger.error(f"DB 연결 종료 오류 (Thread {thread_id}): {e}")
-            self._thread_connections.clear()
+                    logger.error(f"DB 연결 종료 오류: {e}")
+            self._pool.clear()
             logger.info("모든 DB 연결이 종료되었습니다.")
 
     def checkpoint(self, mode: str = "PASSIVE") -> bool:
@@ -64,18 +77,46 @@ class DatabaseCoreMixin(DatabaseMixinHost):
         checkpoint_mode = str(mode or "PASSIVE").strip().upper() or "PASSIVE"
         if checkpoint_mode not in self.ALLOWED_CHECKPOINT_MODES:
             raise ValueError(f"지원하지 않는 WAL checkpoint mode: {checkpoint_mode}")
-        with self.lock:
-            conn = self._get_connection()
-            try:
-                conn.execute(f"PRAGMA wal_checkpoint({checkpoint_mode})")
-                return True
-            except Exception as e:
-                logger.debug("DB checkpoint 오류 (%s): %s", checkpoint_mode, e)
-                return False
+        with self.write_lock:
+            with self._conn() as conn:
+                try:
+                    conn.execute(f"PRAGMA wal_checkpoint({checkpoint_mode})")
+                    return True
+                except Exception as e:
+                    logger.debug("DB checkpoint 오류 (%s): %s", checkpoint_mode, e)
+                    return False
+
+    def maybe_optimize(self) -> bool:
+        """마지막 실행 후 OPTIMIZE_INTERVAL_SECONDS가 지났으면 PRAGMA optimize를 수행한다.
+
+        초기화 경로를 막지 않도록 쓰기 작업 뒤 DB worker에서 호출하며,
+        analysis_limit으로 테이블당 통계 수집 비용을 제한한다.
+        """
+        now = time.monotonic()
+        last_run = self._last_optimize_at
+        if last_run is not None and now - last_run < self.OPTIMIZE_INTERVAL_SECONDS:
+            return False
+        with self.write_lock:
+            with self._conn() as conn:
+                try:
+                    conn.execute(f"PRAGMA analysis_limit = {int(self.OPTIMIZE_ANALYSIS_LIMIT)}")
+                    # 0x10002: 이 연결이 쓰지 않은 테이블까지 포함해 필요한 ANALYZE만 수행
+                    conn.execute("PRAGMA optimize(0x10002)")
+                    return True
+                except Exception as e:
+                    logger.debug("PRAGMA optimize 실행 오류: %s", e)
+                    return False
+                finally:
+                    self._last_optimize_at = now
 
     @classmethod
     def _sanitize_limit(cls, limit: Any, default: int) -> int:
         """LIMIT 값을 안전한 범위로 정규화"""
+        # UI/worker 호출은 대부분 이미 int이므로 int() 변환과 예외 처리 경로를 건너뛴다.
+        if type(limit) is int:
+            if limit <= 0:
+                return default
+            return cls.MAX_QUERY_LIMIT if limit > cls.MAX_QUERY_LIMIT else limit
         try:
             value = int(limit)
         except (TypeError, ValueError):
@@ -87,6 +128,8 @@ class DatabaseCoreMixin(DatabaseMixinHost):
     @staticmethod
     def _sanitize_offset(offset: Any) -> int:
         """OFFSET 값을 0 이상 정수로 정규화"""
+        if type(offset) is int:
+            return offset if offset > 0 else 0
         try:
             value = int(offset)
         except (TypeError, ValueError):
@@ -96,12 +139,23 @@ class DatabaseCoreMixin(DatabaseMixinHost):
     @staticmethod
     def _sanitize_positive_id(value: Any) -> Optional[int]:
         """양수 ID만 허용하고, 그 외는 None 반환"""
+        if type(value) is int:
+            return value if value > 0 else None
         try:
             parsed = int(value)
         except (TypeError, ValueError):
             return None
         return parsed if parsed > 0 else None
 
+    @staticmethod
+    def _fetch_dict_rows(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """row_factory=None 커서의 결과를 컬럼명 dict 목록으로 만든다.
+
+        sqlite3.Row를 거쳐 dict(row)로 다시 변환하지 않고 튜플과 컬럼명을 바로 묶는다.
+        """
+        columns = [column[0] for column in cursor.description or ()]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
     @staticmethod
     def _sanitize_query(query: Any) -> str:
         """검색어 문자열 정규화"""
@@ -112,6 +166,8 @@ class DatabaseCoreMixin(DatabaseMixinHost):
     @staticmethod
     def _sanitize_duration(value: Any) -> int:
         """duration_seconds 정규화"""
+        if type(value) is int:
+            return value if value > 0 else 0
         try:
             duration = int(value)
         except (TypeError, ValueError):
@@ -183,33 +239,6 @@ class DatabaseCoreMixin(DatabaseMixinHost):
         escaped = escaped.replace("_", "\\_")
         return escaped
 
-    def _cleanup_stale_connections_locked(self, force: bool = False) -> None:
-        """종료된 스레드의 캐시 연결을 정리한다. (lock 내부 전용)"""
-        if not self._thread_connections:
-            return
-        self._stale_cleanup_calls += 1
-        now = time.monotonic()
-        if (
-            not force
-            and
-            self._stale_cleanup_calls % self.STALE_CONNECTION_CLEANUP_EVERY != 0
-            and now - self._last_stale_cleanup_at < self.STALE_CONNECTION_CLEANUP_INTERVAL
-        ):
-            return
-        self._last_stale_cleanup_at = now
-        alive_ids = {t.ident for t in threading.enumerate() if t.ident is not None}
-        stale_ids = [tid for tid in self._thread_connections if tid not in alive_ids]
-        for thread_id in stale_ids:
-            conn = self._thread_connections.pop(thread_id, None)
-            if conn is None:
-                continue
-            try:
-                conn.close()
-            except Exception as e:
-                logger.debug(f"stale DB 연결 종료 오류 (Thread {thread_id}): {e}")
-        if stale_ids:
-            logger.debug("stale DB 연결 정리: %s개", len(stale_ids))
-
     @staticmethod
     def _iter_subtitle_rows(
         session_id: int,
@@ -290,31 +319,49 @@ class DatabaseCoreMixin(DatabaseMixinHost):
 
         return _generator()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """스레드 안전한 연결 생성 및 캐싱"""
-        thread_id = threading.get_ident()
+    def _open_connection(self) -> sqlite3.Connection:
+        """PRAGMA가 적용된 새 연결 생성"""
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA busy_timeout = 5000")
+            conn.execute(f"PRAGMA cache_size = -{int(self.CONNECTION_CACHE_SIZE_KIB)}")
+            conn.execute(f"PRAGMA mmap_size = {int(self.CONNECTION_MMAP_SIZE_BYTES)}")
+            return conn
+        except Exception as e:
+            logger.error(f"DB 연결 생성 오류: {e}")
+            raise
+
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """풀에서 연결을 빌려 작업 동안 독점하고, 끝나면 반납한다.
+
+        풀이 비어 있으면 새 연결을 만들고, 반납 시 풀이 가득 찼으면 닫는다.
+        """
+        with self.lock:
+            conn = self._pool.pop() if self._pool else None
+        if conn is None:
+            conn = self._open_connection()
+        try:
+            yield conn
+        finally:
+            self._release_connection(conn)
+
+    def _release_connection(self, conn: sqlite3.Connection) -> None:
+        try:
+            # 다음 사용자가 이전 작업의 미완료 트랜잭션을 이어받지 않도록 정리한다.
+            if conn.in_transaction:
+                conn.rollback()
+        except Exception as e:
+            logger.debug(f"반납 연결 정리 오류, 폐기: {e}")
+            conn.close()
+            return
         with self.lock:
-            force_cleanup = thread_id not in self._thread_connections
-            if not force_cleanup and len(self._thread_connections) > 1:
-                alive_ids = {t.ident for t in threading.enumerate() if t.ident is not None}
-                force_cleanup = any(
-                    cached_thread_id not in alive_ids
-                    for cached_thread_id in self._thread_connections
-                )
-            self._cleanup_stale_connections_locked(force=force_cleanup)
-            if thread_id not in self._thread_connections:
-                try:
-                    conn = sqlite3.connect(
-                        self.db_path, check_same_thread=False, timeout=10
-                    )
-                    conn.row_factory = sqlite3.Row
-                    conn.execute("PRAGMA foreign_keys = ON")
-                    conn.execute("PRAGMA journal_mode = WAL")
-                    conn.execute("PRAGMA synchronous = NORMAL")
-                    conn.execute("PRAGMA temp_store = MEMORY")
-                    conn.execute("PRAGMA busy_timeout = 5000")
-                    self._thread_connections[thread_id] = conn
-                except Exception as e:
-                    logger.error(f"DB 연결 생성 오류: {e}")
-                    raise
-            return self._thread_connections[thread_id]
+            if not self._closed and len(self._pool) < self._pool_max:
+                self._pool.append(conn)
+                return
+        conn.close()
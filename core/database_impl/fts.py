@@ -17,6 +17,12 @@ from core.models import SubtitleEntry
 
 logger = logging.getLogger("SubtitleExtractor")
 
+_FTS_INSERT_TRIGGER_SQL = """
+    CREATE TRIGGER IF NOT EXISTS subtitles_ai AFTER INSERT ON subtitles BEGIN
+        INSERT INTO subtitles_fts(rowid, text) VALUES (new.id, new.text);
+    END;
+"""
+
 
 class DatabaseFtsMixin:
 
@@ -31,11 +37,7 @@ class DatabaseFtsMixin:
                     content_rowid='id'
                 )
             """)
-            cursor.execute("""
-                CREATE TRIGGER IF NOT EXISTS subtitles_ai AFTER INSERT ON subtitles BEGIN
-                    INSERT INTO subtitles_fts(rowid, text) VALUES (new.id, new.text);
-                END;
-            """)
+            cursor.execute(_FTS_INSERT_TRIGGER_SQL)
             cursor.execute("""
                 CREATE TRIGGER IF NOT EXISTS subtitles_ad AFTER DELETE ON subtitles BEGIN
                     INSERT INTO subtitles_fts(subtitles_fts, rowid, text) VALUES('delete', old.id, old.text);
@@ -88,6 +90,27 @@ class DatabaseFtsMixin:
     def _rebuild_fts_index(self, cursor: sqlite3.Cursor) -> None:
         cursor.execute("INSERT INTO subtitles_fts(subtitles_fts) VALUES ('rebuild')")
 
+    def _suspend_fts_insert_trigger(self, cursor: sqlite3.Cursor) -> None:
+        """대량 삽입 동안 행 단위 FTS 트리거를 끈다.
+
+        반드시 열린 트랜잭션 안에서 호출하고, 같은 트랜잭션에서
+        _index_session_fts_and_restore_trigger로 복구해야 한다 (롤백 시 트리거도 복원됨).
+        """
+        cursor.execute("DROP TRIGGER IF EXISTS subtitles_ai")
+
+    def _index_session_fts_and_restore_trigger(
+        self, cursor: sqlite3.Cursor, session_id: int
+    ) -> None:
+        """세션 자막을 한 번의 INSERT ... SELECT로 FTS에 반영하고 삽입 트리거를 되살린다."""
+        cursor.execute(
+            """
+            INSERT INTO subtitles_fts(rowid, text)
+            SELECT id, text FROM subtitles WHERE session_id = ?
+            """,
+            (session_id,),
+        )
+        cursor.execute(_FTS_INSERT_TRIGGER_SQL)
+
     @staticmethod
     def _build_fts_probe_query(text: object) -> str:
         for token in re.findall(r"[0-9A-Za-z가-힣_]+", str(text or "")):
@@ -96,6 +119,18 @@ class DatabaseFtsMixin:
                 return '"' + normalized.replace('"', '""') + '"'
         return ""
 
+    @staticmethod
+    def _build_fts_relaxed_query(text: object) -> str:
+        """FTS 문법 오류가 난 검색어를 토큰 AND + 마지막 토큰 prefix 질의로 바꾼다."""
+        tokens = [
+            '"' + token.replace('"', '""') + '"'
+            for token in re.findall(r"[0-9A-Za-z가-힣_]+", str(text or ""))
+        ]
+        if not tokens:
+            return ""
+        tokens[-1] += "*"
+        return " ".join(tokens)
+
     def _fts_sample_index_missing(self, cursor: sqlite3.Cursor) -> bool:
         rows = cursor.execute(
             """
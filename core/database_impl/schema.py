@@ -22,94 +22,143 @@ class DatabaseSchemaMixin(DatabaseMixinHost):
 
     def _init_db(self) -> None:
         """데이터베이스 스키마 초기화"""
-        with self.lock:
-            conn = self._get_connection()
-            try:
-                cursor = conn.cursor()
+        with self.write_lock:
+            with self._conn() as conn:
+                try:
+                    cursor = conn.cursor()
 
-                # 세션 테이블
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS sessions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        url TEXT,
-                        committee_name TEXT,
-                        total_subtitles INTEGER DEFAULT 0,
-                        total_characters INTEGER DEFAULT 0,
-                        duration_seconds INTEGER DEFAULT 0,
-                        version TEXT,
-                        notes TEXT,
-                        lineage_id TEXT,
-                        parent_session_id INTEGER NULL,
-                        is_latest_in_lineage INTEGER DEFAULT 1
-                    )
-                """)
-                self._ensure_session_table_columns(cursor)
+                    # 세션 테이블
+                    cursor.execute("""
+                        CREATE TABLE IF NOT EXISTS sessions (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                            url TEXT,
+                            committee_name TEXT,
+                            total_subtitles INTEGER DEFAULT 0,
+                            total_characters INTEGER DEFAULT 0,
+                            duration_seconds INTEGER DEFAULT 0,
+                            version TEXT,
+                            notes TEXT,
+                            lineage_id TEXT,
+                            parent_session_id INTEGER NULL,
+                            is_latest_in_lineage INTEGER DEFAULT 1
+                        )
+                    """)
+                    self._ensure_session_table_columns(cursor)
 
-                # 자막 테이블
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS subtitles (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        session_id INTEGER NOT NULL,
-                        text TEXT NOT NULL,
-                        timestamp DATETIME,
-                        start_time DATETIME,
-                        end_time DATETIME,
-                        sequence INTEGER,
-                        entry_id TEXT,
-                        source_selector TEXT,
-                        source_frame_path TEXT,
-                        source_node_key TEXT,
-                        speaker_color TEXT,
-                        speaker_channel TEXT,
-                        speaker_changed INTEGER DEFAULT 0,
-                        FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE
-                    )
-                """)
-                self._ensure_subtitle_table_columns(cursor)
+                    # 자막 테이블
+                    cursor.execute("""
+                        CREATE TABLE IF NOT EXISTS subtitles (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            session_id INTEGER NOT NULL,
+                            text TEXT NOT NULL,
+                            timestamp DATETIME,
+                            start_time DATETIME,
+                            end_time DATETIME,
+                            sequence INTEGER,
+                            entry_id TEXT,
+                            source_selector TEXT,
+                            source_frame_path TEXT,
+                            source_node_key TEXT,
+                            speaker_color TEXT,
+                            speaker_channel TEXT,
+                            speaker_changed INTEGER DEFAULT 0,
+                            FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE
+                        )
+                    """)
+                    self._ensure_subtitle_table_columns(cursor)
 
-                # 인덱스 생성
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_subtitles_session
-                    ON subtitles(session_id)
-                """)
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_subtitles_session_sequence
-                    ON subtitles(session_id, sequence)
-                """)
-                # FTS 사용으로 인해 일반 text 인덱스는 선택적이지만, 정확한 일치 검색 등을 위해 유지
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_subtitles_text
-                    ON subtitles(text)
-                """)
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_sessions_date
-                    ON sessions(created_at)
-                """)
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_sessions_committee
-                    ON sessions(committee_name)
-                """)
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_sessions_lineage_latest
-                    ON sessions(lineage_id, is_latest_in_lineage, created_at DESC, id DESC)
-                """)
+                    # 인덱스 생성
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_subtitles_session
+                        ON subtitles(session_id)
+                    """)
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_subtitles_session_sequence
+                        ON subtitles(session_id, sequence)
+                    """)
+                    # 검색은 FTS/LIKE '%..%'만 사용해 text B-tree 인덱스를 쓰지 않으므로
+                    # 이전 버전이 만든 인덱스를 제거해 자막 삽입 비용과 DB 크기를 줄인다.
+                    cursor.execute("DROP INDEX IF EXISTS idx_subtitles_text")
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_sessions_date
+                        ON sessions(created_at)
+                    """)
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_sessions_committee
+                        ON sessions(committee_name)
+                    """)
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_sessions_lineage_latest
+                        ON sessions(lineage_id, is_latest_in_lineage, created_at DESC, id DESC)
+                    """)
+                    self._init_session_stats(cursor)
 
-                conn.commit()
-                self.db_available = True
-                self.degraded_reason = ""
-                self._init_fts_objects(conn)
-                try:
-                    conn.execute("PRAGMA optimize")
-                except Exception as opt_error:
-                    logger.debug(f"PRAGMA optimize 실행 오류: {opt_error}")
-                logger.info(f"데이터베이스 초기화 완료: {self.db_path}")
-            except Exception as e:
-                self.db_available = False
-                self.fts_available = False
-                self.degraded_reason = str(e)
-                logger.error(f"데이터베이스 초기화 오류: {e}")
-                raise
+                    conn.commit()
+                    self.db_available = True
+                    self.degraded_reason = ""
+                    self._init_fts_objects(conn)
+                    logger.info(f"데이터베이스 초기화 완료: {self.db_path}")
+                except Exception as e:
+                    self.db_available = False
+                    self.fts_available = False
+                    self.degraded_reason = str(e)
+                    logger.error(f"데이터베이스 초기화 오류: {e}")
+                    raise
+
+    def _init_session_stats(self, cursor: sqlite3.Cursor) -> None:
+        """get_statistics가 sessions 전체를 집계하지 않도록 누적 통계 행을 트리거로 유지한다."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS session_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_sessions INTEGER NOT NULL DEFAULT 0,
+                total_subtitles INTEGER NOT NULL DEFAULT 0,
+                total_characters INTEGER NOT NULL DEFAULT 0,
+                total_duration INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS sessions_ai_stats AFTER INSERT ON sessions BEGIN
+                UPDATE session_stats
+                SET total_sessions = total_sessions + 1,
+                    total_subtitles = total_subtitles + COALESCE(new.total_subtitles, 0),
+                    total_characters = total_characters + COALESCE(new.total_characters, 0),
+                    total_duration = total_duration + COALESCE(new.duration_seconds, 0)
+                WHERE id = 1;
+            END;
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS sessions_ad_stats AFTER DELETE ON sessions BEGIN
+                UPDATE session_stats
+                SET total_sessions = total_sessions - 1,
+                    total_subtitles = total_subtitles - COALESCE(old.total_subtitles, 0),
+                    total_characters = total_characters - COALESCE(old.total_characters, 0),
+                    total_duration = total_duration - COALESCE(old.duration_seconds, 0)
+                WHERE id = 1;
+            END;
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS sessions_au_stats
+            AFTER UPDATE OF total_subtitles, total_characters, duration_seconds ON sessions
+            BEGIN
+                UPDATE session_stats
+                SET total_subtitles = total_subtitles
+                        - COALESCE(old.total_subtitles, 0) + COALESCE(new.total_subtitles, 0),
+                    total_characters = total_characters
+                        - COALESCE(old.total_characters, 0) + COALESCE(new.total_characters, 0),
+                    total_duration = total_duration
+                        - COALESCE(old.duration_seconds, 0) + COALESCE(new.duration_seconds, 0)
+                WHERE id = 1;
+            END;
+        """)
+        # 기존 DB는 처음 한 번만 sessions에서 집계해 채운다.
+        cursor.execute("""
+            INSERT OR IGNORE INTO session_stats
+            (id, total_sessions, total_subtitles, total_characters, total_duration)
+            SELECT 1, COUNT(*), COALESCE(SUM(total_subtitles), 0),
+                   COALESCE(SUM(total_characters), 0), COALESCE(SUM(duration_seconds), 0)
+            FROM sessions
+        """)
 
     def _ensure_subtitle_table_columns(self, cursor: sqlite3.Cursor) -> None:
         column_rows = cursor.execute("PRAGMA table_info(subtitles)").fetchall()
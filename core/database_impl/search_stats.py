@@ -43,30 +43,32 @@ class DatabaseSearchStatsMixin(DatabaseMixinHost):
         safe_limit = self._sanitize_limit(limit, default=100)
         safe_offset = self._sanitize_offset(offset)
 
-        with self.lock:
-            conn = self._get_connection()
+        with self._conn() as conn:
             try:
                 cursor = conn.cursor()
+                cursor.row_factory = None  # _fetch_dict_rows가 튜플에서 바로 dict를 만든다
 
                 if str(syntax or "literal").strip().lower() == "fts":
                     if not bool(self.fts_available):
                         logger.debug("FTS 비활성 상태라 literal LIKE로 fallback")
                     else:
                         try:
-                            cursor.execute("""
-                                SELECT s.id as subtitle_id, s.text, s.timestamp, s.sequence,
-                                       sess.id as session_id, sess.created_at, sess.committee_name
-                                FROM subtitles s
-                                JOIN sessions sess ON s.session_id = sess.id
-                                WHERE s.id IN (
-                                    SELECT rowid FROM subtitles_fts WHERE text MATCH ? ORDER BY rank
-                                )
-                                ORDER BY sess.created_at DESC, s.sequence
-                                LIMIT ? OFFSET ?
-                            """, (safe_query, safe_limit, safe_offset))
-                            return [dict(row) for row in cursor.fetchall()]
+                            return self._search_fts_rows(
+                                cursor, safe_query, safe_limit, safe_offset
+                            )
                         except sqlite3.OperationalError as fts_error:
-                            logger.debug(f"FTS 검색 실패, literal LIKE로 fallback: {fts_error}")
+                            # FTS 문법 오류면 토큰만 남긴 완화 질의로 인덱스를 한 번 더 쓴다.
+                            relaxed_query = self._build_fts_relaxed_query(safe_query)
+                            logger.debug(f"FTS 검색 실패, 완화 질의 재시도: {fts_error}")
+                            if relaxed_query:
+                                try:
+                                    return self._search_fts_rows(
+                                        cursor, relaxed_query, safe_limit, safe_offset
+                                    )
+                                except sqlite3.OperationalError as relaxed_error:
+                                    logger.debug(
+                                        f"FTS 완화 검색 실패, literal LIKE로 fallback: {relaxed_error}"
+                                    )
 
                 like_query = f"%{self._escape_like_query(safe_query)}%"
                 cursor.execute("""
@@ -79,33 +81,63 @@ class DatabaseSearchStatsMixin(DatabaseMixinHost):
                     LIMIT ? OFFSET ?
                 """, (like_query, safe_limit, safe_offset))
 
-                return [dict(row) for row in cursor.fetchall()]
+                return self._fetch_dict_rows(cursor)
 
             except Exception:
                 logger.exception("자막 검색 오류")
                 raise
 
+    def _search_fts_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        match_query: str,
+        limit: int,
+        offset: int,
+    ) -> List[Dict[str, Any]]:
+        # FTS 적중 rowid에서 출발해 PK로 조인한다. 최종 정렬이 세션/순번
+        # 기준이므로 rank(bm25) 계산은 하지 않는다.
+        cursor.execute("""
+            WITH fts_hits AS (
+                SELECT rowid FROM subtitles_fts WHERE text MATCH ?
+            )
+            SELECT s.id as subtitle_id, s.text, s.timestamp, s.sequence,
+                   sess.id as session_id, sess.created_at, sess.committee_name
+            FROM fts_hits f
+            JOIN subtitles s ON s.id = f.rowid
+            JOIN sessions sess ON s.session_id = sess.id
+            ORDER BY sess.created_at DESC, s.sequence
+            LIMIT ? OFFSET ?
+        """, (match_query, limit, offset))
+        return self._fetch_dict_rows(cursor)
+
     def get_statistics(self) -> Dict[str, Union[int, float]]:
         """전체 통계 조회
 
         Returns:
             dict: 전체 통계 정보
         """
-        with self.lock:
-            conn = self._get_connection()
+        with self._conn() as conn:
             try:
                 cursor = conn.cursor()
 
+                # sessions 트리거가 유지하는 누적 행을 읽는다 (전체 집계 없음).
                 cursor.execute("""
-                    SELECT
-                        COUNT(*) as total_sessions,
-                        SUM(total_subtitles) as total_subtitles,
-                        SUM(total_characters) as total_characters,
-                        SUM(duration_seconds) as total_duration
-                    FROM sessions
+                    SELECT total_sessions, total_subtitles, total_characters, total_duration
+                    FROM session_stats
+                    WHERE id = 1
                 """)
 
                 row = cursor.fetchone()
+                if row is None:
+                    cursor.execute("""
+                        SELECT
+                            COUNT(*) as total_sessions,
+                            SUM(total_subtitles) as total_subtitles,
+                            SUM(total_characters) as total_characters,
+                            SUM(duration_seconds) as total_duration
+                        FROM sessions
+                    """)
+                    row = cursor.fetchone()
                 return {
                     "total_sessions": row["total_sessions"] or 0,
                     "total_subtitles": row["total_subtitles"] or 0,
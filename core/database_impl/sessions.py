@@ -38,111 +38,123 @@ class DatabaseSessionMixin(DatabaseMixinHost):
         if not isinstance(session_data, dict):
             raise ValueError("session_data는 dict여야 합니다.")
 
-        with self.lock:
-            conn = self._get_connection()
-            try:
-                cursor = conn.cursor()
+        with self.write_lock:
+            with self._conn() as conn:
+                try:
+                    cursor = conn.cursor()
+                    # 쓰기 잠금을 처음부터 잡아 세션/자막/FTS 변경(트리거 DDL 포함)을 한 트랜잭션으로 묶는다.
+                    if not conn.in_transaction:
+                        cursor.execute("BEGIN IMMEDIATE")
+
+                    subtitles_raw = session_data.get("subtitles", [])
+                    subtitles = (
+                        subtitles_raw
+                        if isinstance(subtitles_raw, Iterable)
+                        and not isinstance(subtitles_raw, (str, bytes, dict))
+                        else ()
+                    )
+                    duration_seconds = self._sanitize_duration(
+                        session_data.get("duration_seconds", 0)
+                    )
+                    lineage_id = str(session_data.get("lineage_id", "") or "").strip()
+                    if not lineage_id:
+                        lineage_id = f"session-{uuid4().hex}"
+                    parent_session_id = self._sanitize_positive_id(
+                        session_data.get("parent_session_id")
+                    )
+                    cursor.execute(
+                        """
+                        UPDATE sessions
+                        SET is_latest_in_lineage = 0
+                        WHERE lineage_id = ?
+                        """,
+                        (lineage_id,),
+                    )
 
-                subtitles_raw = session_data.get("subtitles", [])
-                subtitles = (
-                    subtitles_raw
-                    if isinstance(subtitles_raw, Iterable)
-                    and not isinstance(subtitles_raw, (str, bytes, dict))
-                    else ()
-                )
-                duration_seconds = self._sanitize_duration(
-                    session_data.get("duration_seconds", 0)
-                )
-                lineage_id = str(session_data.get("lineage_id", "") or "").strip()
-                if not lineage_id:
-                    lineage_id = f"session-{uuid4().hex}"
-                parent_session_id = self._sanitize_positive_id(
-                    session_data.get("parent_session_id")
-                )
-                cursor.execute(
-                    """
-                    UPDATE sessions
-                    SET is_latest_in_lineage = 0
-                    WHERE lineage_id = ?
-                    """,
-                    (lineage_id,),
-                )
-
-                # 세션 삽입
-                cursor.execute("""
-                    INSERT INTO sessions
-                    (url, committee_name, total_subtitles, total_characters,
-                     duration_seconds, version, notes, lineage_id, parent_session_id, is_latest_in_lineage)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-                """, (
-                    session_data.get("url", ""),
-                    session_data.get("committee_name", ""),
-                    0,
-                    0,
-                    duration_seconds,
-                    session_data.get("version", ""),
-                    session_data.get("notes", ""),
-                    lineage_id,
-                    parent_session_id,
-                ))
-
-                session_id = cursor.lastrowid
-                if session_id is None:
-                    raise RuntimeError("세션 저장 후 session_id를 확인할 수 없습니다.")
-
-                total_subtitles = 0
-                total_chars = 0
-                batch: list[tuple[Any, ...]] = []
-
-                def flush_batch() -> None:
-                    if not batch:
-                        return
-                    cursor.executemany("""
-                        INSERT INTO subtitles
-                        (
-                            session_id,
-                            text,
-                            timestamp,
-                            start_time,
-                            end_time,
-                            sequence,
-                            entry_id,
-                            source_selector,
-                            source_frame_path,
-                            source_node_key,
-                            speaker_color,
-                            speaker_channel,
-                            speaker_changed
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, batch)
-                    batch.clear()
-
-                for row in self._iter_subtitle_rows(session_id, subtitles):
-                    total_subtitles += 1
-                    total_chars += len(str(row[1] or ""))
-                    batch.append(row)
-                    if len(batch) >= self.INSERT_BATCH_SIZE:
-                        flush_batch()
-                flush_batch()
-
-                cursor.execute(
-                    """
-                    UPDATE sessions
-                    SET total_subtitles = ?, total_characters = ?
-                    WHERE id = ?
-                    """,
-                    (total_subtitles, total_chars, session_id),
-                )
-
-                conn.commit()
-                logger.info(f"세션 저장 완료: ID={session_id}, 자막={total_subtitles}개")
-                return session_id
-
-            except Exception as e:
-                conn.rollback()
-                logger.error(f"세션 저장 오류: {e}")
-                raise
+                    # 세션 삽입
+                    cursor.execute("""
+                        INSERT INTO sessions
+                        (url, committee_name, total_subtitles, total_characters,
+                         duration_seconds, version, notes, lineage_id, parent_session_id, is_latest_in_lineage)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+                    """, (
+                        session_data.get("url", ""),
+                        session_data.get("committee_name", ""),
+                        0,
+                        0,
+                        duration_seconds,
+                        session_data.get("version", ""),
+                        session_data.get("notes", ""),
+                        lineage_id,
+                        parent_session_id,
+                    ))
+
+                    session_id = cursor.lastrowid
+                    if session_id is None:
+                        raise RuntimeError("세션 저장 후 session_id를 확인할 수 없습니다.")
+
+                    total_subtitles = 0
+                    total_chars = 0
+                    batch: list[tuple[Any, ...]] = []
+                    # 한 배치를 넘는 대량 저장만 행 단위 FTS 트리거를 끄고 세션 단위로 한 번에 색인한다.
+                    # 트리거 DDL은 schema cookie를 바꿔 모든 연결의 prepared statement를
+                    # 무효화하므로, 작은 저장은 트리거를 그대로 둔다.
+                    bulk_fts = False
+
+                    def flush_batch() -> None:
+                        if not batch:
+                            return
+                        cursor.executemany("""
+                            INSERT INTO subtitles
+                            (
+                                session_id,
+                                text,
+                                timestamp,
+                                start_time,
+                                end_time,
+                                sequence,
+                                entry_id,
+                                source_selector,
+                                source_frame_path,
+                                source_node_key,
+                                speaker_color,
+                                speaker_channel,
+                                speaker_changed
+                            )
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """, batch)
+                        batch.clear()
+
+                    for row in self._iter_subtitle_rows(session_id, subtitles):
+                        total_subtitles += 1
+                        total_chars += len(str(row[1] or ""))
+                        batch.append(row)
+                        if len(batch) >= self.INSERT_BATCH_SIZE:
+                            if not bulk_fts and self.fts_available:
+                                self._suspend_fts_insert_trigger(cursor)
+                                bulk_fts = True
+                            flush_batch()
+                    flush_batch()
+                    if bulk_fts:
+                        self._index_session_fts_and_restore_trigger(cursor, session_id)
+
+                    cursor.execute(
+                        """
+                        UPDATE sessions
+                        SET total_subtitles = ?, total_characters = ?
+                        WHERE id = ?
+                        """,
+                        (total_subtitles, total_chars, session_id),
+                    )
+
+                    conn.commit()
+                    logger.info(f"세션 저장 완료: ID={session_id}, 자막={total_subtitles}개")
+                    return session_id
+
+                except Exception as e:
+                    conn.rollback()
+                    logger.error(f"세션 저장 오류: {e}")
+                    raise
 
     def load_session(self, session_id: int) -> Optional[Dict[str, Any]]:
         """세션 로드
@@ -157,8 +169,7 @@ class DatabaseSessionMixin(DatabaseMixinHost):
         if safe_session_id is None:
             return None
 
-        with self.lock:
-            conn = self._get_connection()
+        with self._conn() as conn:
             try:
                 cursor = conn.cursor()
 
@@ -171,14 +182,46 @@ class DatabaseSessionMixin(DatabaseMixinHost):
                 if not session_row:
                     return None
 
-                # 자막 조회
-                cursor.execute("""
-                    SELECT * FROM subtitles
+                # 자막 조회: 필요한 컬럼만 튜플로 받아 이름 기반 sqlite3.Row 조회 없이 dict를 만든다.
+                subtitle_cursor = conn.cursor()
+                subtitle_cursor.row_factory = None
+                subtitle_cursor.execute("""
+                    SELECT text, timestamp, start_time, end_time, entry_id,
+                           source_selector, source_frame_path, source_node_key,
+                           speaker_color, speaker_channel, speaker_changed
+                    FROM subtitles
                     WHERE session_id = ?
                     ORDER BY sequence
                 """, (safe_session_id,))
-
-                subtitle_rows = cursor.fetchall()
+                deserialize_frame_path = self._deserialize_frame_path
+                subtitles = [
+                    {
+                        "text": text,
+                        "timestamp": timestamp,
+                        "start_time": start_time,
+                        "end_time": end_time,
+                        "entry_id": entry_id,
+                        "source_selector": source_selector,
+                        "source_frame_path": deserialize_frame_path(source_frame_path),
+                        "source_node_key": source_node_key,
+                        "speaker_color": speaker_color,
+                        "speaker_channel": speaker_channel,
+                        "speaker_changed": bool(speaker_changed),
+                    }
+                    for (
+                        text,
+                        timestamp,
+                        start_time,
+                        end_time,
+                        entry_id,
+                        source_selector,
+                        source_frame_path,
+                        source_node_key,
+                        speaker_color,
+                        speaker_channel,
+                        speaker_changed,
+                    ) in subtitle_cursor
+                ]
 
                 return {
                     "id": session_row["id"],
@@ -193,24 +236,7 @@ class DatabaseSessionMixin(DatabaseMixinHost):
                     "lineage_id": session_row["lineage_id"],
                     "parent_session_id": session_row["parent_session_id"],
                     "is_latest_in_lineage": int(session_row["is_latest_in_lineage"] or 0),
-                    "subtitles": [
-                        {
-                            "text": row["text"],
-                            "timestamp": row["timestamp"],
-                            "start_time": row["start_time"],
-                            "end_time": row["end_time"],
-                            "entry_id": row["entry_id"],
-                            "source_selector": row["source_selector"],
-                            "source_frame_path": self._deserialize_frame_path(
-                                row["source_frame_path"]
-                            ),
-                            "source_node_key": row["source_node_key"],
-                            "speaker_color": row["speaker_color"],
-                            "speaker_channel": row["speaker_channel"],
-                            "speaker_changed": bool(row["speaker_changed"]),
-                        }
-                        for row in subtitle_rows
-                    ]
+                    "subtitles": subtitles,
                 }
 
             except Exception:
@@ -230,10 +256,10 @@ class DatabaseSessionMixin(DatabaseMixinHost):
         safe_limit = self._sanitize_limit(limit, default=50)
         safe_offset = self._sanitize_offset(offset)
 
-        with self.lock:
-            conn = self._get_connection()
+        with self._conn() as conn:
             try:
                 cursor = conn.cursor()
+                cursor.row_factory = None  # _fetch_dict_rows가 튜플에서 바로 dict를 만든다
                 cursor.execute("""
                     SELECT id, created_at, url, committee_name,
                            total_subtitles, total_characters, duration_seconds, notes,
@@ -260,7 +286,7 @@ class DatabaseSessionMixin(DatabaseMixinHost):
                     LIMIT ? OFFSET ?
                 """, (safe_limit, safe_offset))
 
-                return [dict(row) for row in cursor.fetchall()]
+                return self._fetch_dict_rows(cursor)
 
             except Exception:
                 logger.exception("세션 목록 조회 오류")
@@ -275,64 +301,97 @@ class DatabaseSessionMixin(DatabaseMixinHost):
         Returns:
             bool: 삭제 성공 여부
         """
-        safe_session_id = self._sanitize_positive_id(session_id)
-        if safe_session_id is None:
+        if self._sanitize_positive_id(session_id) is None:
             return False
+        return self.delete_sessions([session_id]) > 0
 
-        with self.lock:
-            conn = self._get_connection()
-            try:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT lineage_id, is_latest_in_lineage
-                    FROM sessions
-                    WHERE id = ?
-                    """,
-                    (safe_session_id,),
-                )
-                session_row = cursor.fetchone()
-                if not session_row:
-                    return False
+    def delete_sessions(self, session_ids: Iterable[object]) -> int:
+        """여러 세션을 한 트랜잭션으로 삭제
 
-                lineage_id = str(session_row["lineage_id"] or "").strip()
-                was_latest = bool(session_row["is_latest_in_lineage"] or 0)
-                cursor.execute("DELETE FROM sessions WHERE id = ?", (safe_session_id,))
-                deleted = cursor.rowcount > 0
-                if deleted and lineage_id and was_latest:
-                    cursor.execute(
-                        """
-                        SELECT 1
-                        FROM sessions
-                        WHERE lineage_id = ?
-                          AND is_latest_in_lineage = 1
-                        LIMIT 1
-                        """,
-                        (lineage_id,),
-                    )
-                    has_latest = cursor.fetchone() is not None
-                    if not has_latest:
+        Args:
+            session_ids: 삭제할 세션 ID 목록 (잘못된 ID는 무시)
+
+        Returns:
+            int: 실제 삭제된 세션 수
+        """
+        safe_ids: list[int] = []
+        seen_ids: set[int] = set()
+        for raw_id in session_ids:
+            safe_id = self._sanitize_positive_id(raw_id)
+            if safe_id is not None and safe_id not in seen_ids:
+                seen_ids.add(safe_id)
+                safe_ids.append(safe_id)
+        if not safe_ids:
+            return 0
+
+        with self.write_lock:
+            with self._conn() as conn:
+                try:
+                    cursor = conn.cursor()
+                    deleted_count = 0
+                    promote_lineages: set[str] = set()
+                    for chunk_start in range(0, len(safe_ids), self.INSERT_BATCH_SIZE):
+                        chunk = safe_ids[chunk_start:chunk_start + self.INSERT_BATCH_SIZE]
+                        placeholders = ",".join("?" * len(chunk))
+                        cursor.execute(
+                            f"""
+                            SELECT lineage_id
+                            FROM sessions
+                            WHERE id IN ({placeholders}) AND is_latest_in_lineage = 1
+                            """,
+                            chunk,
+                        )
+                        for row in cursor.fetchall():
+                            lineage_id = str(row["lineage_id"] or "").strip()
+                            if lineage_id:
+                                promote_lineages.add(lineage_id)
+                        cursor.execute(
+                            f"DELETE FROM sessions WHERE id IN ({placeholders})", chunk
+                        )
+                        deleted_count += max(0, cursor.rowcount)
+
+                    # 최신 버전이 지워진 lineage는 남은 것 중 가장 최근 버전을 최신으로 올린다.
+                    for lineage_id in sorted(promote_lineages):
                         cursor.execute(
                             """
-                            UPDATE sessions
-                            SET is_latest_in_lineage = 1
-                            WHERE id = (
-                                SELECT id
-                                FROM sessions
-                                WHERE lineage_id = ?
-                                ORDER BY created_at DESC, id DESC
-                                LIMIT 1
-                            )
+                            SELECT 1
+                            FROM sessions
+                            WHERE lineage_id = ?
+                              AND is_latest_in_lineage = 1
+                            LIMIT 1
                             """,
                             (lineage_id,),
                         )
+                        has_latest = cursor.fetchone() is not None
+                        if not has_latest:
+                            cursor.execute(
+                                """
+                                UPDATE sessions
+                                SET is_latest_in_lineage = 1
+                                WHERE id = (
+                                    SELECT id
+                                    FROM sessions
+                                    WHERE lineage_id = ?
+                                    ORDER BY created_at DESC, id DESC
+                                    LIMIT 1
+                                )
+                                """,
+                                (lineage_id,),
+                            )
 
-                conn.commit()
-                if deleted:
-                    logger.info(f"세션 삭제 완료: ID={safe_session_id}")
-                return deleted
+                    conn.commit()
+                    if deleted_count:
+                        # 대량 삭제 시 로그 한 줄이 무한히 길어지지 않도록 앞부분 ID만 남긴다.
+                        preview_ids = safe_ids[:self.DELETE_LOG_ID_PREVIEW]
+                        more = len(safe_ids) - len(preview_ids)
+                        more_text = f" 외 {more}개" if more else ""
+                        logger.info(
+                            f"세션 삭제 완료: {deleted_count}개 "
+                            f"(요청 {len(safe_ids)}개, ID={preview_ids}{more_text})"
+                        )
+                    return deleted_count
 
-            except Exception:
-                conn.rollback()
-                logger.exception("세션 삭제 오류")
-                raise
+                except Exception:
+                    conn.rollback()
+                    logger.exception("세션 삭제 오류")
+                    raise
@@ -5,11 +5,80 @@ import os
 import re
 import tempfile
 from datetime import datetime
+from importlib import import_module
 from pathlib import Path
-from typing import BinaryIO, Callable, Iterable, Iterator, List, Mapping, Optional, TextIO, Union
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Mapping, Optional, TextIO, Union
 from core.config import Config
 from core.models import SubtitleEntry
 
+try:
+    # 선택 의존성: 설치되어 있으면 네이티브 JSON 인코더/디코더로 대용량 세션/세그먼트 저장·로딩을 가속
+    _orjson: Any = import_module("orjson")
+except ImportError:
+    _orjson = None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """JSON 문자열/바이트를 파싱한다 (orjson 사용 가능 시 우선 사용)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """UTF-8 JSON 파일을 읽어 파싱한다."""
+    return json_loads(Path(path).read_bytes())
+
+
+def _reject_orjson_default(value: object) -> Any:
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_dumps_indented(data: object) -> Optional[bytes]:
+    """orjson으로 indent=2 JSON 바이트를 만든다. 사용할 수 없으면 None (json 폴백).
+
+    datetime/dataclass는 orjson이 직렬화하지 않도록 통과시켜 json.dump와 같이
+    TypeError로 드러나게 한다. 남는 차이: NaN/Infinity는 null로 기록되고
+    (orjson.loads가 읽지 못하는 비표준 토큰을 남기지 않음), 실수는 1e-05 대신
+    0.00001처럼 다른 표기로 쓰일 수 있으나 읽으면 같은 값이다.
+    """
+    if _orjson is None:
+        return None
+    try:
+        return _orjson.dumps(
+            data,
+            default=_reject_orjson_default,
+            option=(
+                _orjson.OPT_INDENT_2
+                | _orjson.OPT_NON_STR_KEYS
+                | _orjson.OPT_PASSTHROUGH_DATETIME
+                | _orjson.OPT_PASSTHROUGH_DATACLASS
+            ),
+        )
+    except TypeError:
+        # 64비트 범위를 넘는 정수 등 orjson이 거부하는 값은 표준 json 경로로 처리한다.
+        return None
+
+
+def _fsync_directory(directory: Path) -> None:
+    """rename 결과가 전원 손실 후에도 남도록 상위 디렉터리 엔트리를 디스크에 반영한다."""
+    if os.name == "nt":
+        return
+    try:
+        dir_fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        # 디렉터리 fsync를 지원하지 않는 파일시스템(FAT/NFS 등)은 건너뛴다.
+        pass
+    finally:
+        os.close(dir_fd)
+
+
 def atomic_write_json(
     path: Union[str, Path],
     data: object,
@@ -17,8 +86,13 @@ def atomic_write_json(
     ensure_ascii: bool = False,
     indent: int = 2,
     encoding: str = "utf-8",
+    durable: bool = True,
 ) -> None:
-    """JSON 파일을 원자적으로 저장한다."""
+    """JSON 파일을 원자적으로 저장한다.
+
+    durable=False이면 fsync를 생략한다. 교체 자체는 원자적이지만 전원 손실 시
+    직전 내용으로 돌아갈 수 있으므로 언제든 다시 만들 수 있는 파일에만 사용한다.
+    """
     target = Path(path)
     target.parent.mkdir(parents=True, exist_ok=True)
 
@@ -27,11 +101,24 @@ def atomic_write_json(
     )
     temp_file = Path(temp_path)
     try:
-        with os.fdopen(fd, "w", encoding=encoding) as f:
-            json.dump(data, f, ensure_ascii=ensure_ascii, indent=indent)
-            f.flush()
-            os.fsync(f.fileno())
+        payload = None
+        if not ensure_ascii and indent == 2 and encoding.lower() in ("utf-8", "utf8"):
+            payload = _orjson_dumps_indented(data)
+        if payload is not None:
+            with os.fdopen(fd, "wb") as binary_file:
+                binary_file.write(payload)
+                if durable:
+                    binary_file.flush()
+                    os.fsync(binary_file.fileno())
+        else:
+            with os.fdopen(fd, "w", encoding=encoding) as f:
+                json.dump(data, f, ensure_ascii=ensure_ascii, indent=indent)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
         os.replace(str(temp_file), str(target))
+        if durable:
+            _fsync_directory(target.parent)
     except Exception:
         try:
             temp_file.unlink(missing_ok=True)
@@ -78,6 +165,7 @@ def atomic_write_json_stream(
     tail_items: Iterable[tuple[str, object]] = (),
     ensure_ascii: bool = False,
     encoding: str = "utf-8",
+    durable: bool = True,
 ) -> None:
     """JSON object를 배열 필드 하나와 함께 스트리밍 저장한다."""
     target = Path(path)
@@ -121,9 +209,12 @@ def atomic_write_json_stream(
                 write_item(key, value)
 
             f.write("\n}\n")
-            f.flush()
-            os.fsync(f.fileno())
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(str(temp_file), str(target))
+        if durable:
+            _fsync_directory(target.parent)
     except Exception:
         try:
             temp_file.unlink(missing_ok=True)
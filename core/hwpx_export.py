@@ -7,6 +7,7 @@ from xml.sax.saxutils import escape
 from zipfile import ZIP_STORED, ZipFile
 
 from core.file_io import atomic_write_bytes
+from core.text_utils import format_hms
 
 _TITLE = "국회 의사중계 자막"
 _HEADER_TEMPLATE_PATH = Path(__file__).resolve().parents[1] / "assets" / "hwpx" / "header.xml"
@@ -91,7 +92,7 @@ def build_hwpx_lines(
             should_print_ts = True
 
         if should_print_ts:
-            prefix = f"[{timestamp.strftime('%H:%M:%S')}] "
+            prefix = f"[{format_hms(timestamp)}] "
             last_printed_ts = timestamp
         else:
             prefix = ""
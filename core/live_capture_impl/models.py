@@ -47,7 +47,7 @@ class LiveCaptureRow(LivePanelRow):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LiveCaptureLedger:
     rows: dict[str, LiveCaptureRow] = field(default_factory=dict)
     order: list[str] = field(default_factory=list)
@@ -3,13 +3,40 @@
 로깅 유틸리티
 """
 
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from typing import Optional
 
 from core.config import Config
 
 
+_file_log_listener: Optional[QueueListener] = None
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """같은 초에 기록된 로그는 마지막으로 포맷한 시각 문자열을 재사용한다."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._last_second = -1
+        self._last_datefmt: Optional[str] = None
+        self._last_time_text = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._last_second or datefmt != self._last_datefmt:
+            self._last_time_text = time.strftime(datefmt, self.converter(second))
+            self._last_second = second
+            self._last_datefmt = datefmt
+        return self._last_time_text
+
+
 def _ensure_console_handler(logger: logging.Logger) -> None:
     if any(
         isinstance(handler, logging.StreamHandler)
@@ -24,8 +51,26 @@ def _ensure_console_handler(logger: logging.Logger) -> None:
     logger.addHandler(console_handler)
 
 
+def get_file_log_handlers() -> list[logging.Handler]:
+    """백그라운드 리스너가 기록 중인 파일 핸들러 목록을 반환한다."""
+    listener = _file_log_listener
+    if listener is None:
+        return []
+    return list(listener.handlers)
+
+
+def _stop_file_log_listener() -> None:
+    global _file_log_listener
+    listener = _file_log_listener
+    if listener is None:
+        return
+    _file_log_listener = None
+    listener.stop()
+
+
 def _ensure_file_handler(logger: logging.Logger) -> None:
-    if any(isinstance(handler, TimedRotatingFileHandler) for handler in logger.handlers):
+    global _file_log_listener
+    if _file_log_listener is not None:
         return
     log_dir = Path(Config.LOG_DIR)
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -39,12 +84,18 @@ def _ensure_file_handler(logger: logging.Logger) -> None:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.suffix = "%Y%m%d"
-    file_format = logging.Formatter(
+    file_format = _SecondCachedFormatter(
         "%(asctime)s [%(levelname)s] %(funcName)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
+    # 파일 쓰기는 백그라운드 리스너가 맡고, 호출 스레드는 큐에 넣기만 한다.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    _file_log_listener = listener
+    atexit.register(_stop_file_log_listener)
+    logger.addHandler(QueueHandler(log_queue))
 
 
 def setup_logging():
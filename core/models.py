@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Literal, Optional, cast
@@ -64,7 +65,10 @@ class SubtitleEntry:
         self.source_selector: Optional[str] = source_selector
         self.source_frame_path: Optional[list[int]] = _clone_frame_path(source_frame_path)
         self.source_node_key: Optional[str] = source_node_key
-        self.speaker_color: Optional[str] = speaker_color
+        # 화자 색상은 세션 내 몇 개 값만 반복되므로 intern해 엔트리 간 문자열을 공유한다.
+        self.speaker_color: Optional[str] = (
+            sys.intern(speaker_color) if isinstance(speaker_color, str) else speaker_color
+        )
         self.speaker_channel: SpeakerChannel = speaker_channel
         self.speaker_changed: bool = speaker_changed
         self._char_count: int = len(text)
@@ -86,6 +90,20 @@ class SubtitleEntry:
         return self._compact_text
 
     def update_text(self, new_text: str) -> None:
+        old_text = self.text
+        if old_text and len(new_text) > len(old_text) and new_text.startswith(old_text):
+            # 스트림 병합은 기존 본문 뒤에 이어 붙는 경우가 대부분이므로 추가분만 센다.
+            added = new_text[len(old_text):]
+            word_count = self._word_count + len(added.split())
+            if not old_text[-1].isspace() and not added[0].isspace():
+                # 경계에 공백이 없으면 기존 마지막 토큰과 추가분 첫 토큰이 하나로 합쳐진다.
+                word_count -= 1
+            self.text = new_text
+            self._char_count = len(new_text)
+            self._word_count = word_count
+            if self._compact_text is not None:
+                self._compact_text += compact_subtitle_text(added)
+            return
         self.text = new_text
         self._char_count = len(new_text)
         self._word_count = len(new_text.split())
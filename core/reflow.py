@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import date, datetime, time
+from functools import lru_cache
 from typing import Iterable
 
 from core.models import SubtitleEntry
 
 _TIMESTAMP_PATTERN = re.compile(r"\[(\d{2}:\d{2}:\d{2})\]")
-_SENTENCE_SPLIT_PATTERN = re.compile(r"([.?!])\s+")
-_MERGE_ENDERS = (".", "?", "!")
+_SENTENCE_END_PATTERN = re.compile(r"[.?!]\s+")
+_MERGE_ENDERS = ".?!"
 
 
 def _clone_entry(
@@ -39,6 +40,18 @@ def _clone_entry(
     return cloned
 
 
+@lru_cache(maxsize=4096)
+def _parse_hms(value: str) -> time:
+    """정규식으로 검증된 HH:MM:SS 문자열을 strptime 없이 time으로 변환한다 (범위 밖이면 ValueError)."""
+    return time(int(value[0:2]), int(value[3:5]), int(value[6:8]))
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_on(base_date: date, value: str) -> datetime:
+    """같은 날짜/시각 조합은 datetime을 다시 만들지 않고 공유한다 (datetime은 불변)."""
+    return datetime.combine(base_date, _parse_hms(value))
+
+
 def _metadata_signature(entry: SubtitleEntry) -> tuple[object, ...]:
     frame_path = tuple(entry.source_frame_path or ())
     return (
@@ -55,9 +68,10 @@ def _split_embedded_timestamps(
     entry: SubtitleEntry,
 ) -> list[tuple[SubtitleEntry, bool]]:
     text = entry.text
-    matches = list(_TIMESTAMP_PATTERN.finditer(text))
+    matches = list(_TIMESTAMP_PATTERN.finditer(text)) if "[" in text else []
     if not matches:
-        return [(entry.clone(), False)]
+        # 문장 분리 단계가 항상 새 엔트리를 만들므로 여기서는 원본을 그대로 넘긴다.
+        return [(entry, False)]
 
     base_date = entry.timestamp.date()
     current_timestamp = entry.timestamp
@@ -70,8 +84,7 @@ def _split_embedded_timestamps(
             chunks.append((pre_text, current_timestamp))
 
         try:
-            parsed_time = datetime.strptime(match.group(1), "%H:%M:%S").time()
-            current_timestamp = datetime.combine(base_date, parsed_time)
+            current_timestamp = _timestamp_on(base_date, match.group(1))
         except ValueError:
             pass
         last_pos = match.end()
@@ -104,25 +117,18 @@ def _split_embedded_timestamps(
 
 
 def _split_sentences(buffer_text: str) -> list[str]:
-    fragments = _SENTENCE_SPLIT_PATTERN.split(buffer_text.strip())
-    if len(fragments) <= 1:
-        return [buffer_text.strip()] if buffer_text.strip() else []
-
+    """문장 부호 + 공백 위치에서 한 번의 스캔으로 문장 구간을 잘라낸다."""
+    text = buffer_text.strip()
     sentences: list[str] = []
-    current = ""
-    for fragment in fragments:
-        if fragment in (".", "?", "!"):
-            current += fragment
-            if current.strip():
-                sentences.append(current.strip())
-            current = ""
-            continue
-        if current:
-            if current.strip():
-                sentences.append(current.strip())
-        current = fragment
-    if current.strip():
-        sentences.append(current.strip())
+    sentence_start = 0
+    for match in _SENTENCE_END_PATTERN.finditer(text):
+        sentence = text[sentence_start:match.start() + 1].strip()
+        if sentence:
+            sentences.append(sentence)
+        sentence_start = match.end()
+    tail = text[sentence_start:].strip()
+    if tail:
+        sentences.append(tail)
     return sentences
 
 
@@ -151,6 +157,7 @@ def _split_entry_by_sentences(
 
 
 def _expand_entries(subtitles: Iterable[SubtitleEntry]) -> list[tuple[SubtitleEntry, bool]]:
+    """원본을 건드리지 않는 새 엔트리 목록으로 펼친다 (반환 엔트리는 호출자 소유)."""
     expanded: list[tuple[SubtitleEntry, bool]] = []
     for entry in subtitles:
         timestamp_split = _split_embedded_timestamps(entry)
@@ -183,25 +190,42 @@ def reflow_subtitles(subtitles: list[SubtitleEntry]) -> list[SubtitleEntry]:
         return []
 
     result_entries: list[SubtitleEntry] = []
-    current_buffer = expanded_entries[0][0].clone()
+    current_buffer = expanded_entries[0][0]
+    # 병합할 조각은 모아 두었다가 버퍼를 내보낼 때 한 번만 join한다 (반복 문자열 연결 방지).
+    buffer_parts: list[str] = []
+    first_text = current_buffer.text.strip()
+    if first_text:
+        buffer_parts.append(first_text)
+    buffer_merged = False
 
     for next_entry, next_has_hard_boundary in expanded_entries[1:]:
-        buffer_text = current_buffer.text.strip()
         if (
-            buffer_text.endswith(_MERGE_ENDERS)
+            # buffer_parts는 비어 있지 않은 strip 조각만 담으므로 마지막 글자만 보면 된다.
+            (buffer_parts and buffer_parts[-1][-1] in _MERGE_ENDERS)
             or next_has_hard_boundary
             or not _can_merge_entries(
             current_buffer, next_entry
             )
         ):
+            if buffer_merged:
+                current_buffer.update_text(" ".join(buffer_parts))
             result_entries.append(current_buffer)
-            current_buffer = next_entry.clone()
+            current_buffer = next_entry
+            buffer_parts = []
+            next_text = next_entry.text.strip()
+            if next_text:
+                buffer_parts.append(next_text)
+            buffer_merged = False
             continue
 
-        merged_text = f"{buffer_text} {next_entry.text.strip()}".strip()
-        current_buffer.update_text(merged_text)
+        next_text = next_entry.text.strip()
+        if next_text:
+            buffer_parts.append(next_text)
+        buffer_merged = True
         current_buffer.end_time = next_entry.end_time
 
+    if buffer_merged:
+        current_buffer.update_text(" ".join(buffer_parts))
     if current_buffer.text.strip():
         result_entries.append(current_buffer)
 
@@ -25,14 +25,18 @@ def _apply_confirmed_segments(
     if max_length > 0 and normalized_segments:
         total_length = sum(len(segment) for segment in normalized_segments)
         trim = total_length - max_length
-        while trim > 0 and normalized_segments:
-            first = normalized_segments[0]
-            if len(first) <= trim:
-                trim -= len(first)
-                normalized_segments.pop(0)
-                continue
-            normalized_segments[0] = first[trim:]
-            trim = 0
+        if trim > 0:
+            # 앞에서 버릴 segment 수를 먼저 센 뒤 한 번에 잘라 pop(0) 반복 이동을 피한다.
+            drop_count = 0
+            while drop_count < len(normalized_segments):
+                first_length = len(normalized_segments[drop_count])
+                if first_length > trim:
+                    break
+                trim -= first_length
+                drop_count += 1
+            normalized_segments = normalized_segments[drop_count:]
+            if trim > 0 and normalized_segments:
+                normalized_segments[0] = normalized_segments[0][trim:]
 
     state.confirmed_segments = normalized_segments
     state.confirmed_compact = "".join(normalized_segments)
@@ -101,10 +105,11 @@ def build_confirmed_compact_history(
         compact = entry.compact_text
         if not compact:
             continue
-        parts.insert(0, compact)
+        parts.append(compact)
         current_length += len(compact)
         if current_length >= max_length:
             break
+    parts.reverse()
     return "".join(parts)[-max_length:]
 
 def _resolve_merge_max_chars(settings: Optional[dict[str, int]] = None) -> int:
@@ -143,10 +148,11 @@ def rebuild_confirmed_history(
         compact = entry.compact_text
         if not compact:
             continue
-        segments.insert(0, compact)
+        segments.append(compact)
         current_length += len(compact)
         if max_length > 0 and current_length >= max_length:
             break
+    segments.reverse()
     _apply_confirmed_segments(state, segments, settings)
 
 def soft_resync_history(
@@ -7,6 +7,7 @@ from typing import Any, Optional
 from core import utils
 from core.subtitle_pipeline_impl.history import (
     _normalize_runtime_text,
+    _resolve_auto_clean_newlines,
     build_recent_compact_history,
 )
 from core.subtitle_pipeline_impl.types import (
@@ -18,6 +19,12 @@ from core.subtitle_pipeline_impl.types import (
 )
 
 
+# 직전 추출의 (입력 키, 결과). 같은 프레임이 반복 폴링될 때 재계산을 건너뛴다.
+_last_recent_history_extraction: (
+    tuple[tuple[str, str, str, bool], IncrementalExtractResult] | None
+) = None
+
+
 def _slice_from_compact_index(text: str, compact_index: int) -> str:
     return utils.clean_text_display(utils.slice_from_compact_index(text, compact_index))
 
@@ -26,11 +33,12 @@ def find_compact_suffix_prefix_overlap(
     raw_compact: str,
     min_overlap: int = MIN_COMPACT_ANCHOR,
 ) -> int:
-    max_overlap = min(len(history_compact), len(raw_compact))
-    for length in range(max_overlap, min_overlap - 1, -1):
-        if history_compact[-length:] == raw_compact[:length]:
-            return length
-    return 0
+    return utils.find_compact_suffix_prefix_overlap(
+        history_compact,
+        raw_compact,
+        min_overlap=min_overlap,
+        max_overlap=min(len(history_compact), len(raw_compact)),
+    )
 
 def extract_incremental_text_from_history(
     raw_text: str,
@@ -106,6 +114,36 @@ def extract_incremental_text_with_recent_history(
     history_compact: str,
     recent_history_compact: str,
     settings: Optional[dict[str, Any]] = None,
+) -> IncrementalExtractResult:
+    """결과는 입력에만 의존하므로, 화면이 그대로인 동안의 반복 호출은 직전 결과를 재사용한다.
+
+    IncrementalExtractResult는 frozen이라 재사용된 인스턴스를 호출자가 바꿀 수 없다.
+    """
+    global _last_recent_history_extraction
+    cache_key = (
+        raw_text,
+        history_compact,
+        recent_history_compact,
+        _resolve_auto_clean_newlines(settings),
+    )
+    cached = _last_recent_history_extraction
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    result = _extract_incremental_text_with_recent_history(
+        raw_text,
+        history_compact,
+        recent_history_compact,
+        settings,
+    )
+    _last_recent_history_extraction = (cache_key, result)
+    return result
+
+def _extract_incremental_text_with_recent_history(
+    raw_text: str,
+    history_compact: str,
+    recent_history_compact: str,
+    settings: Optional[dict[str, Any]] = None,
 ) -> IncrementalExtractResult:
     recent_history = utils.compact_subtitle_text(recent_history_compact)
     full_history = utils.compact_subtitle_text(history_compact)
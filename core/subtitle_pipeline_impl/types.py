@@ -42,7 +42,7 @@ class PipelineResult:
     updated_entry: Optional[SubtitleEntry] = None
     reason: str = ""
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class IncrementalExtractResult:
     text: str
     matched: bool
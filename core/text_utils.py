@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from collections import Counter
 import json
 import os
 import re
@@ -9,24 +10,39 @@ from pathlib import Path
 from typing import List, Optional, Union
 from core.config import Config
 
+_UNSAFE_FILENAME_PATTERN = re.compile(r'[\\/*?:"<>|]')
+# 자주 호출되는 정리 함수에서 Config 속성 조회를 피하기 위한 모듈 수준 바인딩
+_RE_YEAR = Config.RE_YEAR
+_RE_MULTI_SPACE = Config.RE_MULTI_SPACE
+_RE_MEANINGFUL_CHAR = Config.RE_MEANINGFUL_CHAR
+_ZERO_WIDTH_TRANSLATION = Config.ZERO_WIDTH_TRANSLATION
+_MAX_WORD_DIFF_OVERLAP = Config.MAX_WORD_DIFF_OVERLAP
+
+def _strip_zero_width(text: str) -> str:
+    """Zero-width 문자가 있을 때만 제거한다 (한글 텍스트에서 str.translate는 비싸므로 포함 검사로 먼저 거른다)."""
+    if "\u200b" in text or "\u200c" in text or "\u200d" in text or "\ufeff" in text:
+        return text.translate(_ZERO_WIDTH_TRANSLATION)
+    return text
+
 def clean_text(text: str) -> str:
     """자막 텍스트 정리 (성능 최적화: 사전 컴파일된 정규식 사용)"""
     if not text:
         return ""
-    # 년도 제거
-    text = Config.RE_YEAR.sub('', text)
+    # 년도 제거 ('년'이 없는 대부분의 자막은 정규식 스캔을 건너뛴다)
+    if '년' in text:
+        text = _RE_YEAR.sub('', text)
     # 특수 문자 정리 (Zero-width 문자 제거)
-    text = Config.RE_ZERO_WIDTH.sub('', text)
-    # 연속 공백 정리
-    text = Config.RE_MULTI_SPACE.sub(' ', text)
-    return text.strip()
+    text = _strip_zero_width(text)
+    # 연속 공백 정리 (str.split은 정규식 \s와 같은 공백 집합을 사용한다)
+    return ' '.join(text.split())
 
 def clean_text_display(text: str) -> str:
     """표시/저장용 텍스트 정리 (공백 유지)"""
     if not text:
         return ""
-    text = Config.RE_YEAR.sub('', text)
-    text = Config.RE_ZERO_WIDTH.sub('', text)
+    if '년' in text:
+        text = _RE_YEAR.sub('', text)
+    text = _strip_zero_width(text)
     return text.strip()
 
 def flatten_subtitle_text(text: str) -> str:
@@ -35,26 +51,20 @@ def flatten_subtitle_text(text: str) -> str:
     if not cleaned:
         return ""
 
-    normalized = cleaned.replace("\r\n", "\n").replace("\r", "\n")
-    parts = [
-        Config.RE_MULTI_SPACE.sub(" ", line).strip()
-        for line in normalized.split("\n")
-    ]
-    flattened = " ".join(part for part in parts if part)
-    return Config.RE_MULTI_SPACE.sub(" ", flattened).strip()
+    # 줄바꿈도 공백 문자이므로 한 번의 split/join으로 빈 줄 제거와 공백 정리를 함께 처리한다.
+    return " ".join(cleaned.split())
 
 def normalize_subtitle_text(text: str) -> str:
     """자막 비교용 정규화 (공백 정리)"""
     if not text:
         return ""
-    return Config.RE_MULTI_SPACE.sub(' ', text).strip()
+    return ' '.join(text.split())
 
 def compact_subtitle_text(text: str) -> str:
     """겹침/중복 판별용 정규화 (공백 제거 + zero-width 제거)"""
     if not text:
         return ""
-    text = Config.RE_ZERO_WIDTH.sub('', text)
-    return Config.RE_MULTI_SPACE.sub('', text).strip()
+    return ''.join(_strip_zero_width(text).split())
 
 def is_meaningful_subtitle_text(text: str) -> bool:
     """자막으로 볼 수 있는 유의미 텍스트인지 판별한다.
@@ -70,16 +80,8 @@ def is_meaningful_subtitle_text(text: str) -> bool:
     if not normalized:
         return False
 
-    if re.search(r"[가-힣A-Za-z]", normalized):
-        return True
-
-    if re.fullmatch(r"[\d\s.,:;+\-*/()%]+", normalized):
-        return False
-
-    if re.fullmatch(r"[\W_]+", normalized, flags=re.UNICODE):
-        return False
-
-    return False
+    # 순수 숫자/기호는 한글/영문이 없으므로 여기서 함께 제외된다.
+    return _RE_MEANINGFUL_CHAR.search(normalized) is not None
 
 def slice_from_compact_index(text: str, compact_index: int) -> str:
     """compact 인덱스(공백 제거 기준) 위치부터 원문 슬라이스를 반환"""
@@ -88,14 +90,18 @@ def slice_from_compact_index(text: str, compact_index: int) -> str:
     if compact_index <= 0:
         return text
 
-    text = Config.RE_ZERO_WIDTH.sub('', text)
-    count = 0
-    for i, ch in enumerate(text):
-        if ch.isspace():
-            continue
-        if count >= compact_index:
-            return text[i:]
-        count += 1
+    text = _strip_zero_width(text)
+    # 문자 단위 isspace 루프 대신 공백 구간 단위로 건너뛰며 compact 인덱스를 센다.
+    consumed = 0
+    segment_start = 0
+    for match in _RE_MULTI_SPACE.finditer(text):
+        segment_length = match.start() - segment_start
+        if consumed + segment_length > compact_index:
+            return text[segment_start + compact_index - consumed:]
+        consumed += segment_length
+        segment_start = match.end()
+    if consumed + len(text) - segment_start > compact_index:
+        return text[segment_start + compact_index - consumed:]
     return ""
 
 def find_compact_suffix_prefix_overlap(
@@ -106,17 +112,35 @@ def find_compact_suffix_prefix_overlap(
 ) -> int:
     """last_compact의 suffix와 text_compact의 prefix가 겹치는 최대 길이(공백 무시)를 반환"""
     if max_overlap is None:
-        max_overlap = Config.MAX_WORD_DIFF_OVERLAP  # 성능 최적화 (#1)
+        max_overlap = _MAX_WORD_DIFF_OVERLAP  # 성능 최적화 (#1)
     if not last_compact or not text_compact:
         return 0
     max_possible = min(len(last_compact), len(text_compact), max_overlap)
-    for overlap_len in range(max_possible, min_overlap - 1, -1):
-        if last_compact.endswith(text_compact[:overlap_len]):
+    if max_possible < min_overlap:
+        return 0
+    # 길이별 endswith 반복 대신 text_compact 앞부분(anchor)이 나타나는 위치만
+    # C 구현 find로 찾아 검증한다. 왼쪽 위치부터 보므로 처음 맞는 후보가 최대 겹침이다.
+    last_len = len(last_compact)
+    anchor = text_compact[:max(1, min_overlap)]
+    pos = last_compact.find(anchor, last_len - max_possible)
+    while pos != -1:
+        overlap_len = last_len - pos
+        if text_compact.startswith(last_compact[pos:]):
             return overlap_len
+        pos = last_compact.find(anchor, pos + 1)
     return 0
 
 def is_redundant_text(candidate: str, last_text: str) -> bool:
     """이미 확정된 자막과 중복/포함 관계인지 판단"""
+    return _is_redundant_text_with_compacts(candidate, last_text, None, None)
+
+def _is_redundant_text_with_compacts(
+    candidate: str,
+    last_text: str,
+    cand_compact: Optional[str],
+    last_compact: Optional[str],
+) -> bool:
+    """is_redundant_text 본체. 호출자가 이미 구한 compact 문자열이 있으면 재사용한다."""
     cand_norm = normalize_subtitle_text(candidate)
     last_norm = normalize_subtitle_text(last_text)
     if not cand_norm or not last_norm:
@@ -127,8 +151,10 @@ def is_redundant_text(candidate: str, last_text: str) -> bool:
         return True
 
     # 공백 차이(예: "국 장" vs "국장")로 인해 중복/포함 판단이 실패하는 케이스 보완
-    cand_compact = compact_subtitle_text(candidate)
-    last_compact = compact_subtitle_text(last_text)
+    if cand_compact is None:
+        cand_compact = compact_subtitle_text(candidate)
+    if last_compact is None:
+        last_compact = compact_subtitle_text(last_text)
     if cand_compact and last_compact:
         if cand_compact == last_compact:
             return True
@@ -148,7 +174,7 @@ def generate_filename(committee_name: str, extension: str, now: Optional[datetim
         committee_name = "국회자막"
     
     # 파일명에 사용할 수 없는 문자 제거
-    safe_committee = re.sub(r'[\\/*?:"<>|]', '', committee_name)
+    safe_committee = _UNSAFE_FILENAME_PATTERN.sub('', committee_name)
     
     # 템플릿 기반 파일명 생성
     filename = Config.DEFAULT_FILENAME_TEMPLATE.format(
@@ -159,18 +185,23 @@ def generate_filename(committee_name: str, extension: str, now: Optional[datetim
     
     return f"{filename}.{extension}"
 
+def format_hms(ts: datetime) -> str:
+    """HH:MM:SS 문자열 생성 (고정 포맷이라 strftime 대신 필드를 직접 포맷)"""
+    return f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+
 def is_similar_subtitle(text1: str, text2: str, threshold: float = 0.9) -> bool:
-    """두 자막이 유사한지 판단 (Jaccard 유사도)"""
+    """두 자막이 유사한지 판단 (문자 다중집합 Jaccard 유사도)"""
     norm1 = compact_subtitle_text(text1)
     norm2 = compact_subtitle_text(text2)
     
     if norm1 == norm2:
         return True
     
-    # 문자 단위 Jaccard 유사도
-    set1, set2 = set(norm1), set(norm2)
-    intersection = len(set1 & set2)
-    union = len(set1 | set2)
+    # 같은 음절이 반복되는 한국어 자막에서 set은 반복을 지워 유사도를 부풀리므로
+    # 문자별 등장 횟수(Counter, C 구현 집계)로 교집합/합집합 크기를 구한다.
+    counts1, counts2 = Counter(norm1), Counter(norm2)
+    intersection = sum((counts1 & counts2).values())
+    union = sum((counts1 | counts2).values())
     
     return (intersection / union) >= threshold if union > 0 else False
 
@@ -210,11 +241,44 @@ def find_list_overlap(existing: list[str], new_items: list[str]) -> int:
     """기존 리스트의 끝부분과 새 리스트의 앞부분이 겹치는 길이를 반환"""
     if not existing or not new_items:
         return 0
-    max_check = min(len(existing), len(new_items))
-    for i in range(max_check, 0, -1):
-        if existing[-i:] == new_items[:i]:
-            return i
-    return 0
+    existing_len = len(existing)
+    max_check = min(existing_len, len(new_items))
+    # 겹침은 new_items[0]과 같은 단어에서만 시작할 수 있으므로 그 위치만 C 구현 index로
+    # 찾아 검증한다. 왼쪽 후보부터 보므로 처음 맞는 후보가 최대 겹침이다.
+    first = new_items[0]
+    start = existing_len - max_check
+    while True:
+        try:
+            pos = existing.index(first, start)
+        except ValueError:
+            return 0
+        overlap = existing_len - pos
+        if existing[pos:] == new_items[:overlap]:
+            return overlap
+        start = pos + 1
+
+def _find_longest_suffix_match(
+    last_compact: str,
+    new_compact: str,
+    min_len: int = 10,
+    max_len: int = 100,
+) -> tuple[int, int]:
+    """last_compact의 가장 긴 suffix가 new_compact에 마지막으로 나타나는 (위치, 길이)를 반환
+
+    길이 L의 suffix가 포함되면 더 짧은 suffix도 항상 포함되므로, 길이를 하나씩
+    줄여 가며 rfind하는 대신 이분 탐색으로 최장 길이를 찾는다. 실패 시 (-1, 0).
+    """
+    high = min(max_len, len(last_compact))
+    if high < min_len or last_compact[-min_len:] not in new_compact:
+        return -1, 0
+    low = min_len
+    while low < high:
+        mid = (low + high + 1) // 2
+        if last_compact[-mid:] in new_compact:
+            low = mid
+        else:
+            high = mid - 1
+    return new_compact.rfind(last_compact[-low:]), low
 
 def _find_match_with_window(last_compact: str, new_compact: str, window_size: int = 20) -> int:
     """
@@ -262,12 +326,18 @@ def get_word_diff(last_text: str, new_text: str) -> str:
         return new_text
     if not new_text:
         return ""
+    # 같은 DOM 텍스트가 다시 폴링된 경우 정리/비교 작업 없이 바로 끝낸다.
+    if new_text == last_text:
+        return ""
         
     last_text = clean_text_display(last_text)
     new_text = clean_text_display(new_text)
+    # compact 문자열은 중복 판단과 5~7단계에서 함께 쓰므로 한 번만 계산한다.
+    last_compact = compact_subtitle_text(last_text)
+    new_compact = compact_subtitle_text(new_text)
 
     # 1. 완전 중복 또는 포함 관계면 빈 문자열 (Flicker 방지)
-    if is_redundant_text(new_text, last_text):
+    if _is_redundant_text_with_compacts(new_text, last_text, new_compact, last_compact):
         return ""
 
     # 2. 단순 텍스트 확장 (가장 빠름)
@@ -304,9 +374,6 @@ def get_word_diff(last_text: str, new_text: str) -> str:
 
     # 5. [NEW] compact 기반 rfind 매칭 - 공백 무시하고 포함 관계 감지
     # 예: last="A B C", new="X A  B  C D E" (공백 다름) -> delta="D E"
-    last_compact = compact_subtitle_text(last_text)
-    new_compact = compact_subtitle_text(new_text)
-    
     if last_compact and new_compact and last_compact in new_compact:
         # compact 기준으로 마지막 위치 찾기
         compact_pos = new_compact.rfind(last_compact)
@@ -324,23 +391,17 @@ def get_word_diff(last_text: str, new_text: str) -> str:
     # -> 공통 suffix "입장을계속얘기하는데" 이후 "그러다 보니까"만 반환
     if last_compact and new_compact and len(last_compact) >= 10:
         # last_compact의 suffix를 new_compact에서 찾기 (최소 10자~최대 100자)
-        for suffix_len in range(min(100, len(last_compact)), 9, -1):
-            suffix = last_compact[-suffix_len:]
-            pos = new_compact.rfind(suffix)
-            if pos >= 0:
-                # suffix 이후의 텍스트 추출
-                delta = slice_from_compact_index(new_text, pos + suffix_len)
-                if delta:
-                    return delta.strip()
-                return ""
+        pos, suffix_len = _find_longest_suffix_match(last_compact, new_compact, 10, 100)
+        if pos >= 0:
+            # suffix 이후의 텍스트 추출
+            delta = slice_from_compact_index(new_text, pos + suffix_len)
+            if delta:
+                return delta.strip()
+            return ""
     
-    # 7. 슬라이딩 윈도우 감지 - 앞부분이 탈락하고 뒷부분이 유지되는 케이스
-    # 예: last="A B C D", new="C D E F" -> delta="E F"
-    overlap_len = find_compact_suffix_prefix_overlap(last_compact, new_compact, min_overlap=10)
-    if overlap_len > 0:
-        # 겹치는 부분 이후만 반환
-        delta = slice_from_compact_index(new_text, overlap_len)
-        return delta.strip() if delta else ""
+    # 슬라이딩 윈도우(last의 suffix == new의 prefix, 10자 이상)는 6단계가 이미 포괄한다:
+    # 길이 10 이상의 suffix가 new_compact 어딘가에 있으면 6단계에서 반환되므로
+    # 여기까지 왔다면 suffix-prefix 겹침도 존재하지 않는다. 중복 탐색을 하지 않는다.
 
     # 7. [NEW] 역방향 윈도우 매칭 (Reverse Window Matching)
     # 중간 내용이 수정되었거나(오타 등), 앞부분이 잘려나간 경우에도 대응
@@ -8,6 +8,8 @@ from core.file_io import (
     atomic_write_text,
     atomic_write_text_via_writer,
     iter_serialized_subtitles,
+    json_loads,
+    load_json_file,
     next_available_path,
 )
 from core.reflow import reflow_subtitles
@@ -17,6 +19,7 @@ from core.text_utils import (
     clean_text_display,
     compact_subtitle_text,
     flatten_subtitle_text,
+    format_hms,
     find_compact_suffix_prefix_overlap,
     find_list_overlap,
     generate_filename,
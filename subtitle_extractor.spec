@@ -30,7 +30,9 @@ def _load_version_from_readme(default: str = "16.14.8") -> str:
     spec_path = Path(globals().get("__file__", "subtitle_extractor.spec")).resolve()
     readme_path = spec_path.parent / "README.md"
     try:
-        first_line = readme_path.read_text(encoding="utf-8").splitlines()[0]
+        # 버전은 첫 줄에만 있으므로 README 전체 대신 첫 줄만 읽는다.
+        with readme_path.open(encoding="utf-8") as handle:
+            first_line = handle.readline()
     except Exception:
         return default
     match = re.search(r"\bv(\d+(?:\.\d+)*)", first_line, re.IGNORECASE)
@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+import subprocess
+import sys
+
+import pytest
 
 
 def test_legacy_import_paths_still_work():
@@ -17,3 +21,24 @@ def test_legacy_import_paths_still_work():
     assert hasattr(ui_mod, "QMessageBox")
     assert callable(utils.atomic_write_text)
     assert callable(utils.reflow_subtitles)
+
+
+@pytest.mark.requires_subprocess
+def test_main_window_import_defers_selenium_webdriver_until_first_access():
+    script = (
+        "import sys\n"
+        "import ui.main_window as mw\n"
+        "assert 'selenium.webdriver.support.ui' not in sys.modules\n"
+        "assert mw.WebDriverWait.__name__ == 'WebDriverWait'\n"
+        "assert 'selenium.webdriver.support.ui' in sys.modules\n"
+        "import ui.main_window_capture as capture_mod\n"
+        "assert capture_mod.Options.__name__ == 'Options'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=False,
+        capture_output=True,
+        encoding="utf-8",
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -1,5 +1,6 @@
 import threading
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
@@ -64,7 +65,7 @@ def test_database_search_reraises_unexpected_connection_errors(tmp_path, monkeyp
         def fail_connection():
             raise sqlite3.OperationalError("search boom")
 
-        monkeypatch.setattr(db, "_get_connection", fail_connection)
+        monkeypatch.setattr(db, "_conn", fail_connection)
 
         with pytest.raises(sqlite3.OperationalError, match="search boom"):
             db.search_subtitles("정상")
@@ -88,8 +89,12 @@ def test_database_read_methods_reraise_unexpected_cursor_errors(tmp_path, monkey
 
     broken = _BrokenConnection()
 
+    @contextmanager
+    def broken_conn():
+        yield broken
+
     try:
-        monkeypatch.setattr(db, "_get_connection", lambda: broken)
+        monkeypatch.setattr(db, "_conn", broken_conn)
 
         with pytest.raises(sqlite3.OperationalError, match="cursor boom"):
             db.load_session(1)
@@ -104,31 +109,45 @@ def test_database_read_methods_reraise_unexpected_cursor_errors(tmp_path, monkey
         db.close_all()
 
 
-def test_database_cleans_stale_thread_connections(tmp_path):
+def test_database_connection_pool_stays_bounded(tmp_path):
     db_path = tmp_path / "subtitle_history.db"
     db = DatabaseManager(str(db_path))
-    worker_id_holder = {}
+    barrier = threading.Barrier(DatabaseManager.CONNECTION_POOL_MAX + 4)
 
     try:
         def worker():
+            with db._conn():
+                barrier.wait(timeout=5)
             db.list_sessions(limit=10)
-            worker_id_holder["id"] = threading.get_ident()
-
-        t = threading.Thread(target=worker)
-        t.start()
-        t.join()
 
-        # main thread 접근으로 stale 연결 정리 트리거
-        db.list_sessions(limit=10)
+        threads = [threading.Thread(target=worker) for _ in range(barrier.parties)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
 
-        alive_ids = {th.ident for th in threading.enumerate() if th.ident is not None}
-        assert all(tid in alive_ids for tid in db._thread_connections.keys())
+        # 동시에 빌려간 연결이 상한보다 많아도 반납 후에는 상한까지만 남는다.
+        assert len(db._pool) == DatabaseManager.CONNECTION_POOL_MAX
 
-        worker_id = worker_id_holder.get("id")
-        if worker_id and worker_id != threading.get_ident():
-            assert worker_id not in db._thread_connections
+        # 같은 스레드의 연속 작업은 방금 반납한 연결을 다시 쓴다 (LIFO).
+        with db._conn() as first:
+            pass
+        with db._conn() as second:
+            assert second is first
     finally:
         db.close_all()
+    assert db._pool == []
+
+
+def test_database_close_all_closes_connection_returned_after_close(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    with db._conn() as borrowed:
+        # 잠금 없이 진행 중인 읽기가 끝나기 전에 close_all이 실행되는 경우
+        db.close_all()
+
+    assert db._pool == []
+    with pytest.raises(sqlite3.ProgrammingError):
+        borrowed.execute("SELECT 1")
 
 
 def test_database_checkpoint_accepts_only_known_modes(tmp_path):
@@ -494,12 +513,12 @@ def test_database_list_sessions_orders_same_created_at_by_id_desc(tmp_path):
                 "version": "test",
             }
         )
-        conn = db._get_connection()
-        conn.execute(
-            "UPDATE sessions SET created_at = ? WHERE id IN (?, ?)",
-            ("2026-04-27 10:00:00", first_id, second_id),
-        )
-        conn.commit()
+        with db._conn() as conn:
+            conn.execute(
+                "UPDATE sessions SET created_at = ? WHERE id IN (?, ?)",
+                ("2026-04-27 10:00:00", first_id, second_id),
+            )
+            conn.commit()
 
         listed = db.list_sessions(limit=2, offset=0)
 
@@ -720,3 +739,310 @@ def test_database_rebuilds_fts_when_row_counts_drift(tmp_path):
         ]
     finally:
         reopened.close_all()
+
+
+def test_database_save_session_indexes_fts_in_bulk_and_restores_trigger(tmp_path, monkeypatch):
+    db_path = tmp_path / "subtitle_history.db"
+    db = DatabaseManager(str(db_path))
+    monkeypatch.setattr(DatabaseManager, "INSERT_BATCH_SIZE", 2)
+
+    def failing_subtitles():
+        for index in range(3):
+            yield SubtitleEntry(f"롤백될 자막 {index}")
+        raise RuntimeError("boom")
+
+    try:
+        db.save_session(
+            {
+                "url": "https://example.com/live",
+                "committee_name": "테스트위원회",
+                "subtitles": [SubtitleEntry(f"대량 색인 자막 {index}") for index in range(5)],
+                "duration_seconds": 3,
+                "version": "test",
+            }
+        )
+        with pytest.raises(RuntimeError, match="boom"):
+            db.save_session({"subtitles": failing_subtitles()})
+
+        assert len(db.search_subtitles("대량 색인", syntax="fts")) == 5
+        assert db.search_subtitles("롤백될") == []
+    finally:
+        db.close_all()
+
+    with sqlite3.connect(db_path) as conn:
+        trigger = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'subtitles_ai'"
+        ).fetchone()
+        fts_count = conn.execute("SELECT COUNT(*) FROM subtitles_fts").fetchone()[0]
+    assert trigger is not None
+    assert fts_count == 5
+
+
+def test_database_small_save_session_keeps_fts_trigger_without_ddl(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    statements: list[str] = []
+    try:
+        with db._conn() as conn:
+            conn.set_trace_callback(statements.append)
+        db.save_session({"subtitles": [SubtitleEntry(f"소량 자막 {index}") for index in range(3)]})
+        conn.set_trace_callback(None)
+
+        assert len(db.search_subtitles("소량", syntax="fts")) == 3
+    finally:
+        db.close_all()
+
+    normalized = [statement.strip().upper() for statement in statements]
+    assert not any("DROP TRIGGER" in statement for statement in normalized)
+    assert not any("CREATE TRIGGER" in statement for statement in normalized)
+
+
+def test_database_save_session_runs_in_explicit_immediate_transaction(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    statements: list[str] = []
+    try:
+        with db._conn() as conn:
+            conn.set_trace_callback(statements.append)
+        db.save_session({"subtitles": [SubtitleEntry("즉시 트랜잭션 자막")]})
+        conn.set_trace_callback(None)
+    finally:
+        db.close_all()
+
+    normalized = [statement.strip().upper() for statement in statements]
+    assert normalized[0] == "BEGIN IMMEDIATE"
+    assert normalized.count("COMMIT") == 1
+    assert not any(statement == "BEGIN" for statement in normalized)
+
+
+def test_database_reads_do_not_wait_for_write_lock(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    db.save_session({"committee_name": "읽기위원회", "subtitles": [SubtitleEntry("동시 조회 자막")]})
+    writer_holding = threading.Event()
+    release_writer = threading.Event()
+
+    def hold_write_lock():
+        with db.write_lock:
+            writer_holding.set()
+            release_writer.wait(timeout=5)
+
+    writer = threading.Thread(target=hold_write_lock)
+    writer.start()
+    try:
+        assert writer_holding.wait(timeout=5)
+        sessions: list[dict] = []
+        search_rows: list[dict] = []
+        stats: dict = {}
+
+        def reader():
+            sessions.extend(db.list_sessions(limit=10))
+            search_rows.extend(db.search_subtitles("동시 조회"))
+            stats.update(db.get_statistics())
+
+        reader_thread = threading.Thread(target=reader)
+        reader_thread.start()
+        reader_thread.join(timeout=5)
+
+        assert not reader_thread.is_alive()
+        assert [row["committee_name"] for row in sessions] == ["읽기위원회"]
+        assert [row["text"] for row in search_rows] == ["동시 조회 자막"]
+        assert stats["total_sessions"] == 1
+    finally:
+        release_writer.set()
+        writer.join()
+        db.close_all()
+
+
+def test_database_fts_search_drives_from_fts_hits_without_rank(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    statements: list[str] = []
+    try:
+        db.save_session(
+            {
+                "committee_name": "검색위원회",
+                "subtitles": [
+                    SubtitleEntry("예산 심사 시작"),
+                    SubtitleEntry("무관한 자막"),
+                    SubtitleEntry("예산 심사 계속"),
+                ],
+            }
+        )
+        with db._conn() as conn:
+            conn.set_trace_callback(statements.append)
+        results = db.search_subtitles("예산 심사", syntax="fts")
+        conn.set_trace_callback(None)
+    finally:
+        db.close_all()
+
+    assert [row["text"] for row in results] == ["예산 심사 시작", "예산 심사 계속"]
+    fts_sql = next(statement for statement in statements if "subtitles_fts" in statement)
+    assert "WITH fts_hits" in fts_sql
+    assert "rank" not in fts_sql
+
+
+def test_database_drops_legacy_subtitle_text_index(tmp_path):
+    db_path = tmp_path / "subtitle_history.db"
+    DatabaseManager(str(db_path)).close_all()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE INDEX idx_subtitles_text ON subtitles(text)")
+
+    db = DatabaseManager(str(db_path))
+    try:
+        with sqlite3.connect(db_path) as conn:
+            index_names = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'subtitles'"
+                ).fetchall()
+            }
+        assert "idx_subtitles_text" not in index_names
+        assert "idx_subtitles_session_sequence" in index_names
+    finally:
+        db.close_all()
+
+
+def test_database_connection_applies_cache_and_mmap_pragmas(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    try:
+        with db._conn() as conn:
+            cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+            mmap_size = conn.execute("PRAGMA mmap_size").fetchone()
+        assert cache_size == -DatabaseManager.CONNECTION_CACHE_SIZE_KIB
+        # SQLite 빌드에 따라 mmap이 꺼져 있거나(None/0) 컴파일 상한으로 잘릴 수 있다.
+        assert mmap_size is None or mmap_size[0] <= DatabaseManager.CONNECTION_MMAP_SIZE_BYTES
+    finally:
+        db.close_all()
+
+
+def test_database_optimize_runs_from_maybe_optimize_with_interval(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    statements: list[str] = []
+    try:
+        with db._conn() as conn:
+            conn.set_trace_callback(statements.append)
+
+        assert db.maybe_optimize() is True
+        assert db.maybe_optimize() is False
+
+        db._last_optimize_at = -DatabaseManager.OPTIMIZE_INTERVAL_SECONDS
+        assert db.maybe_optimize() is True
+        conn.set_trace_callback(None)
+    finally:
+        db.close_all()
+
+    optimize_calls = [statement for statement in statements if "optimize" in statement]
+    assert optimize_calls == ["PRAGMA optimize(0x10002)"] * 2
+    assert f"PRAGMA analysis_limit = {DatabaseManager.OPTIMIZE_ANALYSIS_LIMIT}" in statements
+
+
+def test_database_statistics_follow_maintained_session_counters(tmp_path):
+    db_path = tmp_path / "subtitle_history.db"
+    db = DatabaseManager(str(db_path))
+    try:
+        first_id = db.save_session(
+            {"subtitles": [SubtitleEntry("첫 자막"), SubtitleEntry("둘째")], "duration_seconds": 3600}
+        )
+        db.save_session({"subtitles": [SubtitleEntry("셋째 자막")], "duration_seconds": 1800})
+        assert db.get_statistics() == {
+            "total_sessions": 2,
+            "total_subtitles": 3,
+            "total_characters": len("첫 자막") + len("둘째") + len("셋째 자막"),
+            "total_duration_hours": 1.5,
+        }
+
+        assert db.delete_session(first_id) is True
+        assert db.get_statistics() == {
+            "total_sessions": 1,
+            "total_subtitles": 1,
+            "total_characters": len("셋째 자막"),
+            "total_duration_hours": 0.5,
+        }
+    finally:
+        db.close_all()
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE session_stats")
+
+    reopened = DatabaseManager(str(db_path))
+    try:
+        assert reopened.get_statistics()["total_sessions"] == 1
+        assert reopened.get_statistics()["total_subtitles"] == 1
+    finally:
+        reopened.close_all()
+
+
+def test_database_fts_syntax_error_retries_relaxed_prefix_match_before_like(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    statements: list[str] = []
+    try:
+        db.save_session(
+            {
+                "subtitles": [
+                    SubtitleEntry("예산 심사위원회 개의"),
+                    SubtitleEntry("예산 없음"),
+                ],
+            }
+        )
+        with db._conn() as conn:
+            conn.set_trace_callback(statements.append)
+        results = db.search_subtitles('예산 "심사', syntax="fts")
+        conn.set_trace_callback(None)
+    finally:
+        db.close_all()
+
+    assert [row["text"] for row in results] == ["예산 심사위원회 개의"]
+    assert not any("LIKE" in statement for statement in statements)
+
+
+def test_database_delete_sessions_removes_batch_and_promotes_each_lineage(tmp_path):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    try:
+        ids: dict[str, list[int]] = {}
+        for lineage in ("lineage-a", "lineage-b"):
+            first_id = db.save_session(
+                {"subtitles": [SubtitleEntry(f"{lineage} 첫 버전")], "lineage_id": lineage}
+            )
+            second_id = db.save_session(
+                {
+                    "subtitles": [SubtitleEntry(f"{lineage} 둘째 버전")],
+                    "lineage_id": lineage,
+                    "parent_session_id": first_id,
+                }
+            )
+            ids[lineage] = [first_id, second_id]
+
+        deleted = db.delete_sessions(
+            [ids["lineage-a"][1], ids["lineage-b"][1], ids["lineage-b"][1], 0, "bad", 9999]
+        )
+
+        assert deleted == 2
+        remaining = {row["id"]: row for row in db.list_sessions(limit=10)}
+        assert set(remaining) == {ids["lineage-a"][0], ids["lineage-b"][0]}
+        assert all(row["is_latest_in_lineage"] == 1 for row in remaining.values())
+        assert db.delete_sessions([]) == 0
+        assert db.delete_session(9999) is False
+        assert db.get_statistics()["total_sessions"] == 2
+    finally:
+        db.close_all()
+
+
+def test_database_sanitizers_int_fast_path_matches_generic_conversion():
+    values: list[object] = [-5, 0, 1, 42, 500, 501, 10**9, True, False, "7", "-7", 3.9, None, "x"]
+    for value in values:
+        coerced: object = str(value) if type(value) is int else value
+        assert DatabaseManager._sanitize_limit(value, default=50) == DatabaseManager._sanitize_limit(coerced, default=50)
+        assert DatabaseManager._sanitize_offset(value) == DatabaseManager._sanitize_offset(coerced)
+        assert DatabaseManager._sanitize_positive_id(value) == DatabaseManager._sanitize_positive_id(coerced)
+        assert DatabaseManager._sanitize_duration(value) == DatabaseManager._sanitize_duration(coerced)
+
+
+def test_database_delete_sessions_logs_count_and_id_preview(tmp_path, caplog):
+    db = DatabaseManager(str(tmp_path / "subtitle_history.db"))
+    try:
+        ids = [db.save_session({"subtitles": [SubtitleEntry(f"삭제 로그 {index}")]}) for index in range(8)]
+        with caplog.at_level("INFO", logger="SubtitleExtractor"):
+            assert db.delete_sessions(ids) == 8
+    finally:
+        db.close_all()
+
+    message = next(record.getMessage() for record in caplog.records if "세션 삭제 완료" in record.getMessage())
+    assert "요청 8개" in message
+    assert f"ID={ids[:DatabaseManager.DELETE_LOG_ID_PREVIEW]} 외 3개" in message
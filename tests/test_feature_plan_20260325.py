@@ -345,6 +345,31 @@ def test_render_subtitles_clones_only_visible_window(monkeypatch):
     assert win._last_render_offset == 90
 
 
+def test_render_subtitles_incremental_append_and_tail_patch_match_full_render():
+    win = _build_search_window()
+    start = datetime(2026, 3, 25, 9, 0, 0)
+    win.subtitles = [
+        SubtitleEntry(f"문장 {index}", start + timedelta(seconds=index * 2))
+        for index in range(3)
+    ]
+
+    MainWindow._render_subtitles(win)
+    win.subtitles.append(SubtitleEntry("넷째 문장", start + timedelta(seconds=10)))
+    MainWindow._render_subtitles(win)
+    win.subtitles[-1].update_text("넷째 문장 보정")
+    MainWindow._render_subtitles(win)
+    incremental_text = win.subtitle_text.document().toPlainText()
+    tail_start = win._last_render_tail_start
+
+    MainWindow._render_subtitles(win, force_full=True)
+
+    assert incremental_text == win.subtitle_text.document().toPlainText()
+    assert incremental_text.endswith("\n넷째 문장 보정")
+    assert tail_start == win._last_render_tail_start
+    assert len(win._last_render_chunk_specs) == 4
+    assert sorted(win._rendered_entry_text_spans) == [0, 1, 2, 3]
+
+
 def test_complete_loaded_session_cancels_on_version_mismatch(monkeypatch):
     win, history, focus_calls = _build_session_window()
     payload = {
@@ -695,3 +720,44 @@ def test_export_stats_overwrites_existing_report_atomically(tmp_path, monkeypatc
     assert "총 문장 수: 2개" in second_raw
     assert "매우 긴 새 문장입니다" in second_raw
     assert "예전전용토큰" not in second_raw
+
+
+def test_autodetect_tag_uses_preset_index_and_refreshes_after_save(monkeypatch):
+    win = MainWindow.__new__(MainWindow)
+    win.committee_presets = {
+        "본회의": "https://assembly.webcast.go.kr/main/player.asp?xcode=10",
+        "법제사법위원회": "https://assembly.webcast.go.kr/main/player.asp?xcode=25",
+    }
+    win.custom_presets = {}
+    monkeypatch.setattr(ui_mod.utils, "atomic_write_json", lambda *_args, **_kwargs: None)
+
+    assert (
+        MainWindow._autodetect_tag(
+            win, "https://assembly.webcast.go.kr/main/player.asp?xcode=25"
+        )
+        == "법사위"
+    )
+    assert (
+        MainWindow._autodetect_tag(
+            win, "https://assembly.webcast.go.kr/main/player.asp?xcode=10&xcgcd=ABC"
+        )
+        == "본회의"
+    )
+    assert (
+        MainWindow._autodetect_tag(
+            win, "https://assembly.webcast.go.kr/main/player.asp?xcode=1"
+        )
+        == ""
+    )
+
+    win.committee_presets["정무위원회"] = (
+        "https://assembly.webcast.go.kr/main/player.asp?xcode=26"
+    )
+    MainWindow._save_committee_presets(win)
+
+    assert (
+        MainWindow._autodetect_tag(
+            win, "https://assembly.webcast.go.kr/main/player.asp?xcode=26&foo=1"
+        )
+        == "정무위"
+    )
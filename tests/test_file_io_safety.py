@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from core import utils
 
 
@@ -24,6 +26,25 @@ def test_atomic_write_json_overwrite_keeps_valid_json(tmp_path):
     assert loaded == {"new": True, "items": [1, 2, 3]}
 
 
+def test_atomic_write_json_fsyncs_only_when_durable(tmp_path, monkeypatch):
+    import core.file_io as file_io_mod
+
+    fsync_calls: list[int] = []
+    monkeypatch.setattr(file_io_mod.os, "fsync", lambda fd: fsync_calls.append(fd))
+    target = tmp_path / "url_history.json"
+
+    utils.atomic_write_json(target, {"a": 1}, durable=False)
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"a": 1}
+    assert fsync_calls == []
+
+    utils.atomic_write_json(target, {"a": 2})
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"a": 2}
+    # 파일 본문 + (POSIX) 상위 디렉터리
+    assert len(fsync_calls) == (1 if file_io_mod.os.name == "nt" else 2)
+
+
 def test_atomic_write_text_creates_file_and_parent(tmp_path):
     target = tmp_path / "nested" / "subtitle.txt"
 
@@ -61,3 +82,75 @@ def test_next_available_path_adds_numeric_suffix_without_overwriting(tmp_path):
         utils.next_available_path(target)
         == tmp_path / "backup_20260521_120000_000001_002.json"
     )
+
+
+def test_load_json_file_reads_utf8_with_stdlib_fallback(tmp_path, monkeypatch):
+    import core.file_io as file_io_mod
+
+    target = tmp_path / "session.json"
+    target.write_text('{"committee": "법제사법위원회", "items": [1, 2]}', encoding="utf-8")
+    monkeypatch.setattr(file_io_mod, "_orjson", None)
+
+    assert utils.load_json_file(target) == {"committee": "법제사법위원회", "items": [1, 2]}
+
+    target.write_text('{"broken": ', encoding="utf-8")
+    try:
+        utils.load_json_file(target)
+    except json.JSONDecodeError:
+        pass
+    else:
+        raise AssertionError("깨진 JSON은 JSONDecodeError를 발생시켜야 한다")
+
+
+def test_atomic_write_json_uses_orjson_bytes_when_available(tmp_path, monkeypatch):
+    import core.file_io as file_io_mod
+
+    dumps_calls: list[object] = []
+
+    class _FakeOrjson:
+        OPT_INDENT_2 = 1
+        OPT_NON_STR_KEYS = 2
+        OPT_PASSTHROUGH_DATETIME = 4
+        OPT_PASSTHROUGH_DATACLASS = 8
+
+        @staticmethod
+        def dumps(data, default=None, option=0):
+            dumps_calls.append(option)
+            return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+    monkeypatch.setattr(file_io_mod, "_orjson", _FakeOrjson)
+    target = tmp_path / "session.json"
+
+    utils.atomic_write_json(target, {"committee": "법제사법위원회"})
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"committee": "법제사법위원회"}
+    assert dumps_calls == [15]
+
+    # ensure_ascii 요청은 orjson이 지원하지 않으므로 표준 json 경로를 사용한다.
+    utils.atomic_write_json(target, {"committee": "법제사법위원회"}, ensure_ascii=True)
+
+    assert "\\ubc95" in target.read_text(encoding="utf-8")
+    assert dumps_calls == [15]
+
+
+def test_atomic_write_json_orjson_path_matches_json_errors_and_documented_differences(tmp_path):
+    import dataclasses
+    from datetime import datetime
+
+    pytest.importorskip("orjson")
+
+    @dataclasses.dataclass
+    class _Point:
+        x: int
+
+    target = tmp_path / "session.json"
+    target.write_text("{}", encoding="utf-8")
+    for value in ({"at": datetime(2026, 2, 12, 10, 0)}, {"point": _Point(1)}):
+        with pytest.raises(TypeError):
+            utils.atomic_write_json(target, value)
+    assert target.read_text(encoding="utf-8") == "{}"
+
+    # NaN은 null, 실수 표기는 달라질 수 있지만 다시 읽으면 같은 값이다.
+    utils.atomic_write_json(target, {"small": 1e-05, "nan": float("nan")})
+
+    assert utils.load_json_file(target) == {"small": 1e-05, "nan": None}
@@ -141,3 +141,10 @@ def test_reconcile_live_capture_bounds_ledger_and_distinguishes_frame_paths():
     assert nested_row is not None
     assert top_row.text == "top frame"
     assert nested_row.text == "nested frame"
+
+
+def test_live_capture_ledger_uses_slots():
+    ledger = create_empty_live_capture_ledger()
+
+    assert not hasattr(ledger, "__dict__")
+    assert ledger.rows == {} and ledger.order == []
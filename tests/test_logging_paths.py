@@ -1,14 +1,16 @@
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, TimedRotatingFileHandler
 from pathlib import Path
 
 from core.config import Config
-from core.logging_utils import logger
+from core.logging_utils import get_file_log_handlers, logger
 
 
 def test_logger_file_handler_uses_config_log_dir():
     log_dir = Path(Config.LOG_DIR).resolve()
-    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    file_handlers = [
+        h for h in get_file_log_handlers() if isinstance(h, logging.FileHandler)
+    ]
     assert file_handlers, "파일 핸들러가 최소 1개 있어야 합니다."
 
     for handler in file_handlers:
@@ -18,5 +20,40 @@ def test_logger_file_handler_uses_config_log_dir():
 
 def test_logger_uses_rotating_file_handler_for_long_sessions():
     assert any(
-        isinstance(handler, TimedRotatingFileHandler) for handler in logger.handlers
+        isinstance(handler, TimedRotatingFileHandler)
+        for handler in get_file_log_handlers()
     )
+
+
+def test_logger_writes_files_through_background_queue_listener():
+    assert any(isinstance(handler, QueueHandler) for handler in logger.handlers)
+    assert not any(isinstance(handler, logging.FileHandler) for handler in logger.handlers)
+
+
+def test_file_log_formatter_reuses_time_text_within_same_second(monkeypatch):
+    from core import logging_utils
+
+    formatter = logging_utils._SecondCachedFormatter(
+        "%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    strftime_calls: list[str] = []
+    real_strftime = logging_utils.time.strftime
+
+    def _counting_strftime(fmt, *args):
+        strftime_calls.append(fmt)
+        return real_strftime(fmt, *args)
+
+    monkeypatch.setattr(logging_utils.time, "strftime", _counting_strftime)
+
+    def _record(created: float) -> logging.LogRecord:
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+        record.created = created
+        return record
+
+    first = formatter.format(_record(1_700_000_000.1))
+    second = formatter.format(_record(1_700_000_000.9))
+    third = formatter.format(_record(1_700_000_001.2))
+
+    assert first == second
+    assert third != first
+    assert len(strftime_calls) == 2
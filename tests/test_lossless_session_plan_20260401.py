@@ -1394,3 +1394,56 @@ def test_save_rtf_writes_ascii_safe_unicode_and_preserves_line_breaks(tmp_path,
     assert raw.isascii()
     assert expected_text in raw
     assert "\\line " in raw
+
+
+def test_runtime_segment_search_texts_survive_entry_cache_eviction(tmp_path):
+    runtime_root = tmp_path / "runtime_search"
+    runtime_root.mkdir()
+    segment_infos = []
+    for number in range(1, 6):
+        name = f"segment_{number:06d}.json"
+        _write_runtime_entries_file(
+            runtime_root / name,
+            format_name="runtime_session_segment_v1",
+            subtitles=[SubtitleEntry(f"Segment {number}")],
+        )
+        segment_infos.append({"path": name})
+
+    win = _build_runtime_manifest_loader_window()
+    win._runtime_session_root = runtime_root
+    win.auto_clean_newlines_enabled = True
+    read_paths: list[str] = []
+    original_read = MainWindow._read_runtime_entries_file
+
+    def counting_read(path, *, source=""):
+        read_paths.append(Path(path).name)
+        return original_read(win, path, source=source)
+
+    win._read_runtime_entries_file = counting_read
+
+    first = [MainWindow._get_runtime_segment_search_texts(win, info) for info in segment_infos]
+    second = [MainWindow._get_runtime_segment_search_texts(win, info) for info in segment_infos]
+
+    assert first == second == [[f"segment {number}"] for number in range(1, 6)]
+    assert len(read_paths) == 5
+    assert len(win._runtime_segment_cache_keys) == 3
+
+
+def test_runtime_segment_search_texts_follow_clean_newlines_option(tmp_path):
+    runtime_root = tmp_path / "runtime_search_mode"
+    runtime_root.mkdir()
+    _write_runtime_entries_file(
+        runtime_root / "segment_000001.json",
+        format_name="runtime_session_segment_v1",
+        subtitles=[SubtitleEntry("First\nLine")],
+    )
+    segment_info = {"path": "segment_000001.json"}
+
+    win = _build_runtime_manifest_loader_window()
+    win._runtime_session_root = runtime_root
+    win.auto_clean_newlines_enabled = True
+
+    assert MainWindow._get_runtime_segment_search_texts(win, segment_info) == ["first line"]
+
+    win.auto_clean_newlines_enabled = False
+    assert MainWindow._get_runtime_segment_search_texts(win, segment_info) == ["first\nline"]
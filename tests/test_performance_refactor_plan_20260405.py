@@ -6,6 +6,7 @@ from typing import Callable
 import pytest
 
 from core.models import SubtitleEntry
+from ui.main_window_common import SearchMatch
 
 mw_mod = pytest.importorskip("ui.main_window")
 persistence_mod = pytest.importorskip("ui.main_window_persistence")
@@ -69,6 +70,244 @@ def test_ui_refresh_scheduler_coalesces_multiple_requests(monkeypatch):
     assert calls["stats"] == 1
 
 
+def test_ui_refresh_scheduler_defers_render_burst_to_min_interval(monkeypatch):
+    win = MainWindow.__new__(MainWindow)
+    win._use_async_ui_refresh = True
+    delays: list[int] = []
+
+    monkeypatch.setattr(
+        view_render_mod.QTimer,
+        "singleShot",
+        lambda ms, _callback: delays.append(ms),
+    )
+
+    MainWindow._schedule_ui_refresh(win, render=True)
+    win._ui_refresh_scheduled = False
+    win._last_ui_render_at = view_render_mod.time.perf_counter()
+    MainWindow._schedule_ui_refresh(win, render=True)
+    win._ui_refresh_scheduled = False
+    MainWindow._schedule_ui_refresh(win, render=True, force_full=True)
+
+    assert delays[0] == 0
+    assert 0 < delays[1] <= mw_mod.Config.UI_RENDER_MIN_INTERVAL_MS
+    assert delays[2] == 0
+
+
+def test_ui_refresh_batches_status_bar_labels_into_one_repaint():
+    class _StatusFrame:
+        def __init__(self) -> None:
+            self.updates_enabled = True
+            self.toggles: list[bool] = []
+
+        def setUpdatesEnabled(self, enabled: bool) -> None:
+            self.updates_enabled = enabled
+            self.toggles.append(enabled)
+
+    win = MainWindow.__new__(MainWindow)
+    win._use_async_ui_refresh = False
+    win.status_frame = _StatusFrame()
+    seen: list[tuple[str, bool]] = []
+    win._set_status_now = lambda _text, _kind="info": seen.append(
+        ("status", win.status_frame.updates_enabled)
+    )
+    win._update_count_label_now = lambda: seen.append(
+        ("count", win.status_frame.updates_enabled)
+    )
+
+    MainWindow._schedule_status_update(win, "saving", "running")
+
+    assert seen == [("status", True)]
+    assert win.status_frame.toggles == []
+
+    seen.clear()
+    win._pending_status_text = "saved"
+    win._pending_ui_refresh_flags = view_render_mod.UI_REFRESH_STATUS
+    MainWindow._schedule_ui_refresh(win, count=True)
+
+    assert seen == [("status", False), ("count", False)]
+    assert win.status_frame.toggles == [False, True]
+
+
+def test_ui_refresh_defers_render_while_window_is_hidden(monkeypatch):
+    class _SubtitleText:
+        def __init__(self) -> None:
+            self.visible = False
+
+        def isVisible(self) -> bool:
+            return self.visible
+
+    win = MainWindow.__new__(MainWindow)
+    win._use_async_ui_refresh = True
+    win.subtitle_text = _SubtitleText()
+    minimized = {"value": False}
+    win.isMinimized = lambda: minimized["value"]
+    renders: list[bool] = []
+    scheduled: list[Callable[[], None]] = []
+    win._render_subtitles = lambda force_full=False: renders.append(force_full)
+    monkeypatch.setattr(
+        view_render_mod.QTimer,
+        "singleShot",
+        lambda _ms, callback: scheduled.append(callback),
+    )
+
+    MainWindow._schedule_ui_refresh(win, render=True)
+    scheduled.pop()()
+
+    assert renders == []
+    assert win._render_deferred_while_hidden is True
+
+    win.subtitle_text.visible = True
+    minimized["value"] = True
+    MainWindow._resume_deferred_subtitle_render(win)
+    assert scheduled == []
+
+    minimized["value"] = False
+    MainWindow._resume_deferred_subtitle_render(win)
+    scheduled.pop()()
+
+    assert renders == [True]
+    assert win._render_deferred_while_hidden is False
+
+
+def test_update_stats_now_skips_hidden_stats_panel_until_revealed(monkeypatch):
+    class _Label:
+        def __init__(self) -> None:
+            self.value = ""
+
+        def setText(self, text: str) -> None:
+            self.value = text
+
+    class _Panel:
+        def __init__(self) -> None:
+            self.hidden = True
+
+        def isHidden(self) -> bool:
+            return self.hidden
+
+        def isVisible(self) -> bool:
+            return not self.hidden
+
+        def setVisible(self, visible: bool) -> None:
+            self.hidden = not visible
+
+    class _Widget:
+        def setText(self, _text: str) -> None:
+            return None
+
+        def setSizes(self, _sizes: list[int]) -> None:
+            return None
+
+    win = MainWindow.__new__(MainWindow)
+    for name in ("stat_time", "stat_chars", "stat_words", "stat_sents", "stat_cpm"):
+        setattr(win, name, _Label())
+    win.stats_group = _Panel()
+    win.toggle_stats_btn = _Widget()
+    win.main_splitter = _Widget()
+    win.start_time = 1.0
+    win._get_global_subtitle_count = lambda: 3
+    win._get_global_total_chars = lambda: 1200
+    win._get_global_total_words = lambda: 300
+    monkeypatch.setattr(view_render_mod.time, "time", lambda: 61.0)
+
+    MainWindow._update_stats_now(win)
+    assert win.stat_chars.value == ""
+
+    MainWindow._toggle_stats_panel(win)
+
+    assert win.stat_chars.value == "📝 글자 수: 1,200"
+    assert win.stat_cpm.value == "⚡ 분당 글자: 1200"
+
+
+def test_status_indicators_reuse_prebuilt_styles():
+    class _Label:
+        def __init__(self) -> None:
+            self._text = ""
+            self._tooltip = ""
+            self._style = ""
+            self.style_sets = 0
+
+        def text(self) -> str:
+            return self._text
+
+        def setText(self, text: str) -> None:
+            self._text = text
+
+        def toolTip(self) -> str:
+            return self._tooltip
+
+        def setToolTip(self, text: str) -> None:
+            self._tooltip = text
+
+        def styleSheet(self) -> str:
+            return self._style
+
+        def setStyleSheet(self, style: str) -> None:
+            self._style = style
+            self.style_sets += 1
+
+    win = MainWindow.__new__(MainWindow)
+    win.status_label = _Label()
+    win.connection_indicator = _Label()
+
+    MainWindow._set_status_now(win, "시작", "running")
+    MainWindow._set_status_now(win, "진행", "running")
+    MainWindow._set_status_now(win, "알 수 없음", "bogus")
+
+    assert win.status_label.text() == " 알 수 없음"
+    assert win.status_label.styleSheet() == "color: #eaeaea;"
+    assert win.status_label.style_sets == 2
+
+    MainWindow._update_connection_status(win, "disconnected")
+    assert win.connection_indicator.text() == "🔴"
+    assert win.connection_indicator.toolTip() == "연결 상태: 연결 끊김"
+    assert win.connection_indicator.styleSheet().endswith("color: #f44336;")
+
+    MainWindow._update_connection_status(win, "unknown")
+    assert win.connection_indicator.text() == "⚫"
+    assert win.connection_indicator.toolTip() == "연결 상태: 알 수 없음"
+
+
+def test_update_stats_now_only_sets_labels_whose_values_changed(monkeypatch):
+    class _Label:
+        def __init__(self) -> None:
+            self.texts: list[str] = []
+
+        def setText(self, text: str) -> None:
+            self.texts.append(text)
+
+    win = MainWindow.__new__(MainWindow)
+    for name in ("stat_time", "stat_chars", "stat_words", "stat_sents", "stat_cpm"):
+        setattr(win, name, _Label())
+    win.start_time = 1.0
+    totals = {"count": 3, "chars": 1200}
+    win._get_global_subtitle_count = lambda: totals["count"]
+    win._get_global_total_chars = lambda: totals["chars"]
+    win._get_global_total_words = lambda: 300
+    now = {"value": 61.0}
+    monkeypatch.setattr(view_render_mod.time, "time", lambda: now["value"])
+
+    MainWindow._update_stats_now(win)
+    MainWindow._update_stats_now(win)
+
+    assert len(win.stat_time.texts) == 1
+    assert len(win.stat_chars.texts) == 1
+
+    now["value"] = 121.0
+    MainWindow._update_stats_now(win)
+
+    assert win.stat_time.texts[-1] == "⏱️ 실행 시간: 00:02:00"
+    assert win.stat_cpm.texts == ["⚡ 분당 글자: 1200", "⚡ 분당 글자: 600"]
+    assert len(win.stat_chars.texts) == 1
+    assert len(win.stat_words.texts) == 1
+
+    totals["chars"] = 1800
+    MainWindow._update_stats_now(win)
+
+    assert win.stat_chars.texts[-1] == "📝 글자 수: 1,800"
+    assert len(win.stat_time.texts) == 2
+    assert len(win.stat_sents.texts) == 1
+
+
 def test_process_message_queue_schedules_followup_drain_when_backlog_remains(monkeypatch):
     win = MainWindow.__new__(MainWindow)
     win._queue_drain_scheduled = False
@@ -228,3 +467,147 @@ def test_save_txt_streams_from_runtime_segments_without_full_hydration(tmp_path,
     saved_text = target_path.read_text(encoding="utf-8-sig")
     assert "archived line" in saved_text
     assert "tail line" in saved_text
+
+
+def test_save_txt_writer_streams_rows_with_single_writelines(tmp_path, monkeypatch):
+    target_path = tmp_path / "subtitles.txt"
+    win = MainWindow.__new__(MainWindow)
+    win._generate_smart_filename = lambda ext: f"test.{ext}"
+    win._build_prepared_entries_snapshot = lambda: [SubtitleEntry("tail line")]
+    win._snapshot_runtime_stream_context = lambda: (None, [])
+    win._save_in_background = lambda save_func, path, *_args: save_func(path)
+
+    def iter_rows(prepared_entries, *, runtime_root=None, runtime_manifest=None):
+        yield prepared_entries[0].timestamp, "first", True
+        yield prepared_entries[0].timestamp, "second", False
+
+    win._iter_display_session_rows = iter_rows
+
+    class RecordingHandle:
+        def __init__(self) -> None:
+            self.write_calls = 0
+            self.writelines_calls = 0
+            self.lines: list[str] = []
+
+        def write(self, text: str) -> int:
+            self.write_calls += 1
+            self.lines.append(text)
+            return len(text)
+
+        def writelines(self, lines) -> None:
+            self.writelines_calls += 1
+            self.lines.extend(lines)
+
+    handle = RecordingHandle()
+    monkeypatch.setattr(
+        persistence_mod.utils,
+        "atomic_write_text_via_writer",
+        lambda _path, writer, **_kwargs: writer(handle),
+    )
+    monkeypatch.setattr(
+        persistence_mod.QFileDialog,
+        "getSaveFileName",
+        lambda *_args, **_kwargs: (str(target_path), "txt"),
+    )
+
+    MainWindow._save_txt(win)
+
+    assert handle.write_calls == 0
+    assert handle.writelines_calls == 1
+    assert handle.lines[0].endswith("] first\n")
+    assert handle.lines[1] == "second\n"
+
+
+def test_nav_search_reuses_rendered_spans_without_full_render():
+    win = MainWindow.__new__(MainWindow)
+    win.search_matches = [SearchMatch(0, 1, 2), SearchMatch(3, 0, 2), SearchMatch(900, 0, 2)]
+    win.search_idx = 0
+    win._rendered_entry_text_spans = {0: (0, 10), 3: (20, 30)}
+    renders: list[tuple[bool, object]] = []
+    selections: list[int] = []
+    labels: list[int | None] = []
+
+    def refresh_text(force_full: bool = False) -> None:
+        renders.append((force_full, win._search_focus_entry_index))
+        win._rendered_entry_text_spans = {900: (0, 10)}
+
+    def select_span(entry_index, char_start=None, char_length=None) -> bool:
+        if entry_index not in win._rendered_entry_text_spans:
+            return False
+        selections.append(entry_index)
+        return True
+
+    win._refresh_text = refresh_text
+    win._select_rendered_entry_span = select_span
+    win._update_search_count_label = lambda current_index=None: labels.append(current_index)
+
+    MainWindow._nav_search(win, 1)
+    assert renders == []
+    assert selections == [3]
+
+    MainWindow._nav_search(win, 1)
+    assert renders == [(True, 900)]
+    assert selections == [3, 900]
+    assert win._search_focus_entry_index is None
+    assert labels == [1, 2]
+
+
+def test_tail_search_reuses_normalized_text_until_clean_option_changes():
+    win = MainWindow.__new__(MainWindow)
+    win._runtime_segment_manifest = []
+    win._runtime_archived_count = 0
+    win.subtitle_lock = threading.Lock()
+    win.subtitles = [SubtitleEntry("Alpha beta"), SubtitleEntry("gamma ALPHA")]
+    win.auto_clean_newlines_enabled = True
+    normalized: list[str] = []
+
+    def normalize(text) -> str:
+        normalized.append(str(text))
+        return str(text)
+
+    win._normalize_subtitle_text_for_option = normalize
+
+    first, _, _ = MainWindow._search_full_session_entries(win, "alpha")
+    second, _, _ = MainWindow._search_full_session_entries(win, "beta")
+
+    assert [(m.entry_index, m.char_start) for m in first] == [(0, 0), (1, 6)]
+    assert [(m.entry_index, m.char_start) for m in second] == [(0, 6)]
+    assert normalized == ["Alpha beta", "gamma ALPHA"]
+
+    win.auto_clean_newlines_enabled = False
+    MainWindow._search_full_session_entries(win, "alpha")
+
+    assert len(normalized) == 4
+
+
+def test_tail_search_narrows_previous_matches_when_query_is_extended():
+    win = MainWindow.__new__(MainWindow)
+    win._runtime_segment_manifest = []
+    win._runtime_archived_count = 0
+    win._runtime_tail_revision = 3
+    win.subtitle_lock = threading.Lock()
+    win.subtitles = [SubtitleEntry("안녕 안녕하세요"), SubtitleEntry("안녕히 가세요")]
+    win._normalize_subtitle_text_for_option = lambda text: str(text)
+
+    first, _, _ = MainWindow._search_full_session_entries(win, "안녕")
+    assert [(m.entry_index, m.char_start) for m in first] == [(0, 0), (0, 3), (1, 0)]
+
+    scanned: list[str] = []
+    original_cache = win._tail_search_text_cache
+
+    class _TrackingCache(dict):
+        def get(self, key, default=None):
+            scanned.append(key)
+            return super().get(key, default)
+
+    win._tail_search_text_cache = _TrackingCache(original_cache)
+
+    narrowed, truncated, cancelled = MainWindow._search_full_session_entries(win, "안녕하")
+    assert [(m.entry_index, m.char_start, m.char_length) for m in narrowed] == [(0, 3, 3)]
+    assert (truncated, cancelled) == (False, False)
+    assert len(scanned) == 3
+
+    win._runtime_tail_revision += 1
+    win.subtitles[1].update_text("안녕하십니까")
+    rescanned, _, _ = MainWindow._search_full_session_entries(win, "안녕하십")
+    assert [(m.entry_index, m.char_start) for m in rescanned] == [(1, 0)]
@@ -170,3 +170,21 @@ def test_observer_reset_classifier_trusts_only_subtitle_row_or_legacy_reset():
     assert MainWindow._is_trusted_observer_reset_event(win, legacy) is True
     assert MainWindow._is_trusted_observer_reset_event(win, row_reset) is True
     assert MainWindow._is_trusted_observer_reset_event(win, broad_reset) is False
+
+
+def test_update_text_counts_appended_suffix_like_full_recount():
+    entry = SubtitleEntry("국회 본회의를")
+    _ = entry.compact_text
+
+    for new_text in (
+        "국회 본회의를 개의합니다",
+        "국회 본회의를 개의합니다.",
+        "국회 본회의를 개의합니다.\n\n의사일정",
+        "국회 본회의를 개의합니다.\n\n의사일정 제1항",
+        "다른 자막",
+    ):
+        entry.update_text(new_text)
+
+        assert entry.char_count == len(new_text)
+        assert entry.word_count == len(new_text.split())
+        assert entry.compact_text == new_text.replace(" ", "").replace("\n", "")
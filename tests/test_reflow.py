@@ -125,3 +125,67 @@ def test_reflow_does_not_merge_entries_with_different_metadata():
 
     assert len(result) == 2
     assert [item.text for item in result] == ["이어지는 문장", "다음 줄"]
+
+
+def test_reflow_merges_into_fresh_entries_without_mutating_input():
+    first = SubtitleEntry("이어지는", datetime(2026, 2, 12, 11, 0, 0))
+    second = SubtitleEntry("문장입니다.", datetime(2026, 2, 12, 11, 0, 1))
+    third = SubtitleEntry("다음 줄", datetime(2026, 2, 12, 11, 0, 2))
+
+    result = reflow_subtitles([first, second, third])
+
+    assert [item.text for item in result] == ["이어지는 문장입니다.", "다음 줄"]
+    assert [first.text, second.text, third.text] == ["이어지는", "문장입니다.", "다음 줄"]
+    assert all(item is not original for item in result for original in (first, second, third))
+    assert result[1].entry_id == third.entry_id
+
+
+def test_reflow_ignores_out_of_range_embedded_timestamps():
+    entry = SubtitleEntry(
+        "[10:00:05] 첫 줄 [24:00:00] 둘째 줄",
+        datetime(2026, 2, 12, 9, 0, 0),
+    )
+
+    result = reflow_subtitles([entry])
+
+    assert [item.text for item in result] == ["첫 줄", "둘째 줄"]
+    assert [item.timestamp for item in result] == [
+        datetime(2026, 2, 12, 10, 0, 5),
+        datetime(2026, 2, 12, 10, 0, 5),
+    ]
+
+
+def test_reflow_joins_long_merge_run_once_and_keeps_first_metadata():
+    start = datetime(2026, 2, 12, 11, 0, 0)
+    fragments = [
+        SubtitleEntry(f"조각{index}", start + timedelta(seconds=index)) for index in range(8)
+    ]
+    fragments.append(SubtitleEntry("  마무리입니다. ", start + timedelta(seconds=8)))
+
+    result = reflow_subtitles(fragments)
+
+    assert len(result) == 1
+    assert result[0].text == " ".join(f"조각{index}" for index in range(8)) + " 마무리입니다."
+    assert result[0].timestamp == start
+    assert result[0].char_count == len(result[0].text)
+
+
+def test_reflow_keeps_punctuation_only_fragment_together():
+    entry = SubtitleEntry(
+        "질문 있습니까? .. 네. 답변하겠습니다",
+        datetime(2026, 2, 12, 11, 0, 0),
+    )
+
+    result = reflow_subtitles([entry])
+
+    assert [item.text for item in result] == ["질문 있습니까?", "..", "네.", "답변하겠습니다"]
+
+
+def test_reflow_reuses_parsed_embedded_timestamp_across_entries():
+    first = SubtitleEntry("[10:00:05] 첫 발언입니다.", datetime(2026, 2, 12, 9, 0, 0))
+    second = SubtitleEntry("[10:00:05] 같은 시각 발언입니다.", datetime(2026, 2, 12, 9, 30, 0))
+
+    result = reflow_subtitles([first, second])
+
+    assert [item.timestamp for item in result] == [datetime(2026, 2, 12, 10, 0, 5)] * 2
+    assert result[0].timestamp is result[1].timestamp
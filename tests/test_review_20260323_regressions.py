@@ -197,6 +197,68 @@ def test_add_text_to_subtitles_writes_realtime_after_releasing_lock():
     assert realtime.lines == [f"[{win.subtitles[0].timestamp.strftime('%H:%M:%S')}] 첫 문장\n"]
 
 
+def test_realtime_lines_are_flushed_once_per_queue_tick():
+    win = _build_window()
+    flush_calls: list[int] = []
+
+    class _CountingRealtimeFile:
+        def __init__(self) -> None:
+            self.lines: list[str] = []
+
+        def write(self, line: str) -> None:
+            self.lines.append(line)
+
+        def flush(self) -> None:
+            flush_calls.append(len(self.lines))
+
+    realtime = _CountingRealtimeFile()
+    win.realtime_file = realtime
+
+    MainWindow._write_realtime_line(win, "첫 문장\n")
+    MainWindow._write_realtime_line(win, "둘째 문장\n")
+    assert flush_calls == []
+
+    MainWindow._flush_realtime_file(win)
+    MainWindow._flush_realtime_file(win)
+
+    assert realtime.lines == ["첫 문장\n", "둘째 문장\n"]
+    assert flush_calls == [2]
+
+
+def test_realtime_flush_waits_for_minimum_interval_between_ticks(monkeypatch):
+    import ui.main_window_impl.pipeline_stream as pipeline_stream_mod
+
+    win = _build_window()
+    flush_calls: list[int] = []
+
+    class _CountingRealtimeFile:
+        def __init__(self) -> None:
+            self.lines: list[str] = []
+
+        def write(self, line: str) -> None:
+            self.lines.append(line)
+
+        def flush(self) -> None:
+            flush_calls.append(len(self.lines))
+
+    now = {"value": 100.0}
+    monkeypatch.setattr(pipeline_stream_mod.time, "monotonic", lambda: now["value"])
+    win.realtime_file = _CountingRealtimeFile()
+
+    MainWindow._write_realtime_line(win, "첫 문장\n")
+    MainWindow._flush_realtime_file(win)
+    MainWindow._write_realtime_line(win, "둘째 문장\n")
+    now["value"] += Config.REALTIME_FLUSH_MIN_INTERVAL / 2
+    MainWindow._flush_realtime_file(win)
+    assert flush_calls == [1]
+    assert win._realtime_flush_pending is True
+
+    now["value"] += Config.REALTIME_FLUSH_MIN_INTERVAL
+    MainWindow._flush_realtime_file(win)
+    assert flush_calls == [1, 2]
+    assert win._realtime_flush_pending is False
+
+
 def test_add_text_to_subtitles_invalidates_undo_and_schedules_initial_recovery():
     win = _build_window()
     invalidated: list[bool] = []
@@ -438,3 +500,13 @@ def test_config_uses_verified_live_list_xcodes_for_default_presets():
     assert Config.COMMITTEE_XCODE_MAP["청문회/공청회"] == 99
     assert Config.COMMITTEE_ABBREVIATIONS["청문회"] == "청문회/공청회"
     assert Config.COMMITTEE_ABBREVIATIONS["공청회"] == "청문회/공청회"
+
+
+def test_config_committee_tables_are_read_only():
+    for table in (
+        Config.DEFAULT_COMMITTEE_PRESETS,
+        Config.COMMITTEE_XCODE_MAP,
+        Config.COMMITTEE_ABBREVIATIONS,
+    ):
+        with pytest.raises(TypeError):
+            table["임시위원회"] = "x"  # type: ignore[index]
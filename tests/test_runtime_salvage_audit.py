@@ -100,4 +100,38 @@ def test_runtime_manifest_salvage_reads_valid_segment_despite_broken_manifest(tm
 
     assert len(salvaged) == 1
     assert len(loaded) == 1
-    assert loaded[0].text == "salvage 대상"
\ No newline at end of file
+    assert loaded[0].text == "salvage 대상"
+
+
+def test_runtime_tail_checkpoint_serializes_each_entry_once(tmp_path, monkeypatch):
+    win = _build_runtime_archive_window()
+    entries = [
+        SubtitleEntry("첫 문장", entry_id="e-1"),
+        SubtitleEntry("둘 문장", entry_id="e-2"),
+    ]
+    expected = MainWindow._build_runtime_entries_fingerprint(win, entries)
+    calls: list[str] = []
+    original_to_dict = SubtitleEntry.to_dict
+
+    def counting_to_dict(self):
+        calls.append(str(self.entry_id))
+        return original_to_dict(self)
+
+    monkeypatch.setattr(SubtitleEntry, "to_dict", counting_to_dict)
+    checkpoint_path = tmp_path / "tail_checkpoint.json"
+
+    MainWindow._write_runtime_tail_checkpoint_to_path(
+        win,
+        checkpoint_path,
+        entries,
+        current_url="https://assembly.example/runtime",
+        committee_name="행정안전위원회",
+        archived_count=0,
+        archived_chars=0,
+        archived_words=0,
+    )
+
+    payload = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    assert calls == ["e-1", "e-2"]
+    assert payload["entries_digest"] == expected["entries_digest"]
+    assert [item["text"] for item in payload["subtitles"]] == ["첫 문장", "둘 문장"]
@@ -14,6 +14,35 @@ def test_subtitle_entry_from_dict_rejects_non_dict():
         SubtitleEntry.from_dict("not-a-dict")
 
 
+def test_subtitle_entry_from_dict_shares_interned_speaker_color():
+    first = SubtitleEntry.from_dict(
+        {
+            "text": "첫 발언",
+            "timestamp": "2026-02-12T10:00:00",
+            "speaker_color": "".join(["rgb(1, 2, ", "3)"]),
+        }
+    )
+    second = SubtitleEntry.from_dict(
+        {
+            "text": "둘째 발언",
+            "timestamp": "2026-02-12T10:00:05",
+            "speaker_color": "".join(["rgb(1, ", "2, 3)"]),
+        }
+    )
+
+    assert first.speaker_color == "rgb(1, 2, 3)"
+    assert first.speaker_color is second.speaker_color
+    assert SubtitleEntry("색상 없음").speaker_color is None
+
+
+def test_subtitle_entry_from_dict_keeps_non_string_speaker_color():
+    entry = SubtitleEntry.from_dict(
+        {"text": "a", "timestamp": "2026-02-12T10:00:00", "speaker_color": 123}
+    )
+
+    assert entry.speaker_color == 123
+
+
 def test_deserialize_subtitles_skips_corrupted_items():
     win = MainWindow.__new__(MainWindow)
 
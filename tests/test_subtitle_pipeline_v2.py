@@ -272,3 +272,66 @@ def test_snapshot_clone_reuses_entries_until_tail_clone_is_needed():
     assert tail_snapshot.entries[0] is state.entries[0]
     assert tail_snapshot.entries[1] is not state.entries[1]
     assert tail_snapshot.entries[1].text == state.entries[1].text
+
+
+def test_rebuild_confirmed_history_trims_oldest_segments_to_max_length():
+    state = create_empty_capture_state()
+    now = datetime(2026, 3, 11, 8, 0, 0)
+    state.entries = [
+        pipeline_mod.SubtitleEntry(text, now + timedelta(seconds=index))
+        for index, text in enumerate(["aaaa", "bbbb", "cccc", "dddd"])
+    ]
+
+    pipeline_mod.rebuild_confirmed_history(state, {"confirmed_compact_max_len": 10})
+
+    assert state.confirmed_segments == ["bb", "cccc", "dddd"]
+    assert state.confirmed_compact == "bbccccdddd"
+
+    pipeline_mod.rebuild_confirmed_history(state, {"confirmed_compact_max_len": 8})
+
+    assert state.confirmed_segments == ["cccc", "dddd"]
+    assert state.confirmed_compact == "ccccdddd"
+
+
+def test_apply_preview_reuses_extraction_for_repeated_identical_frame(monkeypatch):
+    import core.subtitle_pipeline_impl.incremental as incremental_mod
+
+    state = create_empty_capture_state()
+    now = datetime(2026, 3, 11, 8, 0, 0)
+    apply_preview(state, "첫 번째 문장입니다", now)
+
+    calls: list[str] = []
+    original = incremental_mod.extract_incremental_text_from_history
+
+    def counting_extract(raw_text, history_compact, settings=None):
+        calls.append(raw_text)
+        return original(raw_text, history_compact, settings)
+
+    monkeypatch.setattr(incremental_mod, "extract_incremental_text_from_history", counting_extract)
+
+    frame = "첫 번째 문장입니다"
+    entry_count = len(state.entries)
+    first = apply_preview(state, frame, now + timedelta(seconds=1))
+    first_calls = len(calls)
+    second = apply_preview(state, frame, now + timedelta(seconds=2))
+
+    assert first_calls > 0
+    assert len(calls) == first_calls
+    assert first.reason == second.reason
+    assert len(state.entries) == entry_count
+
+
+def test_reused_incremental_extract_result_cannot_be_mutated():
+    import dataclasses
+
+    from core.subtitle_pipeline_impl.incremental import (
+        extract_incremental_text_with_recent_history,
+    )
+
+    first = extract_incremental_text_with_recent_history("가나다라 마바사", "가나다라", "가나다라")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(first, "text", "오염")
+
+    second = extract_incremental_text_with_recent_history("가나다라 마바사", "가나다라", "가나다라")
+    assert second is first
+    assert second.text == "마바사"
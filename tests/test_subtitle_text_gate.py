@@ -1,4 +1,4 @@
-from core import utils
+from core import text_utils, utils
 
 
 def test_meaningful_subtitle_text_accepts_short_utterances():
@@ -22,3 +22,132 @@ def test_flatten_subtitle_text_removes_blank_lines_without_dropping_content():
         utils.flatten_subtitle_text(raw)
         == "전 세계의 정부학교장을 민간이 한 게 어디 있어요 한란도 없어요"
     )
+
+
+def test_compact_subtitle_text_strips_whitespace_and_zero_width_in_one_pass():
+    raw = " 국회​ 본회의\n\t개의﻿합니다 "
+
+    assert utils.compact_subtitle_text(raw) == "국회본회의개의합니다"
+    assert utils.flatten_subtitle_text("첫 줄\r\n\r\n  둘째​ 줄 \r셋째") == "첫 줄 둘째 줄 셋째"
+
+
+def test_clean_text_helpers_strip_all_zero_width_characters():
+    raw = "\ufeff국회\u200b 본회의\u200c개의\u200d합니다"
+
+    assert utils.clean_text(raw) == "국회 본회의개의합니다"
+    assert utils.clean_text_display(raw) == "국회 본회의개의합니다"
+    assert utils.slice_from_compact_index(raw, 2) == "본회의개의합니다"
+
+
+def test_find_compact_suffix_prefix_overlap_returns_longest_anchor_match():
+    last = "가나다라마바사가나다라마바사아자"
+    new = "가나다라마바사아자차카타"
+
+    assert utils.find_compact_suffix_prefix_overlap(last, new, min_overlap=3) == 9
+    assert utils.find_compact_suffix_prefix_overlap(last, new, min_overlap=10) == 0
+    assert utils.find_compact_suffix_prefix_overlap(last, "차카타", min_overlap=2) == 0
+    assert utils.find_compact_suffix_prefix_overlap("aaaa", "aaaab", min_overlap=1) == 4
+    assert (
+        utils.find_compact_suffix_prefix_overlap(last, new, min_overlap=3, max_overlap=5)
+        == 0
+    )
+
+
+def test_get_word_diff_uses_longest_common_suffix_of_previous_text():
+    last = "인수가 정당하다는 입장을 계속 얘기하는데"
+    new = "인수가 정당하다는 그런 입장을 계속 얘기하는데 그러다 보니까"
+
+    assert utils.get_word_diff(last, new) == "그러다 보니까"
+    assert text_utils._find_longest_suffix_match("가나다라마바사아자차", "차카타") == (-1, 0)
+
+
+def test_get_word_diff_computes_each_compact_once(monkeypatch):
+    calls: list[str] = []
+    real_compact = text_utils.compact_subtitle_text
+
+    def _counting_compact(text: str) -> str:
+        calls.append(text)
+        return real_compact(text)
+
+    monkeypatch.setattr(text_utils, "compact_subtitle_text", _counting_compact)
+
+    last = "인수가 정당하다는 입장을 계속 얘기하는데"
+    new = "인수가 정당하다는 그런 입장을 계속 얘기하는데 그러다 보니까"
+
+    assert text_utils.get_word_diff(last, new) == "그러다 보니까"
+    assert calls == [last, new]
+
+
+def test_clean_text_removes_year_tokens_and_skips_regex_without_year_marker(monkeypatch):
+    assert utils.clean_text("2026년 예산안  심사") == "예산안 심사"
+    assert utils.clean_text_display("2026년 예산안") == "예산안"
+
+    class _FailingYearPattern:
+        def sub(self, *_args, **_kwargs):
+            raise AssertionError("year regex should be skipped")
+
+    monkeypatch.setattr(text_utils, "_RE_YEAR", _FailingYearPattern())
+
+    assert utils.clean_text("국회  본회의") == "국회 본회의"
+    assert utils.clean_text_display(" 국회 본회의 ") == "국회 본회의"
+
+
+def test_slice_from_compact_index_skips_whitespace_runs():
+    text = "국회  본회의\n\n개의 합니다"
+
+    assert utils.slice_from_compact_index(text, 2) == "본회의\n\n개의 합니다"
+    assert utils.slice_from_compact_index(text, 4) == "의\n\n개의 합니다"
+    assert utils.slice_from_compact_index(text, 5) == "개의 합니다"
+    assert utils.slice_from_compact_index(text, 9) == "다"
+    assert utils.slice_from_compact_index(text, 10) == ""
+
+
+def test_find_list_overlap_returns_longest_word_overlap():
+    existing = ["의사일정", "제1항", "상정", "의사일정", "제1항"]
+
+    assert utils.find_list_overlap(existing, ["의사일정", "제1항", "상정", "의사일정", "제1항", "표결"]) == 5
+    assert utils.find_list_overlap(existing, ["의사일정", "제1항", "표결"]) == 2
+    assert utils.find_list_overlap(existing, ["표결", "합니다"]) == 0
+    assert utils.find_list_overlap([], ["표결"]) == 0
+
+
+def test_get_word_diff_returns_empty_for_identical_poll_without_cleaning(monkeypatch):
+    def _fail_clean(_text: str) -> str:
+        raise AssertionError("identical text should short-circuit")
+
+    monkeypatch.setattr(text_utils, "clean_text_display", _fail_clean)
+
+    assert text_utils.get_word_diff("국회 본회의", "국회 본회의") == ""
+
+
+def test_is_similar_subtitle_counts_repeated_syllables():
+    assert utils.is_similar_subtitle("국회 본회의", "국회본회의") is True
+    # 문자 종류는 같지만 반복 횟수가 크게 다르면 유사하지 않다.
+    assert utils.is_similar_subtitle("네네네네네네네네네네아니요", "네아니요") is False
+    assert utils.is_similar_subtitle("", "") is True
+
+
+def test_text_cleanup_handles_zero_width_and_unicode_whitespace_without_regex():
+    text = "국회\u200b  본회의\u3000개의\t합니다\ufeff"
+
+    assert utils.clean_text(text) == "국회 본회의 개의 합니다"
+    assert utils.compact_subtitle_text(text) == "국회본회의개의합니다"
+    assert utils.normalize_subtitle_text(" 국회\n\n본회의 ") == "국회 본회의"
+    assert text_utils._strip_zero_width("국회 본회의") == "국회 본회의"
+    assert text_utils._strip_zero_width("국회\u200d본회의") == "국회본회의"
+
+
+def test_get_word_diff_sliding_window_is_resolved_by_suffix_match(monkeypatch):
+    suffix_calls: list[tuple[str, str]] = []
+    original = text_utils._find_longest_suffix_match
+
+    def _spy(last_compact, new_compact, *args):
+        suffix_calls.append((last_compact, new_compact))
+        return original(last_compact, new_compact, *args)
+
+    monkeypatch.setattr(text_utils, "_find_longest_suffix_match", _spy)
+    last = "앞부분은 화면에서 사라지고 국회본회의개의합니다"
+    new = "국회 본회의 개의 합니다 다음 안건입니다"
+
+    assert text_utils.get_word_diff(last, new) == "다음 안건입니다"
+    assert suffix_calls
@@ -89,6 +89,9 @@ class _FakeListWidget:
     def addItem(self, text: str) -> None:
         self.items.append(text)
 
+    def addItems(self, texts: list[str]) -> None:
+        self.items.extend(texts)
+
     def clear(self) -> None:
         self.items.clear()
 
@@ -732,6 +735,52 @@ def test_append_db_history_sessions_updates_loaded_state():
     assert win._db_history_dialog_state["loading"] is False
 
 
+def test_patch_db_history_list_items_updates_only_changed_rows():
+    class _Item:
+        def __init__(self, text: str) -> None:
+            self.value = text
+            self.set_calls = 0
+
+        def text(self) -> str:
+            return self.value
+
+        def setText(self, text: str) -> None:
+            self.set_calls += 1
+            self.value = text
+
+    class _RowListWidget:
+        def __init__(self, texts: list[str]) -> None:
+            self.rows = [_Item(text) for text in texts]
+
+        def item(self, row: int) -> _Item:
+            return self.rows[row]
+
+        def count(self) -> int:
+            return len(self.rows)
+
+        def takeItem(self, row: int) -> _Item:
+            return self.rows.pop(row)
+
+        def addItem(self, text: str) -> None:
+            self.rows.append(_Item(text))
+
+        def clear(self) -> None:
+            raise AssertionError("diff 갱신 경로에서는 clear를 호출하면 안 됩니다.")
+
+    win = MainWindow.__new__(MainWindow)
+    list_widget = _RowListWidget(["A", "B", "C"])
+    kept_item = list_widget.rows[0]
+
+    assert MainWindow._patch_db_history_list_items(win, list_widget, ["A", "B*"]) is True
+    assert [row.text() for row in list_widget.rows] == ["A", "B*"]
+    assert list_widget.rows[0] is kept_item
+    assert kept_item.set_calls == 0
+
+    assert MainWindow._patch_db_history_list_items(win, list_widget, ["A", "B*", "D"]) is True
+    assert [row.text() for row in list_widget.rows] == ["A", "B*", "D"]
+    assert MainWindow._patch_db_history_list_items(win, _FakeListWidget(), ["A"]) is False
+
+
 def test_replace_db_history_sessions_refreshes_lineage_badges():
     win = MainWindow.__new__(MainWindow)
     loaded_label = _FakeLabel()
@@ -793,6 +842,65 @@ def test_replace_db_history_sessions_refreshes_lineage_badges():
     assert more_btn.enabled is False
 
 
+def test_open_db_history_dialog_reuses_cached_widgets():
+    class _StatusLabel(_FakeLabel):
+        def __init__(self) -> None:
+            super().__init__()
+            self.visible = False
+
+        def show(self) -> None:
+            self.visible = True
+
+        def hide(self) -> None:
+            self.visible = False
+
+    class _Dialog:
+        def __init__(self) -> None:
+            self.exec_calls = 0
+
+        def exec(self) -> int:
+            self.exec_calls += 1
+            return 0
+
+    build_calls: list[dict[str, Any]] = []
+
+    def build() -> dict[str, Any]:
+        widgets = {
+            "dialog": _Dialog(),
+            "list_widget": _FakeListWidget(),
+            "status_label": _StatusLabel(),
+            "loaded_label": _FakeLabel(),
+            "load_btn": _FakeButton(),
+            "delete_btn": _FakeButton(),
+            "close_btn": _FakeButton(),
+            "more_btn": _FakeButton(),
+        }
+        build_calls.append(widgets)
+        return widgets
+
+    win = MainWindow.__new__(MainWindow)
+    win.is_running = False
+    win._db_history_request_token = 0
+    win._db_history_dialog_widgets = None
+    win._build_db_history_dialog = build
+    first = [{"id": 1, "created_at": "2026-03-27T09:00:00", "committee_name": "운영위"}]
+    second = [
+        {"id": 2, "created_at": "2026-03-28T09:00:00", "committee_name": "법사위"},
+        {"id": 3, "created_at": "2026-03-29T09:00:00", "committee_name": "예결위"},
+    ]
+
+    MainWindow._open_db_history_dialog(win, first, page_size=2)
+    MainWindow._open_db_history_dialog(win, second, page_size=2)
+
+    assert len(build_calls) == 1
+    widgets = build_calls[0]
+    assert widgets["dialog"].exec_calls == 2
+    assert widgets["list_widget"].count() == 2
+    assert [row["id"] for row in win._db_history_dialog_state["sessions"]] == [2, 3]
+    assert win._db_history_dialog_state["has_more"] is True
+    assert widgets["loaded_label"].text() == "현재 2개 로드됨"
+
+
 def test_db_history_delete_success_starts_refresh_and_replaces_dialog():
     win = MainWindow.__new__(MainWindow)
     loaded_label = _FakeLabel()
@@ -1080,6 +1188,84 @@ def test_save_setting_value_reports_qsettings_sync_failure():
     assert warnings and warnings[0].startswith("테마 설정 저장 실패")
 
 
+def test_save_setting_value_skips_sync_when_value_is_unchanged():
+    class _CountingSettings:
+        def __init__(self) -> None:
+            self.values: dict[str, object] = {}
+            self.sync_calls = 0
+
+        def setValue(self, key, value) -> None:
+            self.values[key] = value
+
+        def sync(self) -> None:
+            self.sync_calls += 1
+
+        def status(self):
+            return "NoError"
+
+    win = MainWindow.__new__(MainWindow)
+    win.settings = _CountingSettings()
+    win._saved_setting_values = {"dark_theme": True}
+
+    assert MainWindow._save_setting_value(win, "dark_theme", True) is True
+    assert win.settings.sync_calls == 0
+
+    assert MainWindow._save_setting_value(win, "dark_theme", False) is True
+    assert MainWindow._save_setting_value(win, "dark_theme", False) is True
+    assert win.settings.sync_calls == 1
+    assert win.settings.values == {"dark_theme": False}
+
+
+def test_schedule_setting_value_save_coalesces_bursts_into_one_sync():
+    class _CountingSettings:
+        def __init__(self) -> None:
+            self.values: dict[str, object] = {}
+            self.sync_calls = 0
+
+        def setValue(self, key, value) -> None:
+            self.values[key] = value
+
+        def sync(self) -> None:
+            self.sync_calls += 1
+
+        def status(self):
+            return "NoError"
+
+    class _Timer:
+        def __init__(self) -> None:
+            self.active = False
+            self.start_calls: list[int] = []
+
+        def start(self, interval: int) -> None:
+            self.active = True
+            self.start_calls.append(interval)
+
+        def stop(self) -> None:
+            self.active = False
+
+        def isActive(self) -> bool:
+            return self.active
+
+    win = MainWindow.__new__(MainWindow)
+    win.settings = _CountingSettings()
+    win._saved_setting_values = {"font_size": 14}
+    win._setting_save_timer = _Timer()
+
+    for size in (15, 16, 17):
+        MainWindow._schedule_setting_value_save(win, "font_size", size)
+
+    assert win.settings.sync_calls == 0
+    assert win._setting_save_timer.start_calls == [Config.SETTINGS_SAVE_DEBOUNCE_MS] * 3
+
+    MainWindow._flush_pending_setting_values(win)
+
+    assert win.settings.sync_calls == 1
+    assert win.settings.values == {"font_size": 17}
+    assert win._setting_save_timer.isActive() is False
+    MainWindow._flush_pending_setting_values(win)
+    assert win.settings.sync_calls == 1
+
+
 def test_initialize_database_state_marks_runtime_degraded_when_db_init_fails(monkeypatch):
     class _BrokenDatabase:
         def __init__(self, _db_path: str):
@@ -1173,3 +1359,122 @@ def test_save_committee_presets_reports_user_visible_warning(monkeypatch):
 
     assert reported
     assert "프리셋 저장 실패" in reported[0][0]
+
+
+def test_refresh_url_combo_rebuilds_items_without_emitting_signals():
+    app = mw_mod.QApplication.instance() or mw_mod.QApplication([])
+    _ = app
+
+    win = MainWindow.__new__(MainWindow)
+    win.url_combo = mw_mod.QComboBox()
+    win.url_combo.setEditable(True)
+    win.url_history = {
+        "https://assembly.example/a": "법사위",
+        "https://assembly.example/b": "",
+    }
+    win.url_combo.setEditText("https://assembly.example/typed")
+    emitted: list[str] = []
+    win.url_combo.currentTextChanged.connect(emitted.append)
+
+    MainWindow._refresh_url_combo(win)
+
+    assert emitted == []
+    assert win.url_combo.count() == 2
+    assert win.url_combo.itemText(0) == "[법사위] https://assembly.example/a"
+    assert win.url_combo.itemData(0) == "https://assembly.example/a"
+    assert win.url_combo.itemText(1) == "https://assembly.example/b"
+    assert win.url_combo.itemData(1) == "https://assembly.example/b"
+    assert win.url_combo.currentText() == "https://assembly.example/typed"
+    assert win.url_combo.signalsBlocked() is False
+
+
+def test_toast_stylesheet_is_built_once_per_type_and_theme():
+    from ui.widgets import ToastWidget
+
+    ToastWidget._STYLESHEET_CACHE.clear()
+
+    dark = ToastWidget._build_stylesheet("warning", True)
+    light = ToastWidget._build_stylesheet("warning", False)
+
+    assert ToastWidget._build_stylesheet("warning", True) is dark
+    assert "#241f12" in dark and "#e6edf3" in dark
+    assert "#fff8e6" in light and "#24292f" in light
+    assert set(ToastWidget._STYLESHEET_CACHE) == {("warning", True), ("warning", False)}
+
+
+def test_reset_subtitle_document_reuses_document_and_keeps_settings():
+    app = mw_mod.QApplication.instance() or mw_mod.QApplication([])
+    _ = app
+
+    win = MainWindow.__new__(MainWindow)
+    win.subtitle_text = mw_mod.QTextEdit()
+    win.subtitle_text.setUndoRedoEnabled(False)
+    win.subtitle_text.setPlainText("이전 세션 자막\n" * 50)
+    document = win.subtitle_text.document()
+
+    MainWindow._reset_subtitle_document(win)
+
+    assert win.subtitle_text.document() is document
+    assert win.subtitle_text.toPlainText() == ""
+    assert win.subtitle_text.isUndoRedoEnabled() is False
+
+
+def test_select_rendered_entry_span_reuses_search_cursor():
+    app = mw_mod.QApplication.instance() or mw_mod.QApplication([])
+    _ = app
+
+    win = MainWindow.__new__(MainWindow)
+    win.subtitle_text = mw_mod.QTextEdit()
+    win.subtitle_text.setPlainText("첫 자막\n둘째 자막")
+    win._rendered_entry_text_spans = {0: (0, 4), 1: (5, 10)}
+
+    assert MainWindow._select_rendered_entry_span(win, 0) is True
+    cursor = win._search_cursor
+    assert MainWindow._select_rendered_entry_span(win, 1, 3, 2) is True
+
+    assert win._search_cursor is cursor
+    assert win.subtitle_text.textCursor().selectedText() == "자막"
+
+
+def test_set_preview_text_skips_label_update_when_text_unchanged():
+    win = MainWindow.__new__(MainWindow)
+    set_calls: list[str] = []
+    visibility = {"visible": False}
+
+    class _Label:
+        def text(self) -> str:
+            raise AssertionError("cached preview text should be used")
+
+        def setText(self, text: str) -> None:
+            set_calls.append(text)
+
+    win.preview_frame = SimpleNamespace(
+        isVisible=lambda: visibility["visible"],
+        show=lambda: visibility.update(visible=True),
+        hide=lambda: visibility.update(visible=False),
+    )
+    win.preview_label = _Label()
+    win._last_preview_text = ""
+
+    MainWindow._set_preview_text(win, "  진행 중 자막 ")
+    MainWindow._set_preview_text(win, "진행 중 자막")
+    MainWindow._set_preview_text(win, "")
+
+    assert set_calls == ["진행 중 자막", ""]
+    assert visibility["visible"] is False
+
+
+def test_finish_deferred_startup_sets_shortcuts_and_tolerates_cleanup_failure():
+    win = MainWindow.__new__(MainWindow)
+    calls: list[str] = []
+
+    def failing_cleanup() -> None:
+        calls.append("cleanup")
+        raise OSError("locked")
+
+    win._setup_shortcuts = lambda: calls.append("shortcuts")
+    win._cleanup_orphan_runtime_archives = failing_cleanup
+
+    MainWindow._finish_deferred_startup(win)
+
+    assert calls == ["shortcuts", "cleanup"]
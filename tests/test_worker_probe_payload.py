@@ -123,3 +123,329 @@ def test_extraction_worker_emits_structured_preview_payload(monkeypatch):
     assert preview_payload["selector"] == "#viewSubtit .smi_word"
     assert preview_payload["source_mode"] == ""
     assert preview_payload["rows"][0]["nodeKey"] == "row_1"
+
+
+def test_extraction_worker_throttles_preview_and_flushes_latest(monkeypatch):
+    clock = {"now": 100.0}
+
+    class _ClockEvent:
+        """wait마다 가짜 시계를 1/16초 진행시키고 여덟 번째 wait에서 종료한다."""
+
+        def __init__(self):
+            self._wait_calls = 0
+            self._is_set = False
+
+        def is_set(self):
+            return self._is_set
+
+        def wait(self, timeout=None):
+            clock["now"] += 0.0625
+            self._wait_calls += 1
+            if self._wait_calls >= 8:
+                self._is_set = True
+                return True
+            return False
+
+    win = _build_window()
+    win.stop_event = _ClockEvent()
+    win._get_adaptive_check_interval = lambda _ema, _idle: 0.0
+    probe_texts: list[str] = []
+
+    def _probe(_driver, _selectors, preferred_frame_path=(), **_kwargs):
+        probe_texts.append(f"발언 {len(probe_texts) + 1}")
+        return {
+            "text": probe_texts[-1],
+            "matched_selector": "#viewSubtit .smi_word",
+            "found": True,
+            "rows": [],
+            "frame_path": preferred_frame_path,
+        }
+
+    win._read_subtitle_probe_by_selectors = _probe
+    monkeypatch.setattr(mw_mod.webdriver, "Chrome", lambda options=None: _FakeDriver())
+    monkeypatch.setattr(mw_mod, "WebDriverWait", _FakeWebDriverWait)
+    monkeypatch.setattr(mw_mod.Config, "SUBTITLE_CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(mw_mod.Config, "PREVIEW_EMIT_MIN_INTERVAL", 0.125)
+    monkeypatch.setattr(time, "perf_counter", lambda: clock["now"])
+
+    MainWindow._extraction_worker(
+        win,
+        "https://example.com/live?xcgcd=DCM0000101234567890",
+        "#viewSubtit .smi_word",
+        False,
+    )
+
+    preview_raws = [
+        payload["raw"]
+        for msg_type, payload in _iter_queue_messages(win.message_queue)
+        if msg_type == "preview"
+    ]
+
+    # tick마다 새 문장이 오면 전송 간격(2 tick)이 지난 tick에 그 tick의 최신 문장을 보내고,
+    # 사이 tick의 문장은 보류했다가 덮어쓴다. 종료 시 남은 최신 문장을 보낸다.
+    assert len(probe_texts) >= 4
+    assert preview_raws[:-1] == probe_texts[0:len(probe_texts) - 1:2]
+    assert preview_raws[-1] == probe_texts[-1]
+
+
+def test_adaptive_check_interval_tightens_while_active_and_widens_when_idle():
+    win = MainWindow.__new__(MainWindow)
+    min_interval = mw_mod.Config.SUBTITLE_CHECK_INTERVAL_MIN
+    max_interval = mw_mod.Config.SUBTITLE_CHECK_INTERVAL_MAX
+
+    assert MainWindow._get_adaptive_check_interval(win, 0.01, 0.01) == min_interval
+    assert MainWindow._get_adaptive_check_interval(win, 0.01, 30.0) == max_interval
+    assert abs(MainWindow._get_adaptive_check_interval(win, 0.4, 0.1) - 0.2) < 1e-9
+
+
+def test_extraction_worker_skips_structured_probe_while_observer_is_quiet(monkeypatch):
+    win = _build_window()
+    probe_calls = []
+
+    def _probe(_driver, _selectors, preferred_frame_path=(), **_kwargs):
+        probe_calls.append(preferred_frame_path)
+        return {
+            "text": "첫 문장",
+            "matched_selector": "#viewSubtit .smi_word",
+            "found": True,
+            "rows": [],
+            "frame_path": preferred_frame_path,
+        }
+
+    win._read_subtitle_probe_by_selectors = _probe
+    win._inject_mutation_observer = lambda _driver, _selector: (True, ())
+    win._collect_observer_changes = lambda _driver, _frame_path=(): []
+    # 컨테이너를 관찰 중이라 빈 버퍼를 "변화 없음"으로 믿을 수 있는 경우
+    win._observer_quiet_reliable = True
+    monkeypatch.setattr(mw_mod.webdriver, "Chrome", lambda options=None: _FakeDriver())
+    monkeypatch.setattr(mw_mod, "WebDriverWait", _FakeWebDriverWait)
+    monkeypatch.setattr(mw_mod.Config, "SUBTITLE_CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(mw_mod.Config, "SUBTITLE_CHECK_INTERVAL_MIN", 0.0)
+    monkeypatch.setattr(mw_mod.Config, "SUBTITLE_CHECK_INTERVAL_MAX", 0.0)
+    monkeypatch.setattr(mw_mod.Config, "OBSERVER_IDLE_PROBE_INTERVAL", 60.0)
+
+    MainWindow._extraction_worker(
+        win,
+        "https://example.com/live?xcgcd=DCM0000101234567890",
+        "#viewSubtit .smi_word",
+        False,
+    )
+
+    assert len(probe_calls) == 1
+
+
+def test_extraction_worker_keeps_probing_when_observer_watches_a_row_node(monkeypatch):
+    clock = {"now": 100.0}
+    check_interval = 0.125
+
+    class _ClockEvent:
+        def __init__(self):
+            self._wait_calls = 0
+            self._is_set = False
+
+        def is_set(self):
+            return self._is_set
+
+        def wait(self, timeout=None):
+            clock["now"] += 0.0625
+            self._wait_calls += 1
+            if self._wait_calls >= 12:
+                self._is_set = True
+                return True
+            return False
+
+    win = _build_window()
+    win.stop_event = _ClockEvent()
+    win._get_adaptive_check_interval = lambda _ema, _idle: check_interval
+    probe_times: dict[str, float] = {}
+
+    def _probe(_driver, _selectors, preferred_frame_path=(), **_kwargs):
+        # 새 .smi_word 행이 형제로 추가되는 상황: 관찰 중인 행은 그대로라 버퍼는 비어 있다.
+        text = f"새 행 {len(probe_times) + 1}"
+        probe_times[text] = clock["now"]
+        return {
+            "text": text,
+            "matched_selector": "#viewSubtit .smi_word",
+            "found": True,
+            "rows": [],
+            "frame_path": preferred_frame_path,
+        }
+
+    emitted_at: dict[str, float] = {}
+    original_put = win.message_queue.put
+
+    def _recording_put(item, *args, **kwargs):
+        if isinstance(item, tuple) and item[0] == "preview":
+            emitted_at[item[1]["raw"]] = clock["now"]
+        return original_put(item, *args, **kwargs)
+
+    win.message_queue.put = _recording_put
+    win._read_subtitle_probe_by_selectors = _probe
+    win._inject_mutation_observer = lambda _driver, _selector: (True, ())
+    win._collect_observer_changes = lambda _driver, _frame_path=(): []
+    win._observer_quiet_reliable = False
+    monkeypatch.setattr(mw_mod.webdriver, "Chrome", lambda options=None: _FakeDriver())
+    monkeypatch.setattr(mw_mod, "WebDriverWait", _FakeWebDriverWait)
+    monkeypatch.setattr(mw_mod.Config, "SUBTITLE_CHECK_INTERVAL", check_interval)
+    monkeypatch.setattr(mw_mod.Config, "PREVIEW_EMIT_MIN_INTERVAL", 0.0)
+    monkeypatch.setattr(mw_mod.Config, "OBSERVER_IDLE_PROBE_INTERVAL", 60.0)
+    monkeypatch.setattr(time, "perf_counter", lambda: clock["now"])
+
+    MainWindow._extraction_worker(
+        win,
+        "https://example.com/live?xcgcd=DCM0000101234567890",
+        "#viewSubtit .smi_word",
+        False,
+    )
+
+    times = sorted(probe_times.values())
+    assert len(times) >= 4
+    assert max(later - earlier for earlier, later in zip(times, times[1:])) <= check_interval
+    assert emitted_at == probe_times
+
+
+def test_collect_observer_changes_records_whether_quiet_buffer_is_reliable():
+    win = MainWindow.__new__(MainWindow)
+    win._switch_to_frame_path = lambda _driver, _frame_path: True
+
+    class _ObserverDriver:
+        def __init__(self, result):
+            self.result = result
+            self.switch_to = type("_SwitchTo", (), {"default_content": lambda _self: None})()
+
+        def execute_script(self, _script):
+            return self.result
+
+    changes = MainWindow._collect_observer_changes(
+        win, _ObserverDriver({"changes": ["새 자막"], "quietReliable": True})
+    )
+    assert changes == ["새 자막"]
+    assert win._observer_quiet_reliable is True
+
+    changes = MainWindow._collect_observer_changes(
+        win, _ObserverDriver({"changes": [], "quietReliable": False})
+    )
+    assert changes == []
+    assert win._observer_quiet_reliable is False
+
+
+def test_wait_for_page_ready_returns_as_soon_as_document_is_ready():
+    win = MainWindow.__new__(MainWindow)
+    win.stop_event = threading.Event()
+
+    class _ReadyAfterTwoChecksDriver:
+        def __init__(self):
+            self.calls = []
+
+        def execute_script(self, _script, selector):
+            self.calls.append(selector)
+            return len(self.calls) >= 2
+
+    driver = _ReadyAfterTwoChecksDriver()
+    started = time.monotonic()
+
+    assert MainWindow._wait_for_page_ready(win, driver, "#viewSubtit", timeout=5.0) is True
+    assert driver.calls == ["#viewSubtit", "#viewSubtit"]
+    assert time.monotonic() - started < 1.0
+
+
+def test_resolve_active_selector_probes_all_candidates_in_one_wait(monkeypatch):
+    win = _build_window()
+    wait_calls = []
+
+    class _PollingWait:
+        def __init__(self, driver, _timeout):
+            self._driver = driver
+
+        def until(self, condition):
+            wait_calls.append(condition)
+            return condition(self._driver)
+
+    class _SelectorDriver:
+        def __init__(self):
+            self.script_args = []
+
+        def execute_script(self, _script, selectors):
+            self.script_args.append(list(selectors))
+            return selectors[1]
+
+    capture_mod = pytest.importorskip("ui.main_window_capture")
+    monkeypatch.setattr(capture_mod, "WebDriverWait", _PollingWait)
+    driver = _SelectorDriver()
+
+    candidates, active = MainWindow._resolve_active_selector(
+        win, driver, ["#viewSubtit .smi_word", "#viewSubtit .incont"]
+    )
+
+    assert active == "#viewSubtit .incont"
+    assert candidates == ["#viewSubtit .smi_word", "#viewSubtit .incont"]
+    assert len(wait_calls) == 1
+    assert driver.script_args == [["#viewSubtit .smi_word", "#viewSubtit .incont"]]
+
+
+def test_configure_network_blocklist_blocks_images_only_in_headless():
+    win = _build_window()
+
+    class _CdpDriver:
+        def __init__(self):
+            self.commands = []
+
+        def execute_cdp_cmd(self, cmd, params):
+            self.commands.append((cmd, params))
+            return {}
+
+    visible_driver = _CdpDriver()
+    headless_driver = _CdpDriver()
+
+    assert MainWindow._configure_network_blocklist(win, visible_driver, False) is True
+    assert MainWindow._configure_network_blocklist(win, headless_driver, True) is True
+    assert MainWindow._configure_network_blocklist(win, _FakeDriver(), True) is False
+
+    visible_urls = visible_driver.commands[-1][1]["urls"]
+    headless_urls = headless_driver.commands[-1][1]["urls"]
+    assert visible_driver.commands[0] == ("Network.enable", {})
+    assert "*.png" not in visible_urls
+    assert "*.png" in headless_urls
+    assert "*googletagmanager.com*" in visible_urls
+
+
+def test_extraction_worker_flushes_held_preview_before_reconnect(monkeypatch):
+    win = _build_window()
+    win.auto_reconnect_enabled = True
+    win._get_reconnect_delay = lambda attempt: 0.0
+    probes = iter(["첫 문장", "첫 문장 보정"])
+
+    def _probe(_driver, _selectors, preferred_frame_path=(), **_kwargs):
+        text = next(probes, None)
+        if text is None:
+            raise RuntimeError("chrome not reachable")
+        return {
+            "text": text,
+            "matched_selector": "#viewSubtit .smi_word",
+            "found": True,
+            "rows": [],
+            "frame_path": preferred_frame_path,
+        }
+
+    win._read_subtitle_probe_by_selectors = _probe
+    monkeypatch.setattr(mw_mod.webdriver, "Chrome", lambda options=None: _FakeDriver())
+    monkeypatch.setattr(mw_mod, "WebDriverWait", _FakeWebDriverWait)
+    monkeypatch.setattr(mw_mod.Config, "SUBTITLE_CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(mw_mod.Config, "PREVIEW_EMIT_MIN_INTERVAL", 60.0)
+
+    MainWindow._extraction_worker(
+        win,
+        "https://example.com/live?xcgcd=DCM0000101234567890",
+        "#viewSubtit .smi_word",
+        False,
+    )
+
+    messages = list(_iter_queue_messages(win.message_queue))
+    preview_raws = [payload["raw"] for msg_type, payload in messages if msg_type == "preview"]
+    message_types = [msg_type for msg_type, _payload in messages]
+
+    assert preview_raws == ["첫 문장", "첫 문장 보정"]
+    assert "reconnected" in message_types
+    assert message_types.index("reconnecting") > max(
+        index for index, msg_type in enumerate(message_types) if msg_type == "preview"
+    )
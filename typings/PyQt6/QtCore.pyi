@@ -11,6 +11,7 @@ class _QtObject(metaclass=_QtMeta):
 
 
 class Qt(_QtObject): ...
+class QEvent(_QtObject): ...
 class QTimer(_QtObject): ...
 class QObject(_QtObject): ...
 class QThread(_QtObject): ...
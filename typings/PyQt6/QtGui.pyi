@@ -18,5 +18,6 @@ class QIcon(_QtObject): ...
 class QKeySequence(_QtObject): ...
 class QMouseEvent(_QtObject): ...
 class QShortcut(_QtObject): ...
+class QShowEvent(_QtObject): ...
 class QTextCharFormat(_QtObject): ...
 class QTextCursor(_QtObject): ...
@@ -20,6 +20,12 @@ from core.config import Config
 from core.live_list import build_live_list_url, parse_live_list_payload
 
 
+# 목록 행마다 QColor를 새로 파싱하지 않도록 고정 색상은 한 번만 생성해 재사용
+_LIVE_ROW_COLOR = QColor("#ef4444")
+_INACTIVE_ROW_COLOR = QColor("gray")
+_UNAVAILABLE_ROW_COLOR = QColor("#9ca3af")
+
+
 def _parse_live_list_payload(payload: bytes) -> dict[str, object]:
     return parse_live_list_payload(payload)
 
@@ -272,6 +278,7 @@ class LiveBroadcastDialog(QDialog):
         )
 
         added = 0
+        live_font = None
         for item in sorted_list:
             xstat = str(item.get("xstat", "")).strip()
             xcgcd = str(item.get("xcgcd", "")).strip()
@@ -292,18 +299,19 @@ class LiveBroadcastDialog(QDialog):
             item_widget.setData(1, Qt.ItemDataRole.UserRole, can_build_url)
 
             if xstat == "1":
-                font = item_widget.font(0)
-                font.setBold(True)
-                item_widget.setFont(0, font)
-                item_widget.setForeground(0, QColor("#ef4444"))
-                item_widget.setFont(1, font)
+                if live_font is None:
+                    live_font = item_widget.font(0)
+                    live_font.setBold(True)
+                item_widget.setFont(0, live_font)
+                item_widget.setForeground(0, _LIVE_ROW_COLOR)
+                item_widget.setFont(1, live_font)
             else:
                 for column in range(4):
-                    item_widget.setForeground(column, QColor("gray"))
+                    item_widget.setForeground(column, _INACTIVE_ROW_COLOR)
             if not can_build_url:
                 item_widget.setToolTip(1, "현재 생중계 URL을 만들 수 없습니다.")
                 for column in range(4):
-                    item_widget.setForeground(column, QColor("#9ca3af"))
+                    item_widget.setForeground(column, _UNAVAILABLE_ROW_COLOR)
 
             self.tree.addTopLevelItem(item_widget)
             added += 1
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import sys
 from typing import TYPE_CHECKING, Any
 
 from ui.main_window_common import *
@@ -17,6 +18,10 @@ import ui.main_window_capture as capture_mod
 MainWindowQtBase = object if TYPE_CHECKING else QMainWindow
 
 
+def __getattr__(name: str) -> Any:
+    return resolve_lazy_selenium_attr(globals(), name)
+
+
 class MainWindow(  # pyright: ignore[reportGeneralTypeIssues]
     MainWindowRuntimeStateMixin,
     MainWindowRuntimeLifecycleMixin,
@@ -30,10 +35,10 @@ class MainWindow(  # pyright: ignore[reportGeneralTypeIssues]
     MainWindowDatabaseMixin,
 ):
     def _sync_capture_compat_globals(self) -> None:
-        capture_mod.webdriver = webdriver
-        capture_mod.WebDriverWait = WebDriverWait
-        capture_mod.EC = EC
-        capture_mod.By = By
+        # 모듈 __getattr__를 거치도록 getattr로 읽어 selenium을 첫 캡처 시점에 import 한다.
+        main_window_mod = sys.modules[__name__]
+        for name in ("webdriver", "WebDriverWait", "EC", "By"):
+            setattr(capture_mod, name, getattr(main_window_mod, name))
 
     def _activate_subtitle(self, driver: Any) -> bool:
         self._sync_capture_compat_globals()
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from typing import Any
+
 from ui.main_window_common import *
 from ui.main_window_impl.capture_browser import MainWindowCaptureBrowserMixin
 from ui.main_window_impl.capture_dom import MainWindowCaptureDomMixin
@@ -8,6 +10,10 @@ from ui.main_window_impl.capture_observer import MainWindowCaptureObserverMixin
 from ui.main_window_types import MainWindowHost
 
 
+def __getattr__(name: str) -> Any:
+    return resolve_lazy_selenium_attr(globals(), name)
+
+
 class MainWindowCaptureMixin(
     MainWindowCaptureLiveMixin,
     MainWindowCaptureBrowserMixin,
@@ -59,16 +59,11 @@ from PyQt6.QtGui import (
     QIcon,
 )
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     WebDriverException,
     NoSuchElementException,
     StaleElementReferenceException,
 )
-from selenium.webdriver.chrome.options import Options
 
 from core.config import Config
 from core.live_capture import (
@@ -137,6 +132,7 @@ class DatabaseProtocol(Protocol):
     def load_session(self, session_id: int) -> dict[str, Any] | None: ...
     def delete_session(self, session_id: int) -> bool: ...
     def checkpoint(self, mode: str = ...) -> bool: ...
+    def maybe_optimize(self) -> bool: ...
     def search_subtitles(
         self,
         query: str,
@@ -207,7 +203,7 @@ def build_subtitle_dialog_items(
     for index, entry in enumerate(entries):
         timestamp = getattr(entry, "timestamp", None)
         timestamp_text = (
-            timestamp.strftime("%H:%M:%S") if isinstance(timestamp, datetime) else ""
+            utils.format_hms(timestamp) if isinstance(timestamp, datetime) else ""
         )
         raw_text = str(getattr(entry, "text", "") or "")
         normalized_text = str(normalize_text(raw_text) or "").strip()
@@ -350,3 +346,31 @@ def _import_optional_module(module_name: str) -> Any:
     return cast(Any, import_module(module_name))
 
 
+# selenium.webdriver.support.ui 등은 import 비용이 수백 ms에 달해 캡처 시작 시점까지 미룬다.
+# 이름 -> (모듈, 속성) 매핑이며 속성이 빈 문자열이면 모듈 자체를 돌려준다.
+_LAZY_SELENIUM_ATTRS: dict[str, tuple[str, str]] = {
+    "webdriver": ("selenium.webdriver", ""),
+    "By": ("selenium.webdriver.common.by", "By"),
+    "WebDriverWait": ("selenium.webdriver.support.ui", "WebDriverWait"),
+    "EC": ("selenium.webdriver.support.expected_conditions", ""),
+    "Options": ("selenium.webdriver.chrome.options", "Options"),
+}
+
+
+def resolve_lazy_selenium_attr(module_globals: dict[str, Any], name: str) -> Any:
+    """모듈 ``__getattr__``용: selenium 호환 이름을 처음 접근할 때 import 후 캐시한다."""
+    target = _LAZY_SELENIUM_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(
+            f"module {module_globals.get('__name__')!r} has no attribute {name!r}"
+        )
+    module_name, attr_name = target
+    value = import_module(module_name)
+    if attr_name:
+        value = getattr(value, attr_name)
+    module_globals[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    return resolve_lazy_selenium_attr(globals(), name)
@@ -5,14 +5,15 @@ import time
 from importlib import import_module
 from typing import TYPE_CHECKING, Any, Callable, cast
 
-from selenium.webdriver.chrome.options import Options
-
 from core import utils
 from core.config import Config
 from core.logging_utils import logger
 from ui.main_window_common import RecoverableWebDriverError
 from ui.main_window_impl.contracts import CaptureBrowserHost
 
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options
+
 
 def _capture_public() -> Any:
     return import_module("ui.main_window_capture")
@@ -29,6 +30,14 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
         delay = Config.RECONNECT_BASE_DELAY * (2 ** (attempt - 1))
         return min(delay, Config.RECONNECT_MAX_DELAY)
 
+    def _get_adaptive_check_interval(self, change_gap_ema: float, idle_gap: float) -> float:
+        """자막 변화 간격(EMA)과 현재 무변화 시간으로 다음 확인 간격(초) 계산"""
+        gap = max(change_gap_ema, idle_gap)
+        return min(
+            max(gap * 0.5, Config.SUBTITLE_CHECK_INTERVAL_MIN),
+            Config.SUBTITLE_CHECK_INTERVAL_MAX,
+        )
+
     def _is_recoverable_webdriver_error(self, error: Exception) -> bool:
         """재연결로 복구 가능한 웹드라이버 오류인지 판단"""
         if isinstance(error, RecoverableWebDriverError):
@@ -58,7 +67,7 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
             raise RecoverableWebDriverError(f"{context}: {error}") from error
 
     def _build_chrome_options(self, headless: bool) -> Options:
-        options = Options()
+        options = _capture_public().Options()
         options.add_argument("--log-level=3")
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option(
@@ -95,6 +104,24 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
         except Exception as e:
             logger.debug("implicit wait 적용 실패: %s", e)
 
+    def _configure_network_blocklist(self, driver: Any, headless: bool) -> bool:
+        """CDP로 자막 수집과 무관한 리소스 요청을 차단한다. CDP 미지원 드라이버는 건너뛴다."""
+        execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+        if not callable(execute_cdp_cmd):
+            return False
+        patterns: list[str] = list(Config.CHROME_BLOCKED_URL_PATTERNS)
+        if headless:
+            patterns.extend(Config.CHROME_HEADLESS_BLOCKED_URL_PATTERNS)
+        if not patterns:
+            return False
+        try:
+            execute_cdp_cmd("Network.enable", {})
+            execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            logger.debug("네트워크 차단 목록 적용 실패: %s", e)
+            return False
+        return True
+
     def _ping_driver(self, driver):
         """웹드라이버 응답 시간을 측정 (ms). 실패 시 None 반환."""
         start = time.time()
@@ -155,26 +182,38 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
             self._clear_current_driver_if(driver)
         return quit_succeeded
 
+    _FIRST_PRESENT_SELECTOR_SCRIPT = """
+        var selectors = arguments[0] || [];
+        for (var i = 0; i < selectors.length; i++) {
+            try {
+                if (document.querySelector(selectors[i])) return selectors[i];
+            } catch (e) {}
+        }
+        return null;
+    """
+
     def _resolve_active_selector(
         self, driver: Any, selector_candidates: list[str]
     ) -> tuple[list[str], str]:
         capture_mod = _capture_public()
         wait = capture_mod.WebDriverWait(driver, Config.WEBDRIVER_WAIT_TIMEOUT)
         active_selector = ""
+        matched: list[str] = []
 
-        for sel in selector_candidates:
-            try:
-                wait.until(
-                    capture_mod.EC.presence_of_element_located(
-                        (capture_mod.By.CSS_SELECTOR, sel)
-                    )
-                )
-                self.message_queue.put(("status", f"자막 요소 찾음: {sel}"))
-                active_selector = sel
-                break
-            except Exception as e:
-                self._raise_if_recoverable_webdriver_error(e, f"자막 요소 대기 실패 ({sel})")
-                continue
+        # 후보별 순차 대기(최악 N x timeout) 대신 한 번의 JS probe로 전체 후보를 함께 확인한다.
+        def _first_present_selector(d: Any) -> bool:
+            result = d.execute_script(self._FIRST_PRESENT_SELECTOR_SCRIPT, selector_candidates)
+            if isinstance(result, str) and result:
+                matched.append(result)
+                return True
+            return False
+
+        try:
+            if selector_candidates and wait.until(_first_present_selector):
+                active_selector = matched[-1] if matched else selector_candidates[0]
+                self.message_queue.put(("status", f"자막 요소 찾음: {active_selector}"))
+        except Exception as e:
+            self._raise_if_recoverable_webdriver_error(e, "자막 요소 대기 실패")
 
         if not active_selector:
             detected_selector = self._find_subtitle_selector(driver)
@@ -203,6 +242,9 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
         try:
             driver = self._create_chrome_driver(options)
             self._configure_driver_timeouts(driver)
+            self._configure_network_blocklist(
+                driver, "--headless=new" in list(getattr(options, "arguments", []) or [])
+            )
             self._set_current_driver(driver)
             self.message_queue.put(
                 ("status", "Chrome 재시작 완료" if reconnecting else "Chrome 시작 완료")
@@ -366,6 +408,8 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
         terminal_success = True
         terminal_error = ""
         terminal_finalize_preview = True
+        # 짧은 간격의 preview는 최신 payload 하나만 보류했다가 간격이 지난 tick에 전송한다.
+        pending_preview_payload: dict[str, Any] | None = None
         run_id = int(run_id) if run_id is not None else self._ensure_active_capture_run()
         set_worker_run_id = getattr(self.message_queue, "set_worker_run_id", None)
         clear_worker_run_id = getattr(self.message_queue, "clear_worker_run_id", None)
@@ -397,34 +441,51 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                 terminal_finalize_preview = False
                 return
 
+            # 루프 내 반복 조회를 줄이기 위해 자주 쓰는 속성/상수를 지역 변수로 고정한다.
+            # 간격 측정은 벽시계 보정 영향을 받지 않는 perf_counter 기준.
+            now_fn = time.perf_counter
+            put_message = self.message_queue.put
+            stop_event = self.stop_event
+            check_interval = Config.SUBTITLE_CHECK_INTERVAL
+            adaptive_interval = self._get_adaptive_check_interval
+            preview_emit_interval = Config.PREVIEW_EMIT_MIN_INTERVAL
+            keepalive_interval = Config.SUBTITLE_KEEPALIVE_INTERVAL
+            health_check_interval = Config.DRIVER_HEALTH_CHECK_INTERVAL
+            observer_idle_probe_interval = Config.OBSERVER_IDLE_PROBE_INTERVAL
+            never_emitted = float("-inf")
             observer_retry_interval = 3.0
-            last_observer_retry = time.time()
-            last_selector_refresh = time.time()
-            last_check = time.time()
-            last_connection_check = time.time() - Config.DRIVER_HEALTH_CHECK_INTERVAL
+            last_observer_retry = now_fn()
+            last_selector_refresh = now_fn()
+            last_check = now_fn()
+            last_connection_check = now_fn() - health_check_interval
             worker_last_raw_text = ""
             worker_last_raw_compact = ""
             reconnect_attempt = 0
             consecutive_health_failures = 0
-            last_keepalive_emit = 0.0
-
-            while not self.stop_event.is_set():
+            last_keepalive_emit = never_emitted
+            last_preview_emit = never_emitted
+            last_probe_at = never_emitted
+            # 발화 중에는 촘촘히, 무음 구간에는 느슨하게 probe 하도록 변화 간격을 추적한다.
+            change_gap_ema = check_interval * 2
+            last_change_at = last_check
+
+            while not stop_event.is_set():
                 try:
                     if driver is None:
                         raise RecoverableWebDriverError("브라우저 세션이 없습니다.")
 
-                    now = time.time()
+                    now = now_fn()
 
-                    if now - last_connection_check >= Config.DRIVER_HEALTH_CHECK_INTERVAL:
+                    if now - last_connection_check >= health_check_interval:
                         ping_time, health_detail = self._check_driver_health(driver)
                         if ping_time is not None:
-                            self.message_queue.put(
+                            put_message(
                                 ("connection_status", {"status": "connected", "latency": ping_time})
                             )
                             reconnect_attempt = 0
                             consecutive_health_failures = 0
                         else:
-                            self.message_queue.put(
+                            put_message(
                                 ("connection_status", {"status": "disconnected"})
                             )
                             consecutive_health_failures += 1
@@ -443,8 +504,9 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                                 )
                         last_connection_check = now
 
-                    if now - last_check >= Config.SUBTITLE_CHECK_INTERVAL:
+                    if now - last_check >= check_interval:
                         used_structured_probe = False
+                        observer_quiet = False
                         if observer_active:
                             observer_changes = self._collect_observer_changes(
                                 driver, observer_frame_path
@@ -452,7 +514,12 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                             if observer_changes is None:
                                 observer_active = False
                                 logger.warning("MutationObserver 비활성화, polling fallback")
-                            elif observer_changes:
+                            elif not observer_changes:
+                                # 행 노드만 관찰 중이면 새 행 추가가 버퍼에 안 잡히므로 probe를 계속한다.
+                                observer_quiet = bool(
+                                    self.__dict__.get("_observer_quiet_reliable", False)
+                                )
+                            else:
                                 reset_events = [
                                     event
                                     for change in observer_changes
@@ -483,12 +550,17 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                                         reset_event,
                                     )
                                     used_structured_probe = True
-                                    self.message_queue.put(
+                                    if pending_preview_payload is not None:
+                                        put_message(
+                                            ("preview", pending_preview_payload)
+                                        )
+                                        pending_preview_payload = None
+                                    put_message(
                                         ("subtitle_reset", reset_event)
                                     )
                                     worker_last_raw_text = ""
                                     worker_last_raw_compact = ""
-                                    last_keepalive_emit = 0.0
+                                    last_keepalive_emit = never_emitted
                                 elif any(
                                     not self._coerce_observer_reset_event(change)
                                     for change in observer_changes
@@ -498,7 +570,13 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                                         len(observer_changes),
                                     )
 
-                        if not used_structured_probe:
+                        # Observer 버퍼가 비어 있으면 DOM 변화가 없으므로 무거운 구조화 probe는
+                        # keepalive/선택자 점검용 최소 간격으로만 수행한다.
+                        if not used_structured_probe and (
+                            not observer_quiet
+                            or now - last_probe_at >= observer_idle_probe_interval
+                        ):
+                            last_probe_at = now
                             preferred_frame_path = (
                                 observer_frame_path if observer_active else ()
                             ) or getattr(self, "_last_subtitle_frame_path", ())
@@ -549,40 +627,61 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                             if text and text_compact and text_compact != worker_last_raw_compact:
                                 worker_last_raw_text = text
                                 worker_last_raw_compact = text_compact
+                                change_gap_ema = 0.8 * change_gap_ema + 0.2 * (now - last_change_at)
+                                last_change_at = now
                                 last_keepalive_emit = now
-                                self.message_queue.put(
-                                    ("preview", self._build_preview_payload_from_probe(probe))
+                                pending_preview_payload = self._build_preview_payload_from_probe(
+                                    probe
                                 )
                             elif (
                                 text
                                 and text_compact
                                 and text_compact == worker_last_raw_compact
-                                and (now - last_keepalive_emit >= Config.SUBTITLE_KEEPALIVE_INTERVAL)
+                                and (now - last_keepalive_emit >= keepalive_interval)
                             ):
-                                self.message_queue.put(("keepalive", text))
+                                put_message(("keepalive", text))
                                 last_keepalive_emit = now
                             elif not text and selector_found and worker_last_raw_compact:
-                                self.message_queue.put(
+                                if pending_preview_payload is not None:
+                                    put_message(
+                                        ("preview", pending_preview_payload)
+                                    )
+                                    pending_preview_payload = None
+                                put_message(
                                     ("subtitle_reset", "polling_cleared")
                                 )
                                 worker_last_raw_text = ""
                                 worker_last_raw_compact = ""
-                                last_keepalive_emit = 0.0
+                                last_keepalive_emit = never_emitted
+
+                        # 이번 tick의 최신 payload를 간격이 지났으면 바로 보내고, 아니면 보류한다.
+                        if (
+                            pending_preview_payload is not None
+                            and now - last_preview_emit >= preview_emit_interval
+                        ):
+                            put_message(("preview", pending_preview_payload))
+                            pending_preview_payload = None
+                            last_preview_emit = now
 
                         last_check = now
+                        check_interval = adaptive_interval(change_gap_ema, now - last_change_at)
 
-                    self.stop_event.wait(timeout=0.05)
+                    stop_event.wait(timeout=0.05)
 
                 except Exception as e:
-                    if self.stop_event.is_set():
+                    if stop_event.is_set():
                         break
 
                     recoverable_error = self._is_recoverable_webdriver_error(e)
                     if self.auto_reconnect_enabled and recoverable_error:
+                        # 끊기기 전 마지막으로 본 preview는 재연결 상태 초기화 전에 보낸다.
+                        if pending_preview_payload is not None:
+                            put_message(("preview", pending_preview_payload))
+                            pending_preview_payload = None
                         reconnect_attempt += 1
                         if reconnect_attempt <= Config.MAX_RECONNECT_ATTEMPTS:
                             delay = self._get_reconnect_delay(reconnect_attempt)
-                            self.message_queue.put(
+                            put_message(
                                 (
                                     "reconnecting",
                                     {
@@ -605,7 +704,7 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                             )
                             driver = None
 
-                            if self.stop_event.wait(timeout=delay):
+                            if stop_event.wait(timeout=delay):
                                 break
 
                             try:
@@ -623,28 +722,34 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                                     reconnecting=True,
                                     cached_live_url=connected_url,
                                 )
-                                self.message_queue.put(
+                                put_message(
                                     ("status", f"✅ 재연결 성공 (시도 {reconnect_attempt})")
                                 )
-                                self.message_queue.put(
+                                put_message(
                                     (
                                         "reconnected",
                                         {"attempt": reconnect_attempt, "url": connected_url},
                                     )
                                 )
-                                self.message_queue.put(
+                                put_message(
                                     ("connection_status", {"status": "connected"})
                                 )
-                                now = time.time()
+                                now = now_fn()
                                 last_check = now
+                                check_interval = Config.SUBTITLE_CHECK_INTERVAL
+                                change_gap_ema = check_interval * 2
+                                last_change_at = now
                                 last_connection_check = (
-                                    now - Config.DRIVER_HEALTH_CHECK_INTERVAL
+                                    now - health_check_interval
                                 )
                                 last_selector_refresh = now
                                 last_observer_retry = now
                                 worker_last_raw_text = ""
                                 worker_last_raw_compact = ""
-                                last_keepalive_emit = 0.0
+                                last_keepalive_emit = never_emitted
+                                last_preview_emit = never_emitted
+                                last_probe_at = never_emitted
+                                pending_preview_payload = None
                                 consecutive_health_failures = 0
                                 continue
                             except Exception as reconnect_error:
@@ -658,13 +763,13 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                             break
                     elif recoverable_error:
                         logger.error("재연결 비활성 상태에서 WebDriver 오류로 수집 종료: %s", e)
-                        self.message_queue.put(("connection_status", {"status": "disconnected"}))
+                        put_message(("connection_status", {"status": "disconnected"}))
                         terminal_success = False
                         terminal_error = f"Chrome 연결이 끊겨 수집을 종료합니다: {e}"
                         break
                     else:
                         logger.warning(f"모니터링 중 오류: {e}")
-                        self.stop_event.wait(timeout=0.5)
+                        stop_event.wait(timeout=0.5)
 
         except Exception as e:
             if not self.stop_event.is_set():
@@ -672,6 +777,11 @@ class MainWindowCaptureBrowserMixin(CaptureBrowserBase):
                 terminal_error = str(e)
 
         finally:
+            if pending_preview_payload is not None:
+                try:
+                    self.message_queue.put(("preview", pending_preview_payload))
+                except Exception:
+                    logger.debug("보류 preview 전송 실패", exc_info=True)
             preserve_driver = False
             if driver is not None and bool(
                 self.__dict__.get("_preserve_driver_on_worker_stop", False)
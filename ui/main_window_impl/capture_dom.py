@@ -255,8 +255,17 @@ class MainWindowCaptureDomMixin(CaptureDomBase):
                             var text = normalizeText(raw);
                             if (!text) return '';
                             if (text.length <= 400) return text;
-                            var lines = String(raw || '').split('\\n').map(normalizeText).filter(Boolean);
-                            return lines.slice(-3).join(' ');
+                            // 전체를 줄 단위로 나누지 않고 끝에서부터 마지막 3줄만 읽는다.
+                            var lines = [];
+                            var end = raw.length;
+                            while (end > 0 && lines.length < 3) {
+                                var start = raw.lastIndexOf('\\n', end - 1);
+                                var line = normalizeText(raw.slice(start + 1, end));
+                                if (line) lines.unshift(line);
+                                if (start < 0) break;
+                                end = start;
+                            }
+                            return lines.join(' ');
                         }
                         function shouldBlockContainerFallback() {
                             if (!filterUnconfirmedArg) return false;
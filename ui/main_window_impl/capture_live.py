@@ -544,7 +544,7 @@ class MainWindowCaptureLiveMixin(CaptureLiveBase):
                             try:
                                 if original_url not in driver.current_url:
                                     driver.get(original_url)
-                                    self.stop_event.wait(timeout=2)
+                                    self._wait_for_page_ready(driver, timeout=2.0)
                                     logger.info(f"원래 URL로 복귀: {original_url}")
                             except Exception as e:
                                 logger.debug(f"원래 URL 복귀 실패: {e}")
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 
+from core.config import Config
 from core.logging_utils import logger
 from ui.main_window_impl.contracts import CaptureObserverHost
 
@@ -35,6 +37,7 @@ class MainWindowCaptureObserverMixin(CaptureObserverBase):
                 window.__subtitleBuffer = [];
                 window.__subtitleLastText = '';
                 window.__subtitleLastEmitTs = 0;
+                window.__subtitleObserverInfo = null;
 
                 var rawSelector = (typeof selectorArg === 'string') ? selectorArg : '';
                 var allowPollFallback = !!allowPollFallbackArg;
@@ -94,6 +97,21 @@ class MainWindowCaptureObserverMixin(CaptureObserverBase):
                     return String(text || '').replace(/\\s+/g, ' ').trim();
                 }
 
+                // 긴 자막 영역은 전체를 줄 단위로 나누지 않고 끝에서부터 필요한 줄만 읽는다.
+                function tailLines(raw, count) {
+                    var source = String(raw || '');
+                    var lines = [];
+                    var end = source.length;
+                    while (end > 0 && lines.length < count) {
+                        var start = source.lastIndexOf('\\n', end - 1);
+                        var line = normalizeText(source.slice(start + 1, end));
+                        if (line) lines.unshift(line);
+                        if (start < 0) break;
+                        end = start;
+                    }
+                    return lines;
+                }
+
                 function isLikelySubtitleText(text) {
                     // 파이프라인 is_meaningful_subtitle_text 와 정렬:
                     // 한글/영문이 1자라도 있으면 길이 하한 없이 허용 (네/예 등)
@@ -114,14 +132,22 @@ class MainWindowCaptureObserverMixin(CaptureObserverBase):
                 }
 
                 if (target) {
+                    // 행(.smi_word) 자체를 관찰하면 형제 행 추가가 보이지 않으므로,
+                    // 버퍼가 비어 있어도 "변화 없음"으로 믿을 수 있는지 기록해 둔다.
+                    var rowTarget = /\\.smi_word|:last-child/.test(matchedTargetSelector)
+                        || !!(target.matches && target.matches('.smi_word'));
+                    window.__subtitleObserverInfo = {
+                        matchedTargetSelector: matchedTargetSelector,
+                        target: target,
+                        coversRows: !rowTarget,
+                        polling: false
+                    };
                     window.__subtitleObserver = new MutationObserver(function() {
                         try {
-                            var text = target.innerText || target.textContent || '';
-                            text = normalizeText(text);
+                            var raw = target.innerText || target.textContent || '';
+                            var text = normalizeText(raw);
                             if (text && text.length > 400) {
-                                var lines = String(target.innerText || '').split('\\n')
-                                    .map(function(v) { return normalizeText(v); })
-                                    .filter(function(v) { return !!v; });
+                                var lines = tailLines(raw, 3);
                                 if (lines.length) {
                                     text = lines.slice(-3).join(' ');
                                 }
@@ -153,6 +179,14 @@ class MainWindowCaptureObserverMixin(CaptureObserverBase):
                 var root = document.body || document.documentElement;
                 if (!root || !allowPollFallback) return false;
 
+                // 폴링 브리지는 매번 선택자를 다시 찾으므로 추가된 행도 버퍼에 반영된다.
+                window.__subtitleObserverInfo = {
+                    matchedTargetSelector: '',
+                    target: null,
+                    coversRows: true,
+                    polling: true
+                };
+
                 window.__subtitlePollTimer = setInterval(function() {
                     try {
                         var now = Date.now();
@@ -255,7 +289,11 @@ class MainWindowCaptureObserverMixin(CaptureObserverBase):
     def _collect_observer_changes(
         self, driver, frame_path: tuple[int, ...] = ()
     ) -> list | None:
-        """MutationObserver 버퍼에서 변경된 텍스트를 수집한다."""
+        """MutationObserver 버퍼에서 변경된 텍스트를 수집한다.
+
+        빈 버퍼를 "DOM 변화 없음"으로 믿을 수 있는지(컨테이너를 관찰 중이고 대상이
+        문서에 연결되어 있는지)는 _observer_quiet_reliable에 기록한다.
+        """
         try:
             if not self._switch_to_frame_path(driver, frame_path):
                 return None
@@ -264,11 +302,22 @@ class MainWindowCaptureObserverMixin(CaptureObserverBase):
                 if (!window.__subtitleBuffer) return null;
                 var buf = window.__subtitleBuffer;
                 window.__subtitleBuffer = [];
-                return buf;
+                var info = window.__subtitleObserverInfo || null;
+                var quietReliable = !!(
+                    info
+                    && info.coversRows
+                    && (info.polling || (info.target && info.target.isConnected))
+                );
+                return {changes: buf, quietReliable: quietReliable};
                 """
             )
             if result is None:
                 return None
+            if isinstance(result, dict):
+                self._observer_quiet_reliable = bool(result.get("quietReliable", False))
+                result = result.get("changes")
+            else:
+                self._observer_quiet_reliable = False
             return result if isinstance(result, list) else []
         except Exception as e:
             self._raise_if_recoverable_webdriver_error(e, "Observer 버퍼 수집 오류")
@@ -307,9 +356,32 @@ class MainWindowCaptureObserverMixin(CaptureObserverBase):
             except Exception as e:
                 logger.debug(f"자막 활성화 스크립트 실패: {e}")
 
-        self.stop_event.wait(timeout=2.0)
+        self._wait_for_page_ready(
+            driver,
+            "#viewSubtit",
+            timeout=Config.SUBTITLE_LAYER_READY_TIMEOUT,
+        )
         return activated
 
+    def _wait_for_page_ready(self, driver, selector: str = "", timeout: float = 2.0) -> bool:
+        """document 로딩 완료(및 selector 존재)까지 짧은 간격으로 대기한다. 고정 sleep 대체용."""
+        script = (
+            "return document.readyState === 'complete'"
+            " && (!arguments[0] || !!document.querySelector(arguments[0]));"
+        )
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        while True:
+            try:
+                if driver.execute_script(script, selector or ""):
+                    return True
+            except Exception as e:
+                logger.debug("페이지 준비 상태 확인 실패: %s", e)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self.stop_event.wait(timeout=min(Config.PAGE_READY_POLL_INTERVAL, remaining)):
+                return False
+
     def _find_subtitle_selector(self, driver) -> str:
         """사용 가능한 자막 셀렉터 자동 감지"""
         selectors = [
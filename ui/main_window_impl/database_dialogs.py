@@ -226,6 +226,25 @@ class MainWindowDatabaseDialogsMixin(MainWindowHost):
                 more_btn.setEnabled(bool(state["has_more"]))
             self._update_db_history_loaded_label()
 
+    def _patch_db_history_list_items(self, list_widget: Any, rendered_items: list[str]) -> bool:
+            """목록을 비우고 다시 채우는 대신 바뀐 행만 갱신한다. 행 접근을 지원하지 않으면 False."""
+            item_at = getattr(list_widget, "item", None)
+            count = getattr(list_widget, "count", None)
+            take_item = getattr(list_widget, "takeItem", None)
+            if not callable(item_at) or not callable(count) or not callable(take_item):
+                return False
+            existing_count = int(cast(Any, count)())
+            while existing_count > len(rendered_items):
+                existing_count -= 1
+                take_item(existing_count)
+            for row in range(existing_count):
+                item = cast(Any, item_at)(row)
+                if item is not None and item.text() != rendered_items[row]:
+                    item.setText(rendered_items[row])
+            for item_text in rendered_items[existing_count:]:
+                list_widget.addItem(item_text)
+            return True
+
     def _replace_db_history_sessions(
             self,
             sessions: list[dict[str, Any]],
@@ -243,17 +262,21 @@ class MainWindowDatabaseDialogsMixin(MainWindowHost):
             if callable(set_updates_enabled):
                 set_updates_enabled(False)
             try:
-                clear = getattr(list_widget, "clear", None)
-                if callable(clear):
-                    clear()
-                else:
-                    take_item = getattr(list_widget, "takeItem", None)
-                    count = getattr(list_widget, "count", None)
-                    if callable(take_item) and callable(count):
-                        while int(cast(Any, count)()) > 0:
-                            take_item(0)
-                for session_row in current_sessions:
-                    list_widget.addItem(self._format_db_history_item(session_row))
+                rendered_items = [
+                    self._format_db_history_item(session_row) for session_row in current_sessions
+                ]
+                if not self._patch_db_history_list_items(list_widget, rendered_items):
+                    clear = getattr(list_widget, "clear", None)
+                    if callable(clear):
+                        clear()
+                    else:
+                        take_item = getattr(list_widget, "takeItem", None)
+                        count = getattr(list_widget, "count", None)
+                        if callable(take_item) and callable(count):
+                            while int(cast(Any, count)()) > 0:
+                                take_item(0)
+                    for item_text in rendered_items:
+                        list_widget.addItem(item_text)
             finally:
                 if callable(set_updates_enabled):
                     set_updates_enabled(True)
@@ -345,11 +368,8 @@ class MainWindowDatabaseDialogsMixin(MainWindowHost):
                 loading_text="DB 세션 히스토리 조회 중...",
             )
 
-    def _open_db_history_dialog(
-            self,
-            sessions: list[dict],
-            page_size: int = Config.DB_HISTORY_PAGE_SIZE,
-        ) -> None:
+    def _build_db_history_dialog(self) -> dict[str, Any]:
+            """DB 히스토리 다이얼로그 위젯을 한 번만 만든다. 핸들러는 클릭 시점의 상태를 읽는다."""
             dialog = QDialog(self)
             dialog.setWindowTitle("📋 세션 히스토리")
             dialog.setMinimumSize(700, 500)
@@ -371,9 +391,15 @@ class MainWindowDatabaseDialogsMixin(MainWindowHost):
 
             load_btn = QPushButton("불러오기")
 
+            def current_sessions() -> list[dict[str, Any]]:
+                state = self.__dict__.get("_db_history_dialog_state") or {}
+                sessions = state.get("sessions")
+                return sessions if isinstance(sessions, list) else []
+
             def load_selected():
                 if self._is_runtime_mutation_blocked("세션 불러오기"):
                     return
+                sessions = current_sessions()
                 idx = list_widget.currentRow()
                 if idx < 0 or idx >= len(sessions):
                     return
@@ -391,11 +417,11 @@ class MainWindowDatabaseDialogsMixin(MainWindowHost):
 
             load_btn.clicked.connect(load_selected)
             btn_layout.addWidget(load_btn)
-            load_btn.setEnabled(not self.is_running)
 
             delete_btn = QPushButton("삭제")
 
             def delete_selected():
+                sessions = current_sessions()
                 idx = list_widget.currentRow()
                 if idx < 0 or idx >= len(sessions):
                     return
@@ -442,13 +468,17 @@ class MainWindowDatabaseDialogsMixin(MainWindowHost):
                 if db is None:
                     self._show_toast("데이터베이스가 초기화되지 않았습니다.", "error")
                     return
+                page_size = int(
+                    state.get("page_size", Config.DB_HISTORY_PAGE_SIZE)
+                    or Config.DB_HISTORY_PAGE_SIZE
+                )
                 offset = int(state.get("offset", len(state.get("sessions", []))) or 0)
                 request_token = int(state.get("request_token", 0)) + 1
                 state["request_token"] = request_token
                 started = self._run_db_task(
                     "db_history_list_more",
-                    worker=lambda off=offset: db.list_sessions(
-                        limit=page_size,
+                    worker=lambda off=offset, limit=page_size: db.list_sessions(
+                        limit=limit,
                         offset=off,
                     ),
                     context={
@@ -470,13 +500,10 @@ class MainWindowDatabaseDialogsMixin(MainWindowHost):
             btn_layout.addWidget(close_btn)
 
             layout.addLayout(btn_layout)
-            if self.is_running:
-                status_label.setText("추출 중에는 세션 불러오기를 사용할 수 없습니다.")
-                status_label.show()
+            dialog.finished.connect(lambda *_: self._clear_db_history_dialog_state())
 
-            self._db_history_dialog_state = {
+            return {
                 "dialog": dialog,
-                "sessions": sessions,
                 "list_widget": list_widget,
                 "status_label": status_label,
                 "loaded_label": loaded_label,
@@ -484,20 +511,42 @@ class MainWindowDatabaseDialogsMixin(MainWindowHost):
                 "delete_btn": delete_btn,
                 "close_btn": close_btn,
                 "more_btn": more_btn,
-                "offset": len(sessions),
+            }
+
+    def _open_db_history_dialog(
+            self,
+            sessions: list[dict],
+            page_size: int = Config.DB_HISTORY_PAGE_SIZE,
+        ) -> None:
+            widgets = self.__dict__.get("_db_history_dialog_widgets")
+            if not widgets:
+                widgets = self._build_db_history_dialog()
+                self._db_history_dialog_widgets = widgets
+
+            self._db_history_dialog_state = {
+                **widgets,
+                "sessions": [],
+                "offset": 0,
                 "page_size": page_size,
-                "has_more": len(sessions) >= page_size,
+                "has_more": False,
                 "loading": False,
                 "request_token": int(self.__dict__.get("_db_history_request_token", 0)),
             }
-            for session_row in sessions:
-                list_widget.addItem(self._format_db_history_item(session_row))
-            self._update_db_history_loaded_label()
-            more_btn.setEnabled(len(sessions) >= page_size)
-            if list_widget.count() > 0:
-                list_widget.setCurrentRow(0)
-            dialog.finished.connect(lambda *_: self._clear_db_history_dialog_state())
-            dialog.exec()
+            # 재사용하는 목록은 바뀐 행만 갱신한다.
+            self._replace_db_history_sessions(sessions, page_size=page_size)
+
+            load_btn = widgets["load_btn"]
+            status_label = widgets["status_label"]
+            load_btn.setEnabled(not self.is_running)
+            for btn in (widgets["delete_btn"], widgets["close_btn"]):
+                btn.setEnabled(True)
+            widgets["list_widget"].setEnabled(True)
+            if self.is_running:
+                status_label.setText("추출 중에는 세션 불러오기를 사용할 수 없습니다.")
+                status_label.show()
+            else:
+                status_label.hide()
+            widgets["dialog"].exec()
 
     def _show_db_search(self):
             """자막 통합 검색 다이얼로그"""
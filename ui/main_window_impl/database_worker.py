@@ -59,6 +59,10 @@ class MainWindowDatabaseWorkerMixin(MainWindowHost):
                             result = worker()
                             if write_task and self.db is not None:
                                 self.db.checkpoint("PASSIVE")
+                                try:
+                                    self.db.maybe_optimize()
+                                except Exception:
+                                    logger.debug("DB optimize 실패", exc_info=True)
                             if isinstance(holder, dict):
                                 holder["result"] = result
                             if emit_result:
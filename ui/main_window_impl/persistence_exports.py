@@ -197,15 +197,17 @@ class MainWindowPersistenceExportsMixin(MainWindowHost):
 
             def do_save(filepath):
                 def writer(handle) -> None:
-                    for timestamp, text, should_print_ts in self._iter_display_session_rows(
-                        prepared_entries,
-                        runtime_root=runtime_root,
-                        runtime_manifest=runtime_manifest,
-                    ):
-                        if should_print_ts:
-                            handle.write(f"[{timestamp.strftime('%H:%M:%S')}] {text}\n")
-                        else:
-                            handle.write(f"{text}\n")
+                    # 행마다 write를 호출하지 않고 writelines로 한 번에 흘려보낸다.
+                    handle.writelines(
+                        f"[{utils.format_hms(timestamp)}] {text}\n"
+                        if should_print_ts
+                        else f"{text}\n"
+                        for timestamp, text, should_print_ts in self._iter_display_session_rows(
+                            prepared_entries,
+                            runtime_root=runtime_root,
+                            runtime_manifest=runtime_manifest,
+                        )
+                    )
 
                 utils.atomic_write_text_via_writer(
                     filepath,
@@ -241,12 +243,12 @@ class MainWindowPersistenceExportsMixin(MainWindowHost):
                         1,
                     ):
                         if start_time and end_time:
-                            start = f"{start_time.strftime('%H:%M:%S')},{start_time.microsecond // 1000:03d}"
-                            end = f"{end_time.strftime('%H:%M:%S')},{end_time.microsecond // 1000:03d}"
+                            start = f"{utils.format_hms(start_time)},{start_time.microsecond // 1000:03d}"
+                            end = f"{utils.format_hms(end_time)},{end_time.microsecond // 1000:03d}"
                         else:
-                            start = f"{timestamp.strftime('%H:%M:%S')},{timestamp.microsecond // 1000:03d}"
+                            start = f"{utils.format_hms(timestamp)},{timestamp.microsecond // 1000:03d}"
                             fallback_end = timestamp + timedelta(seconds=3)
-                            end = f"{fallback_end.strftime('%H:%M:%S')},{fallback_end.microsecond // 1000:03d}"
+                            end = f"{utils.format_hms(fallback_end)},{fallback_end.microsecond // 1000:03d}"
                         handle.write(f"{index}\n{start} --> {end}\n{text}\n\n")
 
                 utils.atomic_write_text_via_writer(filepath, writer, encoding="utf-8")
@@ -280,12 +282,12 @@ class MainWindowPersistenceExportsMixin(MainWindowHost):
                         1,
                     ):
                         if start_time and end_time:
-                            start = f"{start_time.strftime('%H:%M:%S')}.{start_time.microsecond // 1000:03d}"
-                            end = f"{end_time.strftime('%H:%M:%S')}.{end_time.microsecond // 1000:03d}"
+                            start = f"{utils.format_hms(start_time)}.{start_time.microsecond // 1000:03d}"
+                            end = f"{utils.format_hms(end_time)}.{end_time.microsecond // 1000:03d}"
                         else:
-                            start = f"{timestamp.strftime('%H:%M:%S')}.{timestamp.microsecond // 1000:03d}"
+                            start = f"{utils.format_hms(timestamp)}.{timestamp.microsecond // 1000:03d}"
                             fallback_end = timestamp + timedelta(seconds=3)
-                            end = f"{fallback_end.strftime('%H:%M:%S')}.{fallback_end.microsecond // 1000:03d}"
+                            end = f"{utils.format_hms(fallback_end)}.{fallback_end.microsecond // 1000:03d}"
                         handle.write(f"{index}\n{start} --> {end}\n{text}\n\n")
 
                 utils.atomic_write_text_via_writer(filepath, writer, encoding="utf-8")
@@ -358,7 +360,7 @@ class MainWindowPersistenceExportsMixin(MainWindowHost):
                     total_chars += len(text)
                     paragraph = doc.add_paragraph()
                     if should_print_ts:
-                        ts = timestamp.strftime("%H:%M:%S")
+                        ts = utils.format_hms(timestamp)
                         run = paragraph.add_run(f"[{ts}] ")
                         run.font.size = point_factory(9)
                         run.font.color.rgb = None
@@ -470,7 +472,7 @@ class MainWindowPersistenceExportsMixin(MainWindowHost):
                         total_count += 1
                         total_chars += len(text)
                         if should_print_ts:
-                            ts = timestamp.strftime("%H:%M:%S")
+                            ts = utils.format_hms(timestamp)
                             hwp.HParameterSet.HInsertText.Text = f"[{ts}] {text}\r\n"
                         else:
                             hwp.HParameterSet.HInsertText.Text = f"{text}\r\n"
@@ -651,7 +653,7 @@ class MainWindowPersistenceExportsMixin(MainWindowHost):
                         encoded_text = self._rtf_encode(text)
                         handle.write(
                             (
-                                f"\\cf2[{timestamp.strftime('%H:%M:%S')}]\\cf1 "
+                                f"\\cf2[{utils.format_hms(timestamp)}]\\cf1 "
                                 f"{encoded_text}\\par\n"
                             ).encode("ascii")
                         )
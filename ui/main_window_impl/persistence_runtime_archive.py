@@ -3,7 +3,7 @@
 import hashlib
 import bisect
 import shutil
-from typing import Any, Iterable, cast
+from typing import Any, Iterable, Mapping, Sequence, cast
 from uuid import uuid4
 
 from PyQt6 import QtWidgets
@@ -69,13 +69,18 @@ class MainWindowRuntimeArchiveMixin(MainWindowHost):
     def _build_runtime_entries_fingerprint(
             self,
             entries: Iterable[SubtitleEntry],
+            *,
+            serialized_items: Sequence[Mapping[str, object]] | None = None,
         ) -> dict[str, Any]:
+            """serialized_items를 주면 같은 항목의 to_dict() 결과를 다시 만들지 않고 재사용한다."""
             entry_list = list(entries)
+            if serialized_items is None:
+                serialized_items = [entry.to_dict() for entry in entry_list]
             digest = hashlib.sha256()
-            for entry in entry_list:
+            for item in serialized_items:
                 digest.update(
                     json.dumps(
-                        entry.to_dict(),
+                        item,
                         ensure_ascii=False,
                         sort_keys=True,
                         default=str,
@@ -245,7 +250,11 @@ class MainWindowRuntimeArchiveMixin(MainWindowHost):
             lineage_id: str = "",
             tail_revision: int = 0,
         ) -> None:
-            fingerprint = self._build_runtime_entries_fingerprint(entries)
+            serialized_items = [entry.to_dict() for entry in entries]
+            fingerprint = self._build_runtime_entries_fingerprint(
+                entries,
+                serialized_items=serialized_items,
+            )
             head_items: list[tuple[str, object]] = [
                 ("format", "runtime_tail_checkpoint_v1"),
                 ("version", Config.VERSION),
@@ -270,7 +279,7 @@ class MainWindowRuntimeArchiveMixin(MainWindowHost):
                 checkpoint_path,
                 head_items=head_items,
                 sequence_key="subtitles",
-                sequence_items=utils.iter_serialized_subtitles(entries),
+                sequence_items=serialized_items,
                 ensure_ascii=False,
             )
 
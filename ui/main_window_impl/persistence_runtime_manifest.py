@@ -33,8 +33,7 @@ class MainWindowRuntimeManifestMixin(MainWindowHost):
             manifest_loaded = False
 
             try:
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    loaded_manifest = json.load(f)
+                loaded_manifest = utils.load_json_file(manifest_path)
                 if not isinstance(loaded_manifest, dict):
                     raise ValueError("지원하지 않는 runtime manifest 구조입니다.")
                 if str(loaded_manifest.get("format", "") or "") != "runtime_session_manifest_v1":
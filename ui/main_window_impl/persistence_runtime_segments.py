@@ -42,7 +42,12 @@ class MainWindowRuntimeSegmentsMixin(MainWindowHost):
             if not flush_entries:
                 return False
 
-            flush_fingerprint = self._build_runtime_entries_fingerprint(flush_entries)
+            # 지문 계산과 segment 기록이 같은 직렬화 결과를 공유한다.
+            flush_items = [entry.to_dict() for entry in flush_entries]
+            flush_fingerprint = self._build_runtime_entries_fingerprint(
+                flush_entries,
+                serialized_items=flush_items,
+            )
             self._runtime_segment_flush_in_progress = True
             segment_index = int(self._runtime_next_segment_index)
             segment_path = self._runtime_session_root / f"segment_{segment_index:06d}.json"
@@ -79,7 +84,7 @@ class MainWindowRuntimeSegmentsMixin(MainWindowHost):
                         segment_path,
                         head_items=head_items,
                         sequence_key="subtitles",
-                        sequence_items=utils.iter_serialized_subtitles(flush_entries),
+                        sequence_items=flush_items,
                         ensure_ascii=False,
                     )
                     self._emit_control_message(
@@ -306,10 +311,6 @@ class MainWindowRuntimeSegmentsMixin(MainWindowHost):
             while len(cache_keys) > 3:
                 evicted_key = cache_keys.pop(0)
                 cache_map.pop(evicted_key, None)
-                search_cache = dict(self.__dict__.get("_runtime_segment_search_text_cache", {}))
-                if evicted_key in search_cache:
-                    search_cache.pop(evicted_key, None)
-                    self._runtime_segment_search_text_cache = search_cache
             self._runtime_segment_cache_keys = cache_keys
             self._runtime_segment_cache_entries_by_key = cache_map
             self._runtime_segment_cache_key = cache_key
@@ -322,8 +323,7 @@ class MainWindowRuntimeSegmentsMixin(MainWindowHost):
             source: str = "",
         ) -> tuple[dict[str, Any], list[SubtitleEntry], int]:
             file_path = Path(path)
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = utils.load_json_file(file_path)
             if not isinstance(data, dict):
                 raise ValueError(f"지원하지 않는 JSON 구조: {file_path.name}")
             entries, skipped = self._deserialize_subtitles(
@@ -437,13 +437,25 @@ class MainWindowRuntimeSegmentsMixin(MainWindowHost):
                 logger.warning("runtime segment search path 거부: %s", relative_path)
                 return []
             cache_key = str(segment_path.resolve())
-            search_cache = dict(self.__dict__.get("_runtime_segment_search_text_cache", {}))
-            if cache_key in search_cache:
-                return search_cache[cache_key]
+            # 줄넘김 정리 옵션이 바뀌면 정규화 결과가 달라지므로 캐시를 새로 만든다.
+            clean_newlines = self._is_auto_clean_newlines_enabled()
+            search_cache = self.__dict__.get("_runtime_segment_search_text_cache")
+            if (
+                not isinstance(search_cache, dict)
+                or self.__dict__.get("_runtime_segment_search_text_cache_mode") != clean_newlines
+            ):
+                search_cache = {}
+                self._runtime_segment_search_text_cache = search_cache
+                self._runtime_segment_search_text_cache_mode = clean_newlines
+            cached_texts = search_cache.get(cache_key)
+            if cached_texts is not None:
+                return cached_texts
             texts = [
                 self._normalize_subtitle_text_for_option(entry.text).lower()
                 for entry in self._load_runtime_segment_entries(segment_info)
             ]
             search_cache[cache_key] = texts
-            self._runtime_segment_search_text_cache = search_cache
+            # 검색 텍스트는 항목 캐시(3개)와 따로 보관해 반복 검색마다 segment 파일을 다시 읽지 않는다.
+            while len(search_cache) > Config.RUNTIME_SEGMENT_SEARCH_CACHE_LIMIT:
+                search_cache.pop(next(iter(search_cache)), None)
             return texts
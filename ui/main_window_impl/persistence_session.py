@@ -229,8 +229,7 @@ class MainWindowPersistenceSessionMixin(MainWindowHost):
             def background_load():
                 try:
                     try:
-                        with open(path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
+                        data = utils.load_json_file(path)
                     except json.JSONDecodeError as json_err:
                         if recovery:
                             try:
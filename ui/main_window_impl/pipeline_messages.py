@@ -216,6 +216,8 @@ class MainWindowPipelineMessagesMixin(PipelineMessagesBase):
                 processed += self._drain_coalesced_worker_messages(
                     max_items=remaining_budget,
                 )
+            # 한 tick 동안 누적된 실시간 저장 줄을 한 번에 디스크로 내보낸다.
+            self._flush_realtime_file()
             if self._has_pending_message_backlog():
                 self._schedule_followup_message_queue_drain()
         except Exception as e:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import queue
+import time
 from datetime import datetime
 from importlib import import_module
 from typing import TYPE_CHECKING
@@ -46,12 +47,35 @@ class MainWindowPipelineStreamMixin(PipelineStreamBase):
         return left + " " + right
 
     def _write_realtime_line(self, line: str) -> None:
+        """실시간 저장 파일에 한 줄을 쓴다. flush는 큐 처리 tick 단위로 모아서 수행한다."""
         if not line or not self.realtime_file:
             return
         try:
             self.realtime_file.write(line)
-            self.realtime_file.flush()
             self._realtime_error_count = 0
+            self._realtime_flush_pending = True
+        except OSError as e:
+            self._realtime_flush_pending = False
+            self._disable_realtime_save_for_run(
+                message=str(e),
+                toast_message="실시간 저장 쓰기 실패로 이번 실행의 실시간 저장을 중단합니다.",
+                error=e,
+            )
+
+    def _flush_realtime_file(self) -> None:
+        if not bool(self.__dict__.get("_realtime_flush_pending", False)):
+            return
+        now = time.monotonic()
+        last_flush_at = float(self.__dict__.get("_realtime_last_flush_at", 0.0) or 0.0)
+        if last_flush_at and now - last_flush_at < Config.REALTIME_FLUSH_MIN_INTERVAL:
+            # 최소 간격 안에서는 버퍼에 모아 두고 다음 tick에서 한 번에 내보낸다.
+            return
+        self._realtime_flush_pending = False
+        self._realtime_last_flush_at = now
+        if not self.realtime_file:
+            return
+        try:
+            self.realtime_file.flush()
         except OSError as e:
             self._disable_realtime_save_for_run(
                 message=str(e),
@@ -112,7 +136,7 @@ class MainWindowPipelineStreamMixin(PipelineStreamBase):
                     self.subtitles.append(entry)
                     self._cached_total_chars += entry.char_count
                     self._cached_total_words += entry.word_count
-                    realtime_line = f"[{entry.timestamp.strftime('%H:%M:%S')}] {new_text}\n"
+                    realtime_line = f"[{utils.format_hms(entry.timestamp)}] {new_text}\n"
                     result.update(
                         changed=True,
                         action="append",
@@ -127,7 +151,7 @@ class MainWindowPipelineStreamMixin(PipelineStreamBase):
                 self.subtitles.append(entry)
                 self._cached_total_chars += entry.char_count
                 self._cached_total_words += entry.word_count
-                realtime_line = f"[{entry.timestamp.strftime('%H:%M:%S')}] {new_text}\n"
+                realtime_line = f"[{utils.format_hms(entry.timestamp)}] {new_text}\n"
                 result.update(
                     changed=True,
                     action="append",
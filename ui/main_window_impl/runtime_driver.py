@@ -42,6 +42,13 @@ class MainWindowRuntimeDriverMixin(RuntimeBase):
         settings = self.__dict__.get("settings")
         if settings is None:
             return False
+        saved_values = self.__dict__.get("_saved_setting_values")
+        if saved_values is None:
+            saved_values = {}
+            self._saved_setting_values = saved_values
+        # 마지막으로 동기화한 값과 같으면 setValue/sync 디스크 쓰기를 건너뛴다.
+        if key in saved_values and saved_values[key] == value:
+            return True
         try:
             settings.setValue(key, value)
             sync = getattr(settings, "sync", None)
@@ -52,6 +59,7 @@ class MainWindowRuntimeDriverMixin(RuntimeBase):
                 status_value = status()
                 if not self._is_settings_status_ok(status_value):
                     raise RuntimeError(f"QSettings status={status_value}")
+            saved_values[key] = value
             return True
         except Exception as exc:
             logger.warning("%s 실패 (%s): %s", context, key, exc)
@@ -64,6 +72,36 @@ class MainWindowRuntimeDriverMixin(RuntimeBase):
                     toaster(f"{context} 실패: {exc}", "warning", 4000)
             return False
 
+    def _schedule_setting_value_save(
+        self,
+        key: str,
+        value: object,
+        *,
+        context: str = "설정 저장",
+    ) -> None:
+        pending = self.__dict__.get("_pending_setting_values")
+        if pending is None:
+            pending = {}
+            self._pending_setting_values = pending
+        pending[key] = (value, context)
+        timer = self.__dict__.get("_setting_save_timer")
+        if timer is None:
+            self._flush_pending_setting_values()
+            return
+        # 연속 토글/글자 크기 조절은 마지막 값만 한 번 디스크에 동기화한다.
+        timer.start(int(Config.SETTINGS_SAVE_DEBOUNCE_MS))
+
+    def _flush_pending_setting_values(self) -> None:
+        timer = self.__dict__.get("_setting_save_timer")
+        if timer is not None and timer.isActive():
+            timer.stop()
+        pending = self.__dict__.get("_pending_setting_values")
+        if not pending:
+            return
+        self._pending_setting_values = {}
+        for key, (value, context) in pending.items():
+            self._save_setting_value(key, value, context=context)
+
     def _clear_session_db_identity(self) -> None:
         self.current_session_lineage_id = ""
         self.current_db_session_id = None
@@ -124,6 +162,7 @@ class MainWindowRuntimeDriverMixin(RuntimeBase):
 
     def _reset_realtime_save_run_state(self) -> None:
         self._realtime_error_count = 0
+        self._realtime_last_flush_at = 0.0
         self._set_realtime_save_status("inactive")
 
     def _get_db_degraded_message(self) -> str:
@@ -179,6 +218,7 @@ class MainWindowRuntimeDriverMixin(RuntimeBase):
         realtime_file = self.__dict__.get("realtime_file")
         if realtime_file is None:
             return
+        self._realtime_flush_pending = False
         try:
             realtime_file.close()
         except Exception:
@@ -458,7 +498,7 @@ class MainWindowRuntimeDriverMixin(RuntimeBase):
     def _toggle_auto_clean_newlines_option(self) -> None:
         enabled = self._is_auto_clean_newlines_enabled()
         self.auto_clean_newlines_enabled = enabled
-        self._save_setting_value(
+        self._schedule_setting_value_save(
             "auto_clean_newlines",
             enabled,
             context="자동 줄넘김 설정 저장",
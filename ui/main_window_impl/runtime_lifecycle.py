@@ -10,8 +10,8 @@ from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QCloseEvent
+from PyQt6.QtCore import QEvent, QTimer
+from PyQt6.QtGui import QCloseEvent, QShowEvent
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
 
 from core.config import Config
@@ -87,7 +87,7 @@ class MainWindowRuntimeLifecycleMixin(RuntimeLifecycleBase):
             self.current_url = url
             committee_name = self.url_history.get(url, "") or self._autodetect_tag(url)
 
-            self.subtitle_text.clear()
+            self._reset_subtitle_document()
             self.capture_state = create_empty_capture_state()
             self._bind_subtitles_to_capture_state()
             self.live_capture_ledger = create_empty_live_capture_ledger()
@@ -101,6 +101,7 @@ class MainWindowRuntimeLifecycleMixin(RuntimeLifecycleBase):
             self._last_render_chunk_specs = []
             self._last_printed_ts = None
             self._rendered_entry_text_spans = {}
+            self._last_render_tail_start = None
             self.search_matches = []
             self.search_idx = 0
             search_count = self.__dict__.get("search_count")
@@ -709,6 +710,21 @@ class MainWindowRuntimeLifecycleMixin(RuntimeLifecycleBase):
             except Exception:
                 logger.debug("종료 대기 중 큐 처리 실패", exc_info=True)
 
+    def showEvent(self, a0: QShowEvent | None) -> None:
+        handler = getattr(super(), "showEvent", None)
+        if a0 is not None and callable(handler):
+            handler(a0)
+        # 트레이/초기 표시 전 숨김 상태에서 미뤄 둔 자막 렌더를 반영한다.
+        self._resume_deferred_subtitle_render()
+
+    def changeEvent(self, a0: QEvent | None) -> None:
+        handler = getattr(super(), "changeEvent", None)
+        if a0 is not None and callable(handler):
+            handler(a0)
+        if a0 is not None and a0.type() == QEvent.Type.WindowStateChange:
+            # 최소화 해제 시 미뤄 둔 자막 렌더를 반영한다.
+            self._resume_deferred_subtitle_render()
+
     def closeEvent(self, a0: QCloseEvent | None) -> None:
         main_window_mod = _main_window_public()
         if a0 is None:
@@ -824,6 +840,7 @@ class MainWindowRuntimeLifecycleMixin(RuntimeLifecycleBase):
         self._cleanup_runtime_session_archive(remove_files=True)
         self._clear_recovery_state()
 
+        self._flush_pending_setting_values()
         self._save_setting_value(
             "geometry",
             self.saveGeometry(),
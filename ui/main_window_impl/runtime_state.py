@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 from PyQt6.QtCore import QSettings, QTimer
-from PyQt6.QtGui import QColor, QFont, QIcon, QTextCharFormat
+from PyQt6.QtGui import QColor, QFont, QIcon, QTextCharFormat, QTextCursor
 
 from core.config import Config
 from core.live_capture import create_empty_live_capture_ledger
@@ -25,6 +25,7 @@ from ui.main_window_common import (
     DatabaseManagerClass,
     DatabaseProtocol,
     MainWindowMessageQueue,
+    SearchMatch,
     ToastWidget,
 )
 from ui.main_window_impl.contracts import RuntimeHost
@@ -63,6 +64,13 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
             Config.AUTO_CLEAN_NEWLINES_DEFAULT,
             type=bool,
         )
+        self._saved_setting_values: dict[str, object] = {
+            "dark_theme": self.is_dark_theme,
+            "font_size": self.font_size,
+            "minimize_to_tray": self.minimize_to_tray,
+            "keep_browser_on_stop": self.keep_browser_on_stop,
+            "auto_clean_newlines": self.auto_clean_newlines_enabled,
+        }
 
         self.message_queue: Any = MainWindowMessageQueue(
             self, maxsize=Config.MESSAGE_QUEUE_MAX_SIZE
@@ -142,9 +150,15 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
         self._last_render_show_ts = None
         self._last_render_chunk_specs: list[tuple[str, str, str]] = []
         self._rendered_entry_text_spans: dict[int, tuple[int, int]] = {}
+        self._search_cursor: QTextCursor | None = None
+        self._last_render_tail_start: int | None = None
         self._pending_ui_refresh_flags = 0
         self._pending_ui_refresh_force_full = False
         self._ui_refresh_scheduled = False
+        self._last_ui_render_at: float | None = None
+        self._render_deferred_while_hidden = False
+        self._last_preview_text: str | None = None
+        self._last_stats_values: tuple[int, int, int, int, int | None] | None = None
         self._use_async_ui_refresh = True
         self._pending_status_text = ""
         self._pending_status_type = "info"
@@ -158,6 +172,8 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
         self.active_toasts: list[ToastWidget] = []
 
         self.realtime_file = None
+        self._realtime_flush_pending = False
+        self._realtime_last_flush_at = 0.0
         self._realtime_error_count = 0
         self._realtime_save_status = "inactive"
         self._realtime_save_path = ""
@@ -182,6 +198,12 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
         self._runtime_render_window_cache_key: tuple[int, int, int, int] | None = None
         self._runtime_render_window_cache_entries: list[SubtitleEntry] = []
         self._runtime_segment_search_text_cache: dict[str, list[str]] = {}
+        self._runtime_segment_search_text_cache_mode: bool | None = None
+        self._tail_search_text_cache: dict[str, str] = {}
+        self._tail_search_text_cache_mode: bool | None = None
+        self._last_tail_search_result: (
+            tuple[str, tuple[object, ...], list[SearchMatch]] | None
+        ) = None
         self._runtime_search_in_progress = False
         self._runtime_search_revision = 0
         self._runtime_search_query = ""
@@ -211,6 +233,10 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
         self._pending_subtitle_reset_timer.timeout.connect(
             self._commit_scheduled_subtitle_reset
         )
+        self._pending_setting_values: dict[str, tuple[object, str]] = {}
+        self._setting_save_timer = QTimer(self)
+        self._setting_save_timer.setSingleShot(True)
+        self._setting_save_timer.timeout.connect(self._flush_pending_setting_values)
         self._runtime_search_debounce_timer = QTimer(self)
         self._runtime_search_debounce_timer.setSingleShot(True)
         self._runtime_search_debounce_timer.timeout.connect(
@@ -219,6 +245,7 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
         self._detached_drivers: list[Any] = []
         self._detached_drivers_lock = threading.Lock()
         self._last_subtitle_frame_path = ()
+        self._observer_quiet_reliable = False
 
         self.connection_status = "disconnected"
         self.last_ping_time = 0
@@ -263,6 +290,7 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
         self._restoring_destructive_undo = False
         self._startup_recovery_prompted = False
         self._db_history_dialog_state: dict[str, Any] | None = None
+        self._db_history_dialog_widgets: dict[str, Any] | None = None
         self._db_search_dialog_state: dict[str, Any] | None = None
         self._active_background_threads: set[threading.Thread] = set()
         self._active_background_threads_lock = threading.Lock()
@@ -280,7 +308,6 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
         self._create_menu()
         self._create_ui()
         self._apply_theme()
-        self._setup_shortcuts()
 
         self.queue_timer = QTimer(self)
         self.queue_timer.timeout.connect(self._process_message_queue)
@@ -305,11 +332,6 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
 
         self._initialize_database_state()
 
-        try:
-            self._cleanup_orphan_runtime_archives()
-        except Exception:
-            logger.debug("runtime archive 정리 실패", exc_info=True)
-
         geometry = self.settings.value("geometry")
         if geometry:
             self.restoreGeometry(geometry)
@@ -320,8 +342,17 @@ class MainWindowRuntimeStateMixin(RuntimeStateBase):
         self._setup_tray()
         self._flush_startup_warnings()
         self._notify_initial_db_degraded_state()
+        # 첫 화면 표시에 필요 없는 작업은 이벤트 루프가 돈 뒤로 미룬다 (복구 확인보다 먼저 실행).
+        QTimer.singleShot(0, self._finish_deferred_startup)
         QTimer.singleShot(0, self._prompt_session_recovery_if_available)
 
+    def _finish_deferred_startup(self) -> None:
+        self._setup_shortcuts()
+        try:
+            self._cleanup_orphan_runtime_archives()
+        except Exception:
+            logger.debug("runtime archive 정리 실패", exc_info=True)
+
     def _initialize_database_state(self) -> None:
         self.db = None
         self._db_tasks_inflight = set()
@@ -6,6 +6,65 @@ from ui.main_window_common import *
 from ui.main_window_types import MainWindowHost
 
 
+# 단축키/정보 대화상자 본문은 호출마다 다시 만들지 않도록 모듈 로드 시 한 번만 구성
+_SHORTCUTS_HTML = """
+    <h2>⌨️ 키보드 단축키</h2>
+
+    <h3>📋 기본 조작</h3>
+    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
+    <tr style="background-color: #f0f0f0;"><th>단축키</th><th>기능</th></tr>
+    <tr><td><b>F5</b></td><td>추출 시작</td></tr>
+    <tr><td><b>Escape</b></td><td>검색창 닫기 / 추출 중지</td></tr>
+    <tr><td><b>Ctrl+Q</b></td><td>프로그램 종료</td></tr>
+    </table>
+
+    <h3>🔍 검색 및 편집</h3>
+    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
+    <tr style="background-color: #f0f0f0;"><th>단축키</th><th>기능</th></tr>
+    <tr><td><b>Ctrl+F</b></td><td>검색창 열기</td></tr>
+    <tr><td><b>F3</b></td><td>다음 검색 결과</td></tr>
+    <tr><td><b>Shift+F3</b></td><td>이전 검색 결과</td></tr>
+    <tr><td><b>Ctrl+E</b></td><td>자막 편집</td></tr>
+    <tr><td><b>Delete</b></td><td>자막 삭제</td></tr>
+    <tr><td><b>Ctrl+Shift+C</b></td><td>전체 자막 복사</td></tr>
+    <tr><td><b>Ctrl+C</b></td><td>선택한 텍스트 복사</td></tr>
+    </table>
+
+    <h3>💾 저장</h3>
+    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
+    <tr style="background-color: #f0f0f0;"><th>단축키</th><th>기능</th></tr>
+    <tr><td><b>Ctrl+S</b></td><td>TXT 저장</td></tr>
+    <tr><td><b>Ctrl+Shift+S</b></td><td>세션 저장</td></tr>
+    <tr><td><b>Ctrl+O</b></td><td>세션 불러오기</td></tr>
+    </table>
+
+    <h3>🎨 보기</h3>
+    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
+    <tr style="background-color: #f0f0f0;"><th>단축키</th><th>기능</th></tr>
+    <tr><td><b>Ctrl+T</b></td><td>테마 전환</td></tr>
+    <tr><td><b>Ctrl++</b></td><td>글자 크기 키우기</td></tr>
+    <tr><td><b>Ctrl+-</b></td><td>글자 크기 줄이기</td></tr>
+    <tr><td><b>F1</b></td><td>사용법 가이드</td></tr>
+    </table>
+    """
+
+_ABOUT_HTML = f"""
+    <h2>🏛️ 국회 의사중계 자막 추출기</h2>
+    <p><b>버전:</b> {Config.VERSION}</p>
+    <p><b>설명:</b> 국회 의사중계 웹사이트에서 실시간 AI 자막을<br>
+    자동으로 추출하고 저장하는 프로그램입니다.</p>
+
+    <h3>📦 필요 라이브러리</h3>
+    <ul>
+    <li>PyQt6</li>
+    <li>selenium</li>
+    <li>python-docx (DOCX 저장용)</li>
+    </ul>
+
+    <p><b>© 2024-2026</b></p>
+    """
+
+
 class MainWindowUIHelpMixin(MainWindowHost):
     def _show_guide(self):
             """사용법 가이드 표시"""
@@ -48,50 +107,10 @@ class MainWindowUIHelpMixin(MainWindowHost):
 
     def _show_shortcuts(self):
             """키보드 단축키 목록 표시"""
-            shortcuts = """
-    <h2>⌨️ 키보드 단축키</h2>
-
-    <h3>📋 기본 조작</h3>
-    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
-    <tr style="background-color: #f0f0f0;"><th>단축키</th><th>기능</th></tr>
-    <tr><td><b>F5</b></td><td>추출 시작</td></tr>
-    <tr><td><b>Escape</b></td><td>검색창 닫기 / 추출 중지</td></tr>
-    <tr><td><b>Ctrl+Q</b></td><td>프로그램 종료</td></tr>
-    </table>
-
-    <h3>🔍 검색 및 편집</h3>
-    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
-    <tr style="background-color: #f0f0f0;"><th>단축키</th><th>기능</th></tr>
-    <tr><td><b>Ctrl+F</b></td><td>검색창 열기</td></tr>
-    <tr><td><b>F3</b></td><td>다음 검색 결과</td></tr>
-    <tr><td><b>Shift+F3</b></td><td>이전 검색 결과</td></tr>
-    <tr><td><b>Ctrl+E</b></td><td>자막 편집</td></tr>
-    <tr><td><b>Delete</b></td><td>자막 삭제</td></tr>
-    <tr><td><b>Ctrl+Shift+C</b></td><td>전체 자막 복사</td></tr>
-    <tr><td><b>Ctrl+C</b></td><td>선택한 텍스트 복사</td></tr>
-    </table>
-
-    <h3>💾 저장</h3>
-    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
-    <tr style="background-color: #f0f0f0;"><th>단축키</th><th>기능</th></tr>
-    <tr><td><b>Ctrl+S</b></td><td>TXT 저장</td></tr>
-    <tr><td><b>Ctrl+Shift+S</b></td><td>세션 저장</td></tr>
-    <tr><td><b>Ctrl+O</b></td><td>세션 불러오기</td></tr>
-    </table>
-
-    <h3>🎨 보기</h3>
-    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
-    <tr style="background-color: #f0f0f0;"><th>단축키</th><th>기능</th></tr>
-    <tr><td><b>Ctrl+T</b></td><td>테마 전환</td></tr>
-    <tr><td><b>Ctrl++</b></td><td>글자 크기 키우기</td></tr>
-    <tr><td><b>Ctrl+-</b></td><td>글자 크기 줄이기</td></tr>
-    <tr><td><b>F1</b></td><td>사용법 가이드</td></tr>
-    </table>
-    """
             msg = QMessageBox(self)
             msg.setWindowTitle("키보드 단축키")
             msg.setTextFormat(Qt.TextFormat.RichText)
-            msg.setText(shortcuts)
+            msg.setText(_SHORTCUTS_HTML)
             msg.setIcon(QMessageBox.Icon.Information)
             msg.exec()
 
@@ -137,25 +156,10 @@ class MainWindowUIHelpMixin(MainWindowHost):
 
     def _show_about(self):
             """프로그램 정보 표시"""
-            about = f"""
-    <h2>🏛️ 국회 의사중계 자막 추출기</h2>
-    <p><b>버전:</b> {Config.VERSION}</p>
-    <p><b>설명:</b> 국회 의사중계 웹사이트에서 실시간 AI 자막을<br>
-    자동으로 추출하고 저장하는 프로그램입니다.</p>
-
-    <h3>📦 필요 라이브러리</h3>
-    <ul>
-    <li>PyQt6</li>
-    <li>selenium</li>
-    <li>python-docx (DOCX 저장용)</li>
-    </ul>
-
-    <p><b>© 2024-2026</b></p>
-    """
             msg = QMessageBox(self)
             msg.setWindowTitle("정보")
             msg.setTextFormat(Qt.TextFormat.RichText)
-            msg.setText(about)
+            msg.setText(_ABOUT_HTML)
             msg.setIcon(QMessageBox.Icon.Information)
             msg.exec()
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from importlib import import_module
 
 from core.url_policy import (
@@ -17,6 +18,9 @@ def _ui_public():
     return import_module("ui.main_window_ui")
 
 
+_XCODE_PATTERN = re.compile(r"xcode=([^&]+)")
+
+
 class MainWindowUIHistoryPresetsMixin(MainWindowHost):
     def _load_url_history(self):
             """URL 히스토리 로드 - {url: tag} 형태"""
@@ -52,11 +56,13 @@ class MainWindowUIHistoryPresetsMixin(MainWindowHost):
                     self.url_history,
                     Config.MAX_URL_HISTORY,
                 )
+                # 최근 URL 목록은 시작할 때마다 갱신되는 편의 데이터라 fsync 대기를 생략한다.
                 _ui_public().utils.atomic_write_json(
                     Config.URL_HISTORY_FILE,
                     self.url_history,
                     ensure_ascii=False,
                     indent=2,
+                    durable=False,
                 )
             except Exception as e:
                 logger.warning(f"URL 히스토리 저장 오류: {e}")
@@ -101,53 +107,80 @@ class MainWindowUIHistoryPresetsMixin(MainWindowHost):
             self._refresh_url_combo()
 
 
+    def _get_committee_tag_index(self) -> tuple[dict[str, str], dict[str, str]]:
+            """프리셋 URL/xcode -> 태그 인덱스 (프리셋이 바뀌면 무효화)"""
+            index = self.__dict__.get("_committee_tag_index")
+            if index is not None:
+                return index
+
+            # 약칭이 있으면 약칭 사용 (더 짧고 보기 좋음), 같은 이름이면 먼저 정의된 약칭 우선
+            abbr_by_name: dict[str, str] = {}
+            for abbr, full_name in Config.COMMITTEE_ABBREVIATIONS.items():
+                abbr_by_name.setdefault(full_name, abbr)
+
+            tag_by_url: dict[str, str] = {}
+            tag_by_xcode: dict[str, str] = {}
+            for name, preset_url in self.committee_presets.items():
+                tag = abbr_by_name.get(name, name)
+                tag_by_url.setdefault(preset_url, tag)
+                match = _XCODE_PATTERN.search(preset_url)
+                if match:
+                    tag_by_xcode.setdefault(match.group(1), tag)
+
+            index = (tag_by_url, tag_by_xcode)
+            self._committee_tag_index = index
+            return index
+
+
+    def _invalidate_committee_tag_index(self) -> None:
+            self._committee_tag_index = None
+
+
     def _autodetect_tag(self, url):
             """URL을 기반으로 위원회 이름/약칭 자동 감지"""
+            tag_by_url, tag_by_xcode = self._get_committee_tag_index()
+
             # 1. 정확한 URL 매칭 확인 (프리셋)
-            for name, preset_url in self.committee_presets.items():
-                if url == preset_url:
-                    # 약칭이 있으면 약칭 사용 (더 짧고 보기 좋음)
-                    for abbr, full_name in Config.COMMITTEE_ABBREVIATIONS.items():
-                        if full_name == name:
-                            return abbr
-                    return name
+            tag = tag_by_url.get(url)
+            if tag is not None:
+                return tag
 
             # 2. xcode 파라미터 매칭 (숫자 또는 문자열 xcode 모두 지원)
-            import re
-
-            match = re.search(r"xcode=([^&]+)", url)
+            match = _XCODE_PATTERN.search(url)
             if match:
-                xcode = match.group(1)
-                # 프리셋에서 해당 xcode를 가진 URL 찾기
-                for name, preset_url in self.committee_presets.items():
-                    if f"xcode={xcode}" in preset_url:
-                        # 약칭 리턴
-                        for abbr, full_name in Config.COMMITTEE_ABBREVIATIONS.items():
-                            if full_name == name:
-                                return abbr
-                        return name
+                return tag_by_xcode.get(match.group(1), "")
 
             return ""
 
 
     def _refresh_url_combo(self):
             """URL 콤보박스 새로고침"""
-            current_text = self.url_combo.currentText()
-            self.url_combo.clear()
-
-            for url, tag in self.url_history.items():
-                if tag:
-                    self.url_combo.addItem(f"[{tag}] {url}", url)
+            combo = self.url_combo
+            current_text = combo.currentText()
+            # 다시 채우는 동안 항목별 시그널/다시 그리기를 막고 라벨을 한 번에 추가한다.
+            combo.blockSignals(True)
+            combo.setUpdatesEnabled(False)
+            try:
+                combo.clear()
+                if self.url_history:
+                    combo.addItems(
+                        [
+                            f"[{tag}] {url}" if tag else url
+                            for url, tag in self.url_history.items()
+                        ]
+                    )
+                    for index, url in enumerate(self.url_history):
+                        combo.setItemData(index, url)
                 else:
-                    self.url_combo.addItem(url, url)
-
-            # 기본 URL 추가
-            if not self.url_history:
-                self.url_combo.addItem(Config.DEFAULT_URL)
+                    # 기본 URL 추가
+                    combo.addItem(Config.DEFAULT_URL)
 
-            # 이전 텍스트 복원
-            if current_text:
-                self.url_combo.setCurrentText(current_text)
+                # 이전 텍스트 복원
+                if current_text:
+                    combo.setCurrentText(current_text)
+            finally:
+                combo.setUpdatesEnabled(True)
+                combo.blockSignals(False)
 
 
     def _get_current_url(self):
@@ -221,6 +254,7 @@ class MainWindowUIHistoryPresetsMixin(MainWindowHost):
             """프리셋 파일에서 로드 (없으면 기본값 사용)"""
             self.committee_presets = dict(Config.DEFAULT_COMMITTEE_PRESETS)
             self.custom_presets = {}
+            self._invalidate_committee_tag_index()
 
             try:
                 if _ui_public().Path(Config.PRESET_FILE).exists():
@@ -260,6 +294,7 @@ class MainWindowUIHistoryPresetsMixin(MainWindowHost):
 
     def _save_committee_presets(self):
             """프리셋을 파일에 저장"""
+            self._invalidate_committee_tag_index()
             try:
                 data = {"presets": self.committee_presets, "custom": self.custom_presets}
                 _ui_public().utils.atomic_write_json(
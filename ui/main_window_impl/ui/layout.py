@@ -292,6 +292,8 @@ class MainWindowUILayoutMixin(MainWindowHost):
 
             self.preview_label = QLabel("")
             self.preview_label.setObjectName("previewText")
+            # 자막 원문을 HTML로 해석하지 않도록 리치 텍스트 감지를 끈다.
+            self.preview_label.setTextFormat(Qt.TextFormat.PlainText)
             self.preview_label.setWordWrap(True)
 
             preview_layout.addWidget(preview_title)
@@ -396,10 +398,10 @@ class MainWindowUILayoutMixin(MainWindowHost):
             layout.addWidget(self.search_frame)
 
             # === 상태바 - 모던 디자인 ===
-            status_frame = QFrame()
-            status_frame.setObjectName("statusBar")
-            status_frame.setFixedHeight(48)  # 높이 고정
-            status_layout = QHBoxLayout(status_frame)
+            self.status_frame = QFrame()
+            self.status_frame.setObjectName("statusBar")
+            self.status_frame.setFixedHeight(48)  # 높이 고정
+            status_layout = QHBoxLayout(self.status_frame)
             status_layout.setContentsMargins(16, 4, 16, 4)  # 상하 여백 축소
             status_layout.setSpacing(12)
 
@@ -445,7 +447,7 @@ class MainWindowUILayoutMixin(MainWindowHost):
             status_layout.addWidget(self.db_status_label)
             status_layout.addWidget(self.count_label)
 
-            layout.addWidget(status_frame)
+            layout.addWidget(self.status_frame)
 
             # 검색 상태
             self.search_matches = []
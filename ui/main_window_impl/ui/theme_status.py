@@ -6,6 +6,32 @@ from ui.main_window_common import *
 from ui.main_window_types import MainWindowHost
 
 
+# 상태 타입별 (아이콘, 스타일시트)를 미리 만들어 호출마다 dict/f-string을 다시 만들지 않는다.
+_STATUS_STYLES: dict[str, tuple[str, str]] = {
+    "info": ("ℹ️", "color: #4fc3f7;"),
+    "success": ("✅", "color: #4caf50;"),
+    "warning": ("⚠️", "color: #ff9800;"),
+    "error": ("❌", "color: #f44336;"),
+    "running": ("🔄", "color: #ab47bc;"),
+}
+_DEFAULT_STATUS_STYLE = ("", "color: #eaeaea;")
+
+# 연결 상태별 (아이콘, 표시 텍스트, 스타일시트)
+_CONNECTION_STATUS_STYLES: dict[str, tuple[str, str, str]] = {
+    status: (
+        icon,
+        text,
+        f"background: transparent; border: none; font-size: 12px; color: {color};",
+    )
+    for status, icon, color, text in (
+        ("connected", "🟢", "#4caf50", "연결됨"),
+        ("disconnected", "🔴", "#f44336", "연결 끊김"),
+        ("reconnecting", "🟡", "#ff9800", "재연결 중..."),
+        ("", "⚫", "#888", "알 수 없음"),
+    )
+}
+
+
 class MainWindowUIThemeStatusMixin(MainWindowHost):
     def _apply_theme(self):
             # 테마 전환은 전체 스타일시트 교체만으로 처리한다.
@@ -24,7 +50,7 @@ class MainWindowUIThemeStatusMixin(MainWindowHost):
 
     def _toggle_theme(self):
             self.is_dark_theme = not self.is_dark_theme
-            self._save_setting_value(
+            self._schedule_setting_value_save(
                 "dark_theme",
                 self.is_dark_theme,
                 context="테마 설정 저장",
@@ -35,7 +61,7 @@ class MainWindowUIThemeStatusMixin(MainWindowHost):
     def _toggle_tray_option(self):
             """트레이 최소화 옵션 토글"""
             self.minimize_to_tray = self.tray_action.isChecked()
-            self._save_setting_value(
+            self._schedule_setting_value_save(
                 "minimize_to_tray",
                 self.minimize_to_tray,
                 context="트레이 최소화 설정 저장",
@@ -49,7 +75,7 @@ class MainWindowUIThemeStatusMixin(MainWindowHost):
     def _toggle_keep_browser_on_stop(self):
             """수동 중지 시 Chrome 창 유지 옵션 토글"""
             self.keep_browser_on_stop = self.keep_browser_action.isChecked()
-            self._save_setting_value(
+            self._schedule_setting_value_save(
                 "keep_browser_on_stop",
                 self.keep_browser_on_stop,
                 context="Chrome 유지 설정 저장",
@@ -141,24 +167,8 @@ class MainWindowUIThemeStatusMixin(MainWindowHost):
             if status_label is None:
                 self._last_status_message = str(text or "")
                 return
-            icons = {
-                "info": "ℹ️",
-                "success": "✅",
-                "warning": "⚠️",
-                "error": "❌",
-                "running": "🔄",
-            }
-            colors = {
-                "info": "#4fc3f7",
-                "success": "#4caf50",
-                "warning": "#ff9800",
-                "error": "#f44336",
-                "running": "#ab47bc",
-            }
-            icon = icons.get(status_type, "")
-            color = colors.get(status_type, "#eaeaea")
+            icon, current_style = _STATUS_STYLES.get(status_type, _DEFAULT_STATUS_STYLE)
             rendered = f"{icon} {text}"[:100]
-            current_style = f"color: {color};"
             if status_label.text() != rendered:
                 status_label.setText(rendered)
             if status_label.styleSheet() != current_style:
@@ -195,13 +205,9 @@ class MainWindowUIThemeStatusMixin(MainWindowHost):
             self.connection_status = status
 
             # 상태별 아이콘과 툴팁
-            status_config = {
-                "connected": ("🟢", "#4caf50", "연결됨"),
-                "disconnected": ("🔴", "#f44336", "연결 끊김"),
-                "reconnecting": ("🟡", "#ff9800", "재연결 중..."),
-            }
-
-            icon, color, text = status_config.get(status, ("⚫", "#888", "알 수 없음"))
+            icon, text, current_style = _CONNECTION_STATUS_STYLES.get(
+                status, _CONNECTION_STATUS_STYLES[""]
+            )
 
             # 레이턴시가 있으면 툴팁에 표시
             if latency is not None and status == "connected":
@@ -212,9 +218,6 @@ class MainWindowUIThemeStatusMixin(MainWindowHost):
             else:
                 tooltip = f"연결 상태: {text}"
 
-            current_style = (
-                f"background: transparent; border: none; font-size: 12px; color: {color};"
-            )
             if self.connection_indicator.text() != icon:
                 self.connection_indicator.setText(icon)
             if self.connection_indicator.toolTip() != tooltip:
@@ -230,7 +233,7 @@ class MainWindowUIThemeStatusMixin(MainWindowHost):
             font = self.subtitle_text.font()
             font.setPointSize(size)
             self.subtitle_text.setFont(font)
-            self._save_setting_value("font_size", size, context="글자 크기 설정 저장")
+            self._schedule_setting_value_save("font_size", size, context="글자 크기 설정 저장")
 
 
     def _adjust_font_size(self, delta: int):
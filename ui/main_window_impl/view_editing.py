@@ -60,8 +60,11 @@ class MainWindowViewEditingMixin(ViewEditingBase):
         *,
         reset: bool = False,
     ) -> None:
-        filtered_items = list(state.get("filtered_items", []))
-        rendered_items = list(state.get("rendered_items", []))
+        # 페이지를 더 불러올 때마다 전체 목록을 복사/재구성하지 않고 새 페이지만 한 번에 추가한다.
+        filtered_items = state.get("filtered_items") or []
+        rendered_items = state.get("rendered_items")
+        if rendered_items is None:
+            rendered_items = []
         page_size = int(
             state.get("page_size", Config.SUBTITLE_DIALOG_PAGE_SIZE)
             or Config.SUBTITLE_DIALOG_PAGE_SIZE
@@ -73,8 +76,8 @@ class MainWindowViewEditingMixin(ViewEditingBase):
 
         start = len(rendered_items)
         next_items = filtered_items[start : start + page_size]
-        for item in next_items:
-            list_widget.addItem(item.display_text)
+        if next_items:
+            list_widget.addItems([item.display_text for item in next_items])
         rendered_items.extend(next_items)
         state["rendered_items"] = rendered_items
 
@@ -285,6 +288,7 @@ class MainWindowViewEditingMixin(ViewEditingBase):
                             entry.update_text(new_text)
                             self._cached_total_chars += entry.char_count - old_chars
                             self._cached_total_words += entry.word_count - old_words
+                        self._mark_runtime_tail_dirty()
                         self._refresh_text(force_full=True)
                         self._update_count_label()
                         self._mark_session_dirty()
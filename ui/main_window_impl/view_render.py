@@ -21,6 +21,8 @@ UI_REFRESH_COUNT = 2
 UI_REFRESH_STATS = 4
 UI_REFRESH_STATUS = 8
 UI_REFRESH_SEARCH_COUNT = 16
+# 상태바(status_frame) 안의 라벨을 갱신하는 플래그
+UI_REFRESH_STATUS_BAR = UI_REFRESH_STATUS | UI_REFRESH_COUNT
 
 
 class MainWindowViewRenderMixin(ViewRenderBase):
@@ -73,11 +75,24 @@ class MainWindowViewRenderMixin(ViewRenderBase):
             return
         self._ui_refresh_scheduled = True
         try:
-            QTimer.singleShot(0, self._flush_scheduled_ui_refresh)
+            QTimer.singleShot(
+                self._get_ui_refresh_delay_ms(flags), self._flush_scheduled_ui_refresh
+            )
         except Exception:
             self._ui_refresh_scheduled = False
             return
 
+    def _get_ui_refresh_delay_ms(self, flags: int) -> int:
+        """직전 렌더링 직후의 일반 렌더 요청은 최소 간격까지 미뤄 한 번으로 병합한다."""
+        if not flags & UI_REFRESH_RENDER or self._pending_ui_refresh_force_full:
+            return 0
+        last_render_at = self.__dict__.get("_last_ui_render_at")
+        if last_render_at is None:
+            return 0
+        elapsed_ms = (time.perf_counter() - float(last_render_at)) * 1000.0
+        remaining_ms = int(Config.UI_RENDER_MIN_INTERVAL_MS - elapsed_ms)
+        return max(0, remaining_ms)
+
     def _flush_scheduled_ui_refresh(self) -> None:
         self._ensure_ui_refresh_state()
         flags = int(self.__dict__.get("_pending_ui_refresh_flags", 0) or 0)
@@ -87,20 +102,54 @@ class MainWindowViewRenderMixin(ViewRenderBase):
         self._pending_ui_refresh_force_full = False
         self._pending_search_count_index = None
         self._ui_refresh_scheduled = False
-        if flags & UI_REFRESH_STATUS:
-            self._set_status_now(
-                str(self.__dict__.get("_pending_status_text", "") or ""),
-                str(self.__dict__.get("_pending_status_type", "info") or "info"),
-            )
-        if flags & UI_REFRESH_COUNT:
-            self._update_count_label_now()
+        # 상태바 라벨 여러 개를 한 tick에 갱신할 때는 상태바를 한 번만 다시 그린다.
+        status_frame = (
+            self.__dict__.get("status_frame")
+            if flags & UI_REFRESH_STATUS_BAR == UI_REFRESH_STATUS_BAR
+            else None
+        )
+        if status_frame is not None:
+            status_frame.setUpdatesEnabled(False)
+        try:
+            if flags & UI_REFRESH_STATUS:
+                self._set_status_now(
+                    str(self.__dict__.get("_pending_status_text", "") or ""),
+                    str(self.__dict__.get("_pending_status_type", "info") or "info"),
+                )
+            if flags & UI_REFRESH_COUNT:
+                self._update_count_label_now()
+        finally:
+            if status_frame is not None:
+                status_frame.setUpdatesEnabled(True)
         if flags & UI_REFRESH_SEARCH_COUNT:
             self._update_search_count_label_now(search_index)
         if flags & UI_REFRESH_RENDER:
-            self._render_subtitles(force_full=force_full)
+            if self._is_subtitle_view_hidden():
+                # 보이지 않는 동안의 렌더는 건너뛰고, 다시 보일 때 전체 렌더 한 번으로 따라잡는다.
+                self._render_deferred_while_hidden = True
+            else:
+                self._last_ui_render_at = time.perf_counter()
+                self._render_subtitles(force_full=force_full)
         if flags & UI_REFRESH_STATS:
             self._update_stats_now()
 
+    def _is_subtitle_view_hidden(self) -> bool:
+        subtitle_text = self.__dict__.get("subtitle_text")
+        if subtitle_text is None:
+            return False
+        try:
+            return bool(self.isMinimized()) or not bool(subtitle_text.isVisible())
+        except Exception:
+            return False
+
+    def _resume_deferred_subtitle_render(self) -> None:
+        if not bool(self.__dict__.get("_render_deferred_while_hidden", False)):
+            return
+        if self._is_subtitle_view_hidden():
+            return
+        self._render_deferred_while_hidden = False
+        self._schedule_ui_refresh(render=True, force_full=True)
+
     def _schedule_status_update(self, text: str, status_type: str = "info") -> None:
         self._ensure_ui_refresh_state()
         self._pending_status_text = str(text or "")
@@ -116,14 +165,16 @@ class MainWindowViewRenderMixin(ViewRenderBase):
         if not hasattr(self, "preview_frame"):
             return
         content = (text or "").strip()
+        last_content = self.__dict__.get("_last_preview_text")
+        if last_content is None:
+            last_content = self.preview_label.text()
+        if content != last_content:
+            self.preview_label.setText(content)
+            self._last_preview_text = content
         if content:
-            if self.preview_label.text() != content:
-                self.preview_label.setText(content)
             if not self.preview_frame.isVisible():
                 self.preview_frame.show()
         else:
-            if self.preview_label.text():
-                self.preview_label.setText("")
             if self.preview_frame.isVisible():
                 self.preview_frame.hide()
 
@@ -158,7 +209,7 @@ class MainWindowViewRenderMixin(ViewRenderBase):
                 should_print = True
 
             if should_print:
-                prefix = f"[{entry.timestamp.strftime('%H:%M:%S')}] "
+                prefix = f"[{utils.format_hms(entry.timestamp)}] "
                 next_last_printed_ts = entry.timestamp
 
         return separator, prefix, next_last_printed_ts
@@ -187,10 +238,13 @@ class MainWindowViewRenderMixin(ViewRenderBase):
         if document is None:
             return False, None
 
-        start_pos = sum(
-            len(sep) + len(prefix) + len(chunk_text)
-            for sep, prefix, chunk_text in specs[:-1]
-        )
+        # 마지막 청크 시작 위치를 기억해 두어 tail 갱신이 전체 청크 길이 합산(O(N)) 없이 끝나게 한다.
+        start_pos = self.__dict__.get("_last_render_tail_start")
+        if start_pos is None:
+            start_pos = sum(
+                len(sep) + len(prefix) + len(chunk_text)
+                for sep, prefix, chunk_text in specs[:-1]
+            )
         cursor = self.subtitle_text.textCursor()
         cursor.setPosition(start_pos)
         cursor.setPosition(
@@ -222,7 +276,12 @@ class MainWindowViewRenderMixin(ViewRenderBase):
             start = min(max(entry_start, entry_start + int(char_start)), entry_end)
             end = min(max(start, start + int(char_length)), entry_end)
 
-        cursor = self.subtitle_text.textCursor()
+        # 검색 이동마다 새 커서를 만들지 않도록 문서에 묶인 커서를 재사용한다.
+        document = self.subtitle_text.document()
+        cursor = self.__dict__.get("_search_cursor")
+        if cursor is None or cursor.document() is not document:
+            cursor = QTextCursor(document)
+            self._search_cursor = cursor
         cursor.setPosition(start)
         cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
         self.subtitle_text.setTextCursor(cursor)
@@ -254,6 +313,14 @@ class MainWindowViewRenderMixin(ViewRenderBase):
         self._search_focus_entry_index = None
         self._pending_search_focus_query = ""
 
+    def _reset_subtitle_document(self) -> None:
+        """QTextEdit.clear() 대신 기존 문서를 비워 재사용한다 (undo 비활성 등 문서 설정 유지)."""
+        document = self.subtitle_text.document()
+        if document is None:
+            self.subtitle_text.clear()
+            return
+        document.clear()
+
     def _render_subtitles(self, force_full: bool = False) -> None:
         scrollbar = self.subtitle_text.verticalScrollBar()
         assert scrollbar is not None
@@ -328,28 +395,36 @@ class MainWindowViewRenderMixin(ViewRenderBase):
         )
 
         if needs_full_render:
-            self.subtitle_text.clear()
+            self._reset_subtitle_document()
             self._last_printed_ts = None
             cursor = self.subtitle_text.textCursor()
             chunk_specs: list[tuple[str, str, str]] = []
             text_spans: dict[int, tuple[int, int]] = {}
             last_printed_ts = None
-
-            for i, entry in enumerate(subtitles_copy):
-                prev_entry = subtitles_copy[i - 1] if i > 0 else None
-                separator, prefix, last_printed_ts = self._build_render_chunk(
-                    entry,
-                    prev_entry,
-                    show_ts,
-                    last_printed_ts,
-                )
-                span = self._insert_render_chunk(cursor, separator, prefix, entry.text)
-                chunk_specs.append((separator, prefix, entry.text))
-                text_spans[render_offset + i] = span
+            tail_start = None
+
+            # 전체 재구성은 편집 블록 하나로 묶어 문서 레이아웃을 삽입마다가 아니라 한 번만 갱신한다.
+            cursor.beginEditBlock()
+            try:
+                for i, entry in enumerate(subtitles_copy):
+                    prev_entry = subtitles_copy[i - 1] if i > 0 else None
+                    separator, prefix, last_printed_ts = self._build_render_chunk(
+                        entry,
+                        prev_entry,
+                        show_ts,
+                        last_printed_ts,
+                    )
+                    tail_start = cursor.position()
+                    span = self._insert_render_chunk(cursor, separator, prefix, entry.text)
+                    chunk_specs.append((separator, prefix, entry.text))
+                    text_spans[render_offset + i] = span
+            finally:
+                cursor.endEditBlock()
 
             self._last_printed_ts = last_printed_ts
             self._last_render_chunk_specs = chunk_specs
             self._rendered_entry_text_spans = text_spans
+            self._last_render_tail_start = tail_start
 
         elif tail_text_changed and visible_count == previous_visible_count and visible_count > 0:
             patched, span = self._patch_last_render_chunk(last_text)
@@ -357,16 +432,18 @@ class MainWindowViewRenderMixin(ViewRenderBase):
                 self._render_subtitles(force_full=True)
                 return
             if span is not None:
-                spans = dict(getattr(self, "_rendered_entry_text_spans", {}))
+                spans = getattr(self, "_rendered_entry_text_spans", {})
                 spans[render_offset + visible_count - 1] = span
                 self._rendered_entry_text_spans = spans
 
         else:
             cursor = self.subtitle_text.textCursor()
             cursor.movePosition(QTextCursor.MoveOperation.End)
-            chunk_specs = list(getattr(self, "_last_render_chunk_specs", []))
-            text_spans = dict(getattr(self, "_rendered_entry_text_spans", {}))
+            # append 경로는 기존 청크/스팬 컨테이너를 복사하지 않고 새 항목만 덧붙인다.
+            chunk_specs = getattr(self, "_last_render_chunk_specs", [])
+            text_spans = getattr(self, "_rendered_entry_text_spans", {})
             last_printed_ts = self._last_printed_ts
+            tail_start = self.__dict__.get("_last_render_tail_start")
 
             start_local_idx = min(previous_visible_count, visible_count)
             for local_idx in range(start_local_idx, visible_count):
@@ -378,17 +455,21 @@ class MainWindowViewRenderMixin(ViewRenderBase):
                     show_ts,
                     last_printed_ts,
                 )
+                tail_start = cursor.position()
                 span = self._insert_render_chunk(cursor, separator, prefix, entry.text)
                 chunk_specs.append((separator, prefix, entry.text))
                 text_spans[render_offset + local_idx] = span
 
             self._last_printed_ts = last_printed_ts
+            self._last_render_tail_start = tail_start
             self._last_render_chunk_specs = chunk_specs
-            self._rendered_entry_text_spans = {
-                idx: span
-                for idx, span in text_spans.items()
-                if render_offset <= idx < render_offset + visible_count
-            }
+            self._rendered_entry_text_spans = text_spans
+            if len(text_spans) > visible_count:
+                self._rendered_entry_text_spans = {
+                    idx: span
+                    for idx, span in text_spans.items()
+                    if render_offset <= idx < render_offset + visible_count
+                }
 
         self._last_rendered_count = total_count
         self._last_rendered_last_text = last_text
@@ -433,6 +514,8 @@ class MainWindowViewRenderMixin(ViewRenderBase):
             else:
                 self.toggle_stats_btn.setText("📊 통계 숨기기")
                 self.main_splitter.setSizes([860, 220])
+                # 숨겨져 있는 동안 건너뛴 통계를 다시 보일 때 한 번에 반영한다.
+                self._update_stats_now()
 
     def _refresh_text(self, force_full: bool = False) -> None:
         self._render_subtitles(force_full=force_full)
@@ -513,20 +596,33 @@ class MainWindowViewRenderMixin(ViewRenderBase):
             for name in ("stat_time", "stat_chars", "stat_words", "stat_sents", "stat_cpm")
         ):
             return
+        stats_group = self.__dict__.get("stats_group")
+        if stats_group is not None and stats_group.isHidden():
+            # 통계 패널이 접혀 있으면 라벨 갱신을 미룬다.
+            return
         if self.start_time:
             elapsed = int(time.time() - self.start_time)
-            h, r = divmod(elapsed, 3600)
-            m, s = divmod(r, 60)
-            self.stat_time.setText(f"⏱️ 실행 시간: {h:02d}:{m:02d}:{s:02d}")
-
             subtitle_count = self._get_global_subtitle_count()
             total_chars = self._get_global_total_chars()
             total_words = self._get_global_total_words()
+            cpm = int(total_chars / (elapsed / 60)) if elapsed > 0 else None
 
-            self.stat_chars.setText(f"📝 글자 수: {total_chars:,}")
-            self.stat_words.setText(f"📖 공백 기준 단어 수: {total_words:,}")
-            self.stat_sents.setText(f"💬 문장 수: {subtitle_count}")
-
-            if elapsed > 0:
-                cpm = int(total_chars / (elapsed / 60))
+            # 자막 배치마다 호출되므로 값이 바뀐 라벨만 setText 해 불필요한 repaint를 막는다.
+            values = (elapsed, total_chars, total_words, subtitle_count, cpm)
+            last_values = self.__dict__.get("_last_stats_values") or (None,) * 5
+            if values == last_values:
+                return
+            self._last_stats_values = values
+
+            if elapsed != last_values[0]:
+                h, r = divmod(elapsed, 3600)
+                m, s = divmod(r, 60)
+                self.stat_time.setText(f"⏱️ 실행 시간: {h:02d}:{m:02d}:{s:02d}")
+            if total_chars != last_values[1]:
+                self.stat_chars.setText(f"📝 글자 수: {total_chars:,}")
+            if total_words != last_values[2]:
+                self.stat_words.setText(f"📖 공백 기준 단어 수: {total_words:,}")
+            if subtitle_count != last_values[3]:
+                self.stat_sents.setText(f"💬 문장 수: {subtitle_count}")
+            if cpm is not None and cpm != last_values[4]:
                 self.stat_cpm.setText(f"⚡ 분당 글자: {cpm}")
@@ -65,6 +65,23 @@ class MainWindowViewSearchMixin(ViewSearchBase):
         self._runtime_search_cancel_event = cancel_event
         return cancel_event
 
+    def _get_tail_search_text_cache(self) -> dict[str, str]:
+        """tail 항목 검색용 소문자 정규화 텍스트 캐시 (원문 → 검색 텍스트).
+
+        줄넘김 정리 옵션이 바뀌면 정규화 결과가 달라지므로 캐시를 새로 만든다.
+        """
+        clean_newlines = self._is_auto_clean_newlines_enabled()
+        cache = self.__dict__.get("_tail_search_text_cache")
+        if (
+            not isinstance(cache, dict)
+            or self.__dict__.get("_tail_search_text_cache_mode") != clean_newlines
+            or len(cache) > Config.SEARCH_TEXT_CACHE_LIMIT
+        ):
+            cache = {}
+            self._tail_search_text_cache = cache
+            self._tail_search_text_cache_mode = clean_newlines
+        return cache
+
     def _search_full_session_entries(
         self,
         query: str,
@@ -123,10 +140,41 @@ class MainWindowViewSearchMixin(ViewSearchBase):
         else:
             tail_entries = list(subtitles)
         tail_start_index = int(self.__dict__.get("_runtime_archived_count", 0) or 0)
+        # 매 검색마다 tail 전체를 다시 정규화/소문자화하지 않도록 원문 기준으로 캐시한다.
+        search_text_cache = self._get_tail_search_text_cache()
+        # archive가 없을 때는 이어 입력한 검색어를 이전 결과 안에서만 다시 확인한다.
+        tail_only = not matches and not self.__dict__.get("_runtime_segment_manifest")
+        corpus_key = (
+            int(self.__dict__.get("_runtime_tail_revision", 0) or 0),
+            tail_start_index,
+            len(tail_entries),
+            id(subtitles),
+            self.__dict__.get("_tail_search_text_cache_mode"),
+        )
+        narrowed = (
+            self._narrow_previous_tail_search(
+                query_l,
+                len(query),
+                corpus_key,
+                tail_entries,
+                tail_start_index,
+                search_text_cache,
+            )
+            if tail_only
+            else None
+        )
+        self._last_tail_search_result = None
+        if narrowed is not None:
+            self._last_tail_search_result = (query_l, corpus_key, narrowed)
+            return narrowed, False, False
         for offset, entry in enumerate(tail_entries):
             if offset % 64 == 0 and cancelled():
                 return matches, False, True
-            lowered_text = self._normalize_subtitle_text_for_option(entry.text).lower()
+            raw_text = entry.text
+            lowered_text = search_text_cache.get(raw_text)
+            if lowered_text is None:
+                lowered_text = self._normalize_subtitle_text_for_option(raw_text).lower()
+                search_text_cache[raw_text] = lowered_text
             start = 0
             while True:
                 if cancelled():
@@ -140,8 +188,48 @@ class MainWindowViewSearchMixin(ViewSearchBase):
                 if len(matches) >= limit:
                     return matches, True, False
                 start = idx + 1
+        if tail_only:
+            self._last_tail_search_result = (query_l, corpus_key, list(matches))
         return matches, False, False
 
+    def _narrow_previous_tail_search(
+        self,
+        query_l: str,
+        query_length: int,
+        corpus_key: tuple[object, ...],
+        tail_entries: list[Any],
+        tail_start_index: int,
+        search_text_cache: dict[str, str],
+    ) -> list[SearchMatch] | None:
+        """이전 검색어를 이어 입력한 경우 이전 결과만 다시 확인한다.
+
+        새 검색어가 나타나는 위치는 모두 이전 검색어의 위치이기도 하므로, 문서가 그대로이고
+        이전 결과가 잘리지 않았다면 이전 결과를 걸러내는 것만으로 전체 검색과 같은 결과가 된다.
+        """
+        previous = self.__dict__.get("_last_tail_search_result")
+        if not previous:
+            return None
+        previous_query, previous_key, previous_matches = previous
+        if (
+            previous_key != corpus_key
+            or not previous_query
+            or len(query_l) <= len(previous_query)
+            or not query_l.startswith(previous_query)
+        ):
+            return None
+
+        narrowed: list[SearchMatch] = []
+        for match in previous_matches:
+            offset = match.entry_index - tail_start_index
+            if not (0 <= offset < len(tail_entries)):
+                return None
+            lowered_text = search_text_cache.get(tail_entries[offset].text)
+            if lowered_text is None:
+                return None
+            if lowered_text.startswith(query_l, match.char_start):
+                narrowed.append(SearchMatch(match.entry_index, match.char_start, query_length))
+        return narrowed
+
     def _handle_runtime_search_done(self, payload: dict[str, object]) -> None:
         if not isinstance(payload, dict):
             return
@@ -398,14 +486,20 @@ class MainWindowViewSearchMixin(ViewSearchBase):
             return
 
         match = self.search_matches[idx]
-        self._search_focus_entry_index = match.entry_index
-        self._refresh_text(force_full=True)
-        self._search_focus_entry_index = None
-        self._select_rendered_entry_span(
+        # 이미 렌더링된 항목이면 문서를 다시 만들지 않고 선택만 옮긴다.
+        if not self._select_rendered_entry_span(
             match.entry_index,
             match.char_start,
             match.char_length,
-        )
+        ):
+            self._search_focus_entry_index = match.entry_index
+            self._refresh_text(force_full=True)
+            self._search_focus_entry_index = None
+            self._select_rendered_entry_span(
+                match.entry_index,
+                match.char_start,
+                match.char_length,
+            )
 
         self._update_search_count_label(current_index=idx)
 
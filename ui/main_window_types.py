@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Pattern, TextIO
 
 from PyQt6.QtCore import QSettings, QTimer
-from PyQt6.QtGui import QAction, QTextCharFormat
+from PyQt6.QtGui import QAction, QTextCharFormat, QTextCursor
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -70,6 +70,8 @@ if TYPE_CHECKING:
         _last_render_show_ts: bool | None
         _last_render_chunk_specs: list[tuple[str, str, str]]
         _rendered_entry_text_spans: dict[int, tuple[int, int]]
+        _search_cursor: QTextCursor | None
+        _last_render_tail_start: int | None
         active_toasts: list[ToastWidget]
         realtime_file: TextIO | None
         _realtime_save_status: str
@@ -94,6 +96,10 @@ if TYPE_CHECKING:
         current_db_session_id: int | None
         is_dark_theme: bool
         _db_history_dialog_state: dict[str, Any] | None
+        _db_history_dialog_widgets: dict[str, Any] | None
+        _saved_setting_values: dict[str, object]
+        _pending_setting_values: dict[str, tuple[object, str]]
+        _setting_save_timer: QTimer
         _db_search_dialog_state: dict[str, Any] | None
         _active_background_threads: set[threading.Thread]
         _active_background_threads_lock: Any
@@ -137,14 +143,22 @@ if TYPE_CHECKING:
         _restoring_destructive_undo: bool
         _startup_recovery_prompted: bool
         _realtime_error_count: int
+        _realtime_flush_pending: bool
+        _realtime_last_flush_at: float
         _last_subtitle_frame_path: tuple[int, ...]
+        _observer_quiet_reliable: bool
         url_history: dict[str, str]
         committee_presets: dict[str, str]
+        _committee_tag_index: tuple[dict[str, str], dict[str, str]] | None
         custom_presets: dict[str, str]
         _runtime_sensitive_controls: list[QAction | QPushButton | QCheckBox]
         _pending_ui_refresh_flags: int
         _pending_ui_refresh_force_full: bool
         _ui_refresh_scheduled: bool
+        _last_ui_render_at: float | None
+        _render_deferred_while_hidden: bool
+        _last_preview_text: str | None
+        _last_stats_values: tuple[int, int, int, int, int | None] | None
         _use_async_ui_refresh: bool
         _pending_status_text: str
         _pending_status_type: str
@@ -173,6 +187,10 @@ if TYPE_CHECKING:
         _runtime_render_window_cache_key: tuple[int, int, int, int] | None
         _runtime_render_window_cache_entries: list[SubtitleEntry]
         _runtime_segment_search_text_cache: dict[str, list[str]]
+        _runtime_segment_search_text_cache_mode: bool | None
+        _tail_search_text_cache: dict[str, str]
+        _tail_search_text_cache_mode: bool | None
+        _last_tail_search_result: tuple[str, tuple[object, ...], list[SearchMatch]] | None
         _runtime_search_in_progress: bool
         _runtime_search_revision: int
         _runtime_search_query: str
@@ -205,6 +223,7 @@ if TYPE_CHECKING:
         subtitle_text: QTextEdit
         preview_frame: QFrame
         preview_label: QLabel
+        status_frame: QFrame
         status_label: QLabel
         realtime_status_label: QLabel
         db_status_label: QLabel
@@ -289,6 +308,9 @@ if TYPE_CHECKING:
             search_index: int | None = None,
         ) -> None: ...
         def _flush_scheduled_ui_refresh(self) -> None: ...
+        def _is_subtitle_view_hidden(self) -> bool: ...
+        def _reset_subtitle_document(self) -> None: ...
+        def _resume_deferred_subtitle_render(self) -> None: ...
         def _schedule_status_update(
             self, text: str, status_type: str = "info"
         ) -> None: ...
@@ -398,6 +420,7 @@ if TYPE_CHECKING:
         ) -> bool: ...
         def _block_session_replacement_while_saving(self, action_name: str) -> bool: ...
         def _cleanup_orphan_runtime_archives(self) -> None: ...
+        def _finish_deferred_startup(self) -> None: ...
         def _cleanup_runtime_session_archive(
             self, *, remove_files: bool = True
         ) -> None: ...
@@ -576,6 +599,14 @@ if TYPE_CHECKING:
             *,
             context: str = "설정 저장",
         ) -> bool: ...
+        def _schedule_setting_value_save(
+            self,
+            key: str,
+            value: object,
+            *,
+            context: str = "설정 저장",
+        ) -> None: ...
+        def _flush_pending_setting_values(self) -> None: ...
         def _save_rtf(self) -> None: ...
         def _save_session(self) -> None: ...
         def _handle_escape_shortcut(self) -> None: ...
@@ -109,6 +109,8 @@ class ToastWidget(QFrame):
         "warning": ("#d29922", "#241f12", "#9a6700", "#fff8e6"),
         "error": ("#f85149", "#241418", "#cf222e", "#fff0f0"),
     }
+    _ICONS = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}
+    _STYLESHEET_CACHE: dict[tuple[str, bool], str] = {}
 
     def __init__(self, parent, message: str, duration: int = 3000,
                  toast_type: str = "info", y_offset: int = 10, on_close=None,
@@ -123,8 +125,7 @@ class ToastWidget(QFrame):
         layout.setSpacing(10)
 
         # 아이콘 (개선된 이모지)
-        icons = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}
-        icon_label = QLabel(icons.get(self._toast_type, "ℹ️"))
+        icon_label = QLabel(self._ICONS.get(self._toast_type, "ℹ️"))
         icon_label.setObjectName("toastIcon")
         layout.addWidget(icon_label)
 
@@ -151,7 +152,17 @@ class ToastWidget(QFrame):
 
     def apply_theme(self, is_dark: bool) -> None:
         """현재 테마에 맞춰 토스트 색상을 갱신한다."""
-        accent, dark_bg, accent_light, light_bg = self._PALETTE[self._toast_type]
+        self.setStyleSheet(self._build_stylesheet(self._toast_type, is_dark))
+
+    @classmethod
+    def _build_stylesheet(cls, toast_type: str, is_dark: bool) -> str:
+        """(타입, 테마)별 QSS를 한 번만 만들어 토스트마다 재사용한다."""
+        cache_key = (toast_type, is_dark)
+        cached = cls._STYLESHEET_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        accent, dark_bg, accent_light, light_bg = cls._PALETTE[toast_type]
         if is_dark:
             bg_color = dark_bg
             accent_color = accent
@@ -161,7 +172,7 @@ class ToastWidget(QFrame):
             accent_color = accent_light
             text_color = "#24292f"
 
-        self.setStyleSheet(f"""
+        stylesheet = f"""
             QFrame#toastWidget {{
                 background-color: {bg_color};
                 border: 1px solid {accent_color};
@@ -183,7 +194,9 @@ class ToastWidget(QFrame):
                 color: {text_color};
                 padding-left: 8px;
             }}
-        """)
+        """
+        cls._STYLESHEET_CACHE[cache_key] = stylesheet
+        return stylesheet
     
     def _fade_out(self):
         """토스트 사라지기"""